@@ -22,9 +22,12 @@
 --    by exactly the same code path as real controller inputs — frame-perfect
 --    by definition since we run inside the game loop.
 --
---    The combo engine is a coroutine-based sequencer: each combo is a Lua
---    coroutine that yields after each input step, resuming on the next game
---    frame. This gives frame-accurate timing without any sleep calls.
+--    Combos are written as helper calls that yield once per game frame. Each
+--    one is run through once at load / character switch and compiled into
+--    flat per-frame ok_key / ok_trg arrays; playback in the frame hook is an
+--    index increment and two set_field writes — no coroutines, no lookups.
+--    The timelines normally come from sf6_combo_bot_data.lua, generated from
+--    the Python bot's combos; the Lua combos here are the fallback.
 --
 --  HOTKEYS (configurable in the UI):
 --    F1  BnB #1        F2  BnB #2
@@ -43,6 +46,14 @@
 -- ── Imports ──────────────────────────────────────────────────────────────────
 local json = json  -- bundled with REFramework
 
+-- Combo timelines generated from combo_bot.py (python combo_bot.py --export-lua).
+-- Optional: without it the hand-written Lua combos below are compiled instead.
+-- A file in an older format (e.g. exported before diagonals) is ignored.
+local DATA_FORMAT = 2
+local _data_ok, COMBO_DATA = pcall(require, "sf6_combo_bot_data")
+local _data_stale = _data_ok and type(COMBO_DATA) == "table" and COMBO_DATA._format ~= DATA_FORMAT
+if not _data_ok or type(COMBO_DATA) ~= "table" or _data_stale then COMBO_DATA = nil end
+
 -- ══════════════════════════════════════════════════════════════════════════════
 --  INPUT BIT FLAGS  (SF6 internal button bitfield — ok_trg / ok_key)
 -- ══════════════════════════════════════════════════════════════════════════════
@@ -103,9 +114,22 @@ local DIR = {
 -- ══════════════════════════════════════════════════════════════════════════════
 --  GAME STATE ACCESS
 -- ══════════════════════════════════════════════════════════════════════════════
+--
+--  Field handles (REField) are resolved once and reused: gBattle.Player and
+--  mcPlayer on first use, the player's own fields on first read. A battle
+--  scene builds new player objects, so a different P1 address — or no player
+--  at all — drops the player handles and they resolve again on the next read.
+--
+--  The state is read exactly once per frame, by refresh_state() at the top of
+--  the frame hook, into the single STATE table. The combo engine, the UI panel
+--  and the telemetry export all read that table; none of them call the game.
 
-local _gbattle_type = nil
-local _player_obj   = nil   -- cached P1 player object
+local _gbattle_type  = nil
+local _player_field  = nil   -- gBattle.Player (static)
+local _mcplayer_field = nil  -- sPlayer.mcPlayer
+local _player_obj    = nil   -- P1 player object as of this frame's refresh_state() (nil if none)
+local _player_addr   = nil   -- its address; a change means a new scene
+local _pfields       = {}    -- field name → REField on the player type (false = missing)
 
 local function get_gbattle()
     if not _gbattle_type then
@@ -114,52 +138,100 @@ local function get_gbattle()
     return _gbattle_type
 end
 
--- Returns the P1 player managed object, or nil if not in a battle scene.
-local function get_player(idx)
-    idx = idx or 0
-    local ok, result = pcall(function()
-        local gb   = get_gbattle()
+local function lookup_player(idx)
+    if not _player_field then
+        local gb = get_gbattle()
         if not gb then return nil end
-        local sPlayer = gb:get_field("Player"):get_data(nil)
-        if not sPlayer then return nil end
-        local mcPlayer = sPlayer:get_field("mcPlayer")
-        if not mcPlayer then return nil end
-        return mcPlayer[idx]
-    end)
-    return ok and result or nil
+        _player_field = gb:get_field("Player")
+    end
+    local sPlayer = _player_field:get_data(nil)
+    if not sPlayer then return nil end
+    if not _mcplayer_field then
+        _mcplayer_field = sPlayer:get_type_definition():get_field("mcPlayer")
+    end
+    local mcPlayer = _mcplayer_field:get_data(sPlayer)
+    if not mcPlayer then return nil end
+    return mcPlayer[idx]
 end
 
--- Safe field reader — returns default on any error
-local function rfield(obj, field, default)
-    if not obj then return default end
-    local ok, v = pcall(function() return obj:get_field(field) end)
-    return (ok and v ~= nil) and v or default
+-- Returns the player managed object (P1 by default), or nil if not in a battle scene.
+local function get_player(idx)
+    local ok, result = pcall(lookup_player, idx or 0)
+    return ok and result or nil
 end
 
 -- Safe field writer
 local function wfield(obj, field, value)
     if not obj then return false end
-    local ok = pcall(function() obj:set_field(field, value) end)
+    local ok = pcall(obj.set_field, obj, field, value)
     return ok
 end
 
--- Read current game state data for P1
-local function read_battle_state()
+-- Per-character resource counters exported as `res` (keyed by chara_id).
+-- Verify the name with the Field Inspector after a game update.
+local RES_FIELD = {
+    [15] = "fuha_stock",   -- Juri: stored Fuha charges (★ routes)
+}
+
+-- Shared per-frame snapshot of P1 (refilled in place, never reallocated)
+local STATE = {
+    valid      = false,
+    frame      = 0,      -- refresh_state() calls so far
+    act_id     = -1,     -- current action/animation ID
+    act_frame  = -1,     -- frame within current action
+    hp         = -1,
+    drive      = -1,     -- drive gauge value
+    super_lvl  = 0,      -- super art level (0-3)
+    hitstop    = 0,
+    combo      = 0,
+    chara_id   = -1,     -- character ID for auto-detect
+    res        = 0,      -- stock / resource
+}
+
+-- Field value through its cached handle, or `default`
+local function pfield(p1, name, default)
+    local f = _pfields[name]
+    if f == nil then
+        f = p1:get_type_definition():get_field(name) or false
+        _pfields[name] = f
+    end
+    if not f then return default end
+    local v = f:get_data(p1)
+    if v == nil then return default end
+    return v
+end
+
+local function fill_state(p1)
+    local S = STATE
+    S.act_id    = pfield(p1, "act_id", -1)
+    S.act_frame = pfield(p1, "act_frame", -1)
+    S.hp        = pfield(p1, "hp", -1)
+    S.drive     = pfield(p1, "drive_val", -1)
+    S.super_lvl = pfield(p1, "sa_gauge_lv", 0)
+    S.hitstop   = pfield(p1, "hitstop", 0)
+    S.combo     = pfield(p1, "combo_cnt", 0)
+    S.chara_id  = pfield(p1, "chara_id", -1)
+    local res_field = RES_FIELD[S.chara_id]
+    S.res       = res_field and pfield(p1, res_field, 0) or 0
+end
+
+-- Read P1 once for this frame into STATE (call from the frame hook only)
+local function refresh_state()
+    local S = STATE
+    S.frame = S.frame + 1
     local p1 = get_player(0)
-    if not p1 then
-        return { valid = false }
+    if p1 then
+        local addr = p1:get_address()
+        if addr ~= _player_addr then          -- new scene → new player object
+            _player_addr, _pfields = addr, {}
+        end
+        S.valid = pcall(fill_state, p1)
+    else
+        _player_addr, _pfields = nil, {}
+        S.valid = false
     end
-    return {
-        valid      = true,
-        act_id     = rfield(p1, "act_id", -1),       -- current action/animation ID
-        act_frame  = rfield(p1, "act_frame", -1),     -- frame within current action
-        hp         = rfield(p1, "hp", -1),
-        drive      = rfield(p1, "drive_val", -1),     -- drive gauge value
-        super_lvl  = rfield(p1, "sa_gauge_lv", 0),   -- super art level (0-3)
-        hitstop    = rfield(p1, "hitstop", 0),
-        combo      = rfield(p1, "combo_cnt", 0),
-        chara_id   = rfield(p1, "chara_id", -1),     -- character ID for auto-detect
-    }
+    _player_obj = p1                        -- for input writes, even if a read failed
+    return S
 end
 
 -- ══════════════════════════════════════════════════════════════════════════════
@@ -182,7 +254,7 @@ end
 local _pending_key   = 0   -- buttons/directions to hold
 local _pending_trg   = 0   -- buttons that are newly pressed this frame
 
--- Called once per frame from re.on_application_entry to flush pending inputs
+-- Write the pending state straight to P1 (used on script reset to release)
 local function flush_inputs(p1)
     if not p1 then return end
     wfield(p1, "ok_key", _pending_key)
@@ -202,39 +274,29 @@ local function clear_input()
 end
 
 -- ══════════════════════════════════════════════════════════════════════════════
---  COROUTINE COMBO ENGINE
+--  COMBO COMPILER
 -- ══════════════════════════════════════════════════════════════════════════════
 --
 --  Each combo is a Lua function that uses the helpers below.
---  Calling wait_frames(n) yields the coroutine n times — one yield per game frame.
---  The main frame hook resumes the coroutine each frame while one is running.
+--  Calling wait_frames(n) yields n times — one yield per game frame.
+--  compile_combo() runs the function to completion once, in a coroutine that
+--  never touches the game, and keeps what flush_inputs would have written on
+--  each frame:
 --
---  This means timing is expressed in actual game frames, not wall-clock time.
---  Hitstop is handled by pausing frame-count advancement while p1.hitstop > 0.
-
-local _combo_coro    = nil   -- active coroutine, or nil
-local _cancel_flag   = false -- set true to abort
+--    { key = {ok_key per frame}, trg = {ok_trg per frame}, n = frame count }
+--
+--  The last frame is always a full release. Timing is in game frames, exactly
+--  as the coroutine would have played live, but paid for once per character
+--  instead of on every frame of the match.
 
--- Yield for n game frames (hitstop-aware)
+-- Yield for n game frames
 local function wait_frames(n)
-    for _ = 1, n do
-        if _cancel_flag then coroutine.yield("cancel") end
-        coroutine.yield("frame")
-    end
-end
-
--- Wait out any current hitstop before continuing
-local function wait_hitstop()
-    while true do
-        local state = read_battle_state()
-        if not state.valid or state.hitstop <= 0 then break end
-        if _cancel_flag then coroutine.yield("cancel") end
-        coroutine.yield("hitstop")
-    end
+    for _ = 1, n do coroutine.yield() end
 end
 
 -- Press buttons for n frames (direction = numpad string like "2", "6", "23")
 local function press(buttons_bits, frames, direction)
+    frames = frames or 3
     local dir_bits = direction and (DIR[direction] or 0) or 0
     local combined = buttons_bits | dir_bits
     -- First frame: set both key and trigger
@@ -331,6 +393,25 @@ local function charge(dir_str, frames)
     hold_dir(dir_str, frames or 10)
 end
 
+-- Combo function → { key = {...}, trg = {...}, n = frames }
+local function compile_combo(fn)
+    local key, trg, n = {}, {}, 0
+    local co = coroutine.create(fn)
+    clear_input()
+    repeat
+        local ok, err = coroutine.resume(co)
+        if not ok then clear_input(); error(err, 0) end
+        n = n + 1
+        if coroutine.status(co) == "dead" then
+            key[n], trg[n] = 0, 0              -- final frame: release everything
+        else
+            key[n], trg[n] = _pending_key, _pending_trg
+            _pending_trg = 0                   -- ok_trg only lasts one frame
+        end
+    until coroutine.status(co) == "dead"
+    return { key = key, trg = trg, n = n }
+end
+
 -- ══════════════════════════════════════════════════════════════════════════════
 --  CHARACTER ID → NAME MAP
 --  (Numeric IDs from gBattle.Player[0].chara_id field)
@@ -1133,6 +1214,11 @@ local _active_combo     = nil -- label of currently running combo (for UI)
 local _log_lines        = {}  -- circular log buffer
 local _log_max          = 50
 
+-- Playback cursor over the compiled arrays (nil key table = idle)
+local _play_key, _play_trg = nil, nil
+local _play_i, _play_n     = 0, 0
+local RELEASE              = { 0 }     -- one all-clear frame, played on cancel
+
 local function log(msg)
     table.insert(_log_lines, string.format("[%s] %s", os.date("%H:%M:%S"), msg))
     if #_log_lines > _log_max then table.remove(_log_lines, 1) end
@@ -1142,13 +1228,50 @@ local function get_current_char()
     return CHAR_ORDER[_current_char_idx]
 end
 
+-- Generated change lists → the same { key, trg, n } compile_combo() returns
+local function expand_data(d)
+    local key, trg = {}, {}
+    local j, k = 1, 0
+    for i = 1, d.n do
+        if d.at[j] == i then
+            k, trg[i] = d.key[j], d.trg[j]
+            j = j + 1
+        else
+            trg[i] = 0
+        end
+        key[i] = k
+    end
+    return { key = key, trg = trg, n = d.n }
+end
+
+-- Compile every combo of `char` that isn't compiled yet; generated data wins
+local function prepare_char(char)
+    local data = COMBO_DATA and COMBO_DATA[char] or {}
+    for _, c in ipairs(COMBOS[char] or {}) do
+        if not c.compiled then
+            local d = data[c.slot]
+            if d then
+                c.compiled, c.label = expand_data(d), d.label
+            else
+                local ok, res = pcall(compile_combo, c.fn)
+                if ok then c.compiled = res else log("✗ Compile " .. c.label .. ": " .. tostring(res)) end
+            end
+        end
+    end
+end
+
+local function select_char(idx, msg)
+    _current_char_idx = idx
+    prepare_char(CHAR_ORDER[idx])
+    log(msg .. get_current_char())
+end
+
 local function cycle_char(dir)
-    _current_char_idx = ((_current_char_idx - 1 + dir) % #CHAR_ORDER) + 1
-    log("Character → " .. get_current_char())
+    select_char(((_current_char_idx - 1 + dir) % #CHAR_ORDER) + 1, "Character → ")
 end
 
 local function fire_combo(slot_or_adv)
-    if _combo_coro and coroutine.status(_combo_coro) ~= "dead" then
+    if _play_key and _active_combo then
         log("Combo already running — press F9 to cancel")
         return
     end
@@ -1179,25 +1302,20 @@ local function fire_combo(slot_or_adv)
         return
     end
 
-    _cancel_flag  = false
+    prepare_char(char)
+    local tl = entry.compiled
+    if not tl then return end
+
     _active_combo = entry.label
     log("▶ [" .. char .. "] " .. entry.label)
-
-    -- Wrap the combo function in a coroutine
-    _combo_coro = coroutine.create(function()
-        entry.fn()
-        clear_input()
-        _active_combo = nil
-        log("✓ Complete")
-    end)
+    _play_key, _play_trg, _play_i, _play_n = tl.key, tl.trg, 0, tl.n
 end
 
 local function cancel_combo_fn()
-    _cancel_flag = true
     clear_input()
-    _active_combo = nil
-    if _combo_coro then
-        _combo_coro = nil
+    if _active_combo then
+        _active_combo = nil
+        _play_key, _play_trg, _play_i, _play_n = RELEASE, RELEASE, 0, 1
         log("⊘ Cancelled")
     end
 end
@@ -1216,35 +1334,139 @@ local VK = {
 }
 
 -- ══════════════════════════════════════════════════════════════════════════════
---  PER-FRAME HOOK  —  flush inputs + tick combo coroutine
+--  TELEMETRY EXPORT  —  per-frame state → shared file read by combo_bot.py
 -- ══════════════════════════════════════════════════════════════════════════════
+--  A fixed-size ring file in reframework/data/. The Python TelemetryReader
+--  memory-maps it; every record carries its sequence number at both ends so
+--  the reader can spot a half-written record without any locking.
+--
+--    header  "SF6T"  u16 version  u16 record_size  u32 slots  u32 head_seq
+--    record  u32 seq  u32 frame  u8 valid  i8 super_lvl  i8 chara_id  i8 res
+--            i32 act_id  i32 act_frame  i32 hp  i32 drive  i16 hitstop
+--            i16 combo  u32 seq_end
+
+local TELEM_FILE    = "sf6_combo_bot_telemetry.bin"
+local TELEM_SLOTS   = 64
+local TELEM_HDR_FMT = "<c4I2I2I4I4"
+local TELEM_VERSION = 2
+local TELEM_REC_FMT = "<I4I4Bbbbi4i4i4i4i2i2I4"
+local TELEM_HDR_SZ  = string.packsize(TELEM_HDR_FMT)
+local TELEM_REC_SZ  = string.packsize(TELEM_REC_FMT)
+local TELEM_HEAD_AT = 12              -- byte offset of head_seq in the header
+
+local _telem_enabled = true
+local _telem_fh      = nil
+local _telem_seq     = 0
+local _telem_frame   = 0
+
+local function telem_open()
+    -- Reuse an existing file in place: Windows refuses to truncate a file
+    -- that the Python side still has memory-mapped.
+    local fh = io.open(TELEM_FILE, "r+b") or io.open(TELEM_FILE, "w+b")
+    if not fh then return nil end
+    fh:seek("set", 0)
+    fh:write(string.pack(TELEM_HDR_FMT, "SF6T", TELEM_VERSION, TELEM_REC_SZ, TELEM_SLOTS, 0))
+    fh:write(string.rep("\0", TELEM_REC_SZ * TELEM_SLOTS))
+    fh:flush()
+    return fh
+end
+
+-- Clamp to a signed integer range (string.pack errors on overflow)
+local function ival(v, lo, hi)
+    v = math.floor(tonumber(v) or -1)
+    if v < lo then return lo elseif v > hi then return hi end
+    return v
+end
+
+local function telemetry_write(state)
+    if not _telem_fh then
+        _telem_fh = telem_open()
+        if not _telem_fh then
+            _telem_enabled = false
+            log("✗ Telemetry file could not be opened — export disabled")
+            return
+        end
+    end
+    _telem_frame = _telem_frame + 1
+    _telem_seq   = _telem_seq + 1
+    local seq, I4, I2 = _telem_seq, 0x7FFFFFFF, 0x7FFF
+    local rec
+    if state.valid then
+        rec = string.pack(TELEM_REC_FMT, seq, _telem_frame, 1,
+            ival(state.super_lvl, -128, 127), ival(state.chara_id, -128, 127),
+            ival(state.res, -128, 127),
+            ival(state.act_id, -I4, I4), ival(state.act_frame, -I4, I4),
+            ival(state.hp, -I4, I4), ival(state.drive, -I4, I4),
+            ival(state.hitstop, -I2, I2), ival(state.combo, -I2, I2), seq)
+    else
+        rec = string.pack(TELEM_REC_FMT, seq, _telem_frame, 0, 0, -1, 0, -1, -1, -1, -1, 0, 0, seq)
+    end
+    local fh = _telem_fh
+    fh:seek("set", TELEM_HDR_SZ + (seq % TELEM_SLOTS) * TELEM_REC_SZ)
+    fh:write(rec)
+    fh:seek("set", TELEM_HEAD_AT)     -- record reaches the file before the head moves
+    fh:write(string.pack("<I4", seq))
+    fh:flush()
+end
 
-re.on_application_entry("UpdateBehavior", function()
-    local p1 = get_player(0)
+local function telemetry_close()
+    if _telem_fh then _telem_fh:close(); _telem_fh = nil end
+end
+
+-- ══════════════════════════════════════════════════════════════════════════════
+--  PER-FRAME HOOK  —  snapshot state, play one compiled frame, telemetry
+-- ══════════════════════════════════════════════════════════════════════════════
+--  Only writes while a combo (or a cancel's release frame) is playing, so the
+--  real controller is left alone the rest of the time.
 
-    -- Tick the active combo coroutine
-    if _combo_coro and coroutine.status(_combo_coro) ~= "dead" then
-        local ok, result = coroutine.resume(_combo_coro)
-        if not ok then
-            log("✗ Combo error: " .. tostring(result))
-            _combo_coro = nil
-            _active_combo = nil
-            clear_input()
-        elseif result == "cancel" or _cancel_flag then
-            _combo_coro = nil
-            _active_combo = nil
-            clear_input()
+re.on_application_entry("UpdateBehavior", function()
+    local state = refresh_state()
+    if _play_key then
+        local i = _play_i + 1
+        _play_i = i
+        local p1 = _player_obj
+        if not (p1 and wfield(p1, "ok_key", _play_key[i]) and wfield(p1, "ok_trg", _play_trg[i])) then
+            -- no P1, or a stale object (round reset, scene change): stop rather than
+            -- run the timeline on without sending it
+            _play_key, _play_trg = nil, nil
+            if _active_combo then
+                _active_combo = nil
+                log(p1 and "✗ Input write failed — combo stopped" or "✗ P1 not found — combo stopped")
+            end
+        elseif i >= _play_n then
+            _play_key = nil
+            if _active_combo then
+                _active_combo = nil
+                log("✓ Complete")
+            end
         end
     end
 
-    -- Write pending inputs to P1's input register
-    flush_inputs(p1)
+    if _telem_enabled then telemetry_write(state) end
 end)
 
 -- ══════════════════════════════════════════════════════════════════════════════
 --  IMGUI PANEL  (visible via Insert → Script Generated UI → SF6 Combo Bot)
 -- ══════════════════════════════════════════════════════════════════════════════
 
+-- Formatted state lines, rebuilt only when the values shown in them change
+local _ui = { line1 = "", line2 = "" }
+
+local function state_lines(S)
+    local c = _ui
+    if S.hp ~= c.hp or S.drive ~= c.drive or S.super_lvl ~= c.super_lvl
+            or S.hitstop ~= c.hitstop or S.combo ~= c.combo then
+        c.hp, c.drive, c.super_lvl, c.hitstop, c.combo = S.hp, S.drive, S.super_lvl, S.hitstop, S.combo
+        c.line1 = string.format("HP:%d  Drive:%.0f  SuperLv:%d  Hitstop:%d  Combo:x%d",
+            S.hp, (S.drive or 0), S.super_lvl, S.hitstop, S.combo)
+    end
+    if S.act_id ~= c.act_id or S.act_frame ~= c.act_frame then
+        c.act_id, c.act_frame = S.act_id, S.act_frame
+        c.line2 = string.format("ActionID:%d  Frame:%d", S.act_id, S.act_frame)
+    end
+    return c.line1, c.line2
+end
+
 
 re.on_draw_ui(function()
     -- Hotkeys polled every frame the REFramework overlay is open
@@ -1264,7 +1486,7 @@ re.on_draw_ui(function()
     if not imgui.tree_node("SF6 Combo Bot") then return end
 
     local char  = get_current_char()
-    local state = read_battle_state()
+    local state = STATE            -- this frame's snapshot, read by the frame hook
 
     -- Status
     imgui.text("v1.0  |  REFramework Edition")
@@ -1278,10 +1500,9 @@ re.on_draw_ui(function()
 
     -- Battle state
     if state.valid then
-        imgui.text(string.format(
-            "HP:%d  Drive:%.0f  SuperLv:%d  Hitstop:%d  Combo:x%d",
-            state.hp, (state.drive or 0), state.super_lvl, state.hitstop, state.combo))
-        imgui.text(string.format("ActionID:%d  Frame:%d", state.act_id, state.act_frame))
+        local gauges, action = state_lines(state)
+        imgui.text(gauges)
+        imgui.text(action)
         local detected = CHARA_ID_MAP[state.chara_id]
         if detected then
             imgui.text_disabled("Detected: " .. detected)
@@ -1289,7 +1510,7 @@ re.on_draw_ui(function()
                 imgui.same_line()
                 if imgui.button("Switch##autosel") then
                     for i, name in ipairs(CHAR_ORDER) do
-                        if name == detected then _current_char_idx = i; log("Auto: "..detected); break end
+                        if name == detected then select_char(i, "Auto: "); break end
                     end
                 end
             end
@@ -1311,8 +1532,7 @@ re.on_draw_ui(function()
         if (idx - 1) % 5 ~= 0 then imgui.same_line() end
         local lbl = (name == char) and ("["..name.."]") or name
         if imgui.button(lbl.."##c"..idx) then
-            _current_char_idx = idx
-            log("Switched to "..name)
+            select_char(idx, "Switched to ")
         end
     end
 
@@ -1362,6 +1582,16 @@ re.on_draw_ui(function()
         imgui.tree_pop()
     end
 
+    if imgui.tree_node("Telemetry") then
+        local changed, v = imgui.checkbox("Export per-frame state to Python", _telem_enabled)
+        if changed then
+            _telem_enabled = v
+            if not v then telemetry_close() end
+        end
+        imgui.text_disabled(string.format("reframework/data/%s  seq %d", TELEM_FILE, _telem_seq))
+        imgui.tree_pop()
+    end
+
     if imgui.tree_node("Log") then
         local s = math.max(1, #_log_lines - 14)
         for i = s, #_log_lines do imgui.text_disabled(_log_lines[i]) end
@@ -1377,6 +1607,7 @@ re.on_draw_ui(function()
                 "hp","mCurrentHP","hitstop","hit_stop",
                 "drive_val","mDriveGauge","combo_cnt","mComboCount",
                 "chara_id","mCharaID","sa_gauge_lv","super_lv",
+                "fuha_stock","mFuhaStock",
             }
             for _, fname in ipairs(candidates) do
                 local ok, v = pcall(function() return p1:get_field(fname) end)
@@ -1404,10 +1635,15 @@ re.on_script_reset(function()
     -- Flush zeroed inputs one last time
     local p1 = get_player(0)
     if p1 then flush_inputs(p1) end
+    telemetry_close()
     log("Script reset — inputs cleared.")
 end)
 
--- Startup log
+-- Startup: compile the first character now, the rest on first selection
+prepare_char(get_current_char())
+log(COMBO_DATA and "Combo data: sf6_combo_bot_data.lua (generated from combo_bot.py)"
+    or _data_stale and "Combo data: built-in Lua combos (sf6_combo_bot_data.lua is stale, re-run --export-lua)"
+    or "Combo data: built-in Lua combos (sf6_combo_bot_data.lua not found)")
 log("SF6 Combo Bot loaded. " .. #CHAR_ORDER .. " characters, " ..
     (function()
         local n = 0
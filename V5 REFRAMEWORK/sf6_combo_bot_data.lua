@@ -0,0 +1,343 @@
+-- Generated by combo_bot.py --export-lua from the Python combo definitions.
+-- Do not edit: change the combo in combo_bot.py and regenerate.
+return {
+    _format = 2,
+    ["Akuma"] = {
+        ["F1"] = { label = "BnB #1 — cr.MP > cr.MP xx HP Goshoryuken", n = 26,
+            at  = {1, 3, 6, 11, 13, 16, 17, 19, 21, 23, 26},
+            key = {128, 130, 0, 128, 130, 128, 512, 128, 640, 644, 0},
+            trg = {128, 2, 0, 128, 2, 0, 512, 128, 512, 4, 0} },
+        ["F2"] = { label = "BnB #2 — cr.LK > cr.LP > cr.MP xx Gohadouken", n = 32,
+            at  = {1, 3, 5, 9, 11, 13, 17, 19, 22, 25, 27, 29, 32},
+            key = {128, 136, 0, 128, 129, 0, 128, 130, 128, 640, 512, 516, 0},
+            trg = {128, 8, 0, 128, 1, 0, 128, 2, 0, 512, 0, 4, 0} },
+        ["F3"] = { label = "Punish #1 — st.HP xx HP Goshoryuken", n = 17,
+            at  = {2, 6, 8, 10, 12, 14, 17},
+            key = {4, 0, 512, 128, 640, 644, 0},
+            trg = {4, 0, 512, 128, 512, 4, 0} },
+        ["F4"] = { label = "Punish #2 — OD Goshoryuken > juggle HP DP", n = 48,
+            at  = {1, 3, 6, 12, 16, 18, 20, 22, 24, 27, 39, 41, 43, 45, 48},
+            key = {128, 130, 0, 4, 0, 512, 128, 640, 645, 0, 512, 128, 640, 644, 0},
+            trg = {128, 2, 0, 4, 0, 512, 128, 512, 5, 0, 512, 128, 512, 4, 0} },
+        ["F5"] = { label = "Super — cr.MP > cr.HP xx Messatsu-Goshoryuken Lv1", n = 33,
+            at  = {1, 3, 6, 10, 12, 16, 20, 22, 24, 26, 28, 30, 33},
+            key = {128, 130, 0, 128, 132, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {128, 2, 0, 128, 4, 0, 512, 0, 128, 512, 0, 4, 0} },
+        ["ADV"] = { label = "ADV — Low starter > OD Tatsumaki > HP DP", n = 67,
+            at  = {1, 3, 5, 9, 11, 13, 17, 19, 22, 28, 32, 34, 36, 38, 40, 43, 58, 60, 62, 64, 67},
+            key = {128, 136, 0, 128, 129, 0, 128, 130, 0, 4, 0, 128, 384, 256, 304, 256, 512, 128, 640, 644, 0},
+            trg = {128, 8, 0, 128, 1, 0, 128, 2, 0, 4, 0, 128, 256, 0, 48, 0, 512, 128, 512, 4, 0} },
+    },
+    ["Chun-Li"] = {
+        ["F1"] = { label = "BnB #1 — cr.MK xx Spinning Bird Kick (charge)", n = 46,
+            at  = {1, 36, 38, 41, 43, 46},
+            key = {256, 384, 400, 512, 544, 0},
+            trg = {256, 128, 16, 512, 32, 0} },
+        ["F2"] = { label = "BnB #2 — cr.LP > cr.LP > cr.MK xx Kikoken", n = 32,
+            at  = {1, 3, 5, 9, 11, 13, 17, 19, 22, 25, 27, 29, 32},
+            key = {128, 129, 0, 128, 129, 0, 128, 144, 128, 640, 512, 516, 0},
+            trg = {128, 1, 0, 128, 1, 0, 128, 16, 0, 512, 0, 4, 0} },
+        ["F3"] = { label = "Punish #1 — st.MP > st.HP xx Hyakuretsukyaku", n = 36,
+            at  = {2, 5, 11, 15, 16, 18, 20, 22, 23, 25, 27, 29, 30, 32, 34, 36},
+            key = {2, 0, 4, 0, 32, 0, 32, 0, 32, 0, 32, 0, 32, 0, 32, 0},
+            trg = {2, 0, 4, 0, 32, 0, 32, 0, 32, 0, 32, 0, 32, 0, 32, 0} },
+        ["F4"] = { label = "Punish #2 — OD SBK > juggle HP", n = 65,
+            at  = {1, 20, 22, 25, 31, 35, 41, 43, 46, 61, 62, 65},
+            key = {256, 384, 386, 256, 260, 256, 512, 560, 512, 0, 4, 0},
+            trg = {256, 128, 2, 0, 4, 0, 512, 48, 0, 0, 4, 0} },
+        ["F5"] = { label = "Super — cr.MP > cr.HP xx Kikosho Lv1", n = 33,
+            at  = {1, 3, 6, 11, 13, 17, 20, 22, 24, 26, 28, 30, 33},
+            key = {128, 130, 0, 128, 132, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {128, 2, 0, 128, 4, 0, 512, 0, 128, 512, 0, 4, 0} },
+        ["ADV"] = { label = "ADV — Low > OD SBK > Hazan Shu xx Hoyokusen Lv2", n = 96,
+            at  = {1, 14, 16, 18, 22, 24, 26, 30, 32, 35, 36, 41, 43, 46, 58, 64, 66, 69, 81, 83, 85, 87, 89, 91, 93, 96},
+            key = {256, 384, 385, 256, 384, 385, 256, 384, 400, 384, 256, 512, 560, 512, 128, 64, 96, 0, 128, 640, 512, 128, 640, 512, 544, 0},
+            trg = {256, 128, 1, 0, 128, 1, 0, 128, 16, 0, 0, 512, 48, 0, 128, 64, 32, 0, 128, 512, 0, 128, 512, 0, 32, 0} },
+    },
+    ["Mai"] = {
+        ["F1"] = { label = "BnB #1 — cr.LK > cr.LP > st.MP xx Kachousen", n = 32,
+            at  = {1, 3, 5, 9, 11, 13, 18, 21, 23, 25, 27, 29, 32},
+            key = {128, 136, 0, 128, 129, 0, 2, 0, 128, 640, 512, 516, 0},
+            trg = {128, 8, 0, 128, 1, 0, 2, 0, 128, 512, 0, 4, 0} },
+        ["F2"] = { label = "BnB #2 — st.MP > st.HP xx Ryuuenbu", n = 25,
+            at  = {2, 5, 11, 15, 16, 18, 20, 22, 25},
+            key = {2, 0, 4, 0, 128, 384, 256, 288, 0},
+            trg = {2, 0, 4, 0, 128, 256, 0, 32, 0} },
+        ["F3"] = { label = "Punish #1 — cr.MP > st.HP xx Kachousen", n = 26,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 26},
+            key = {128, 130, 0, 4, 0, 128, 640, 512, 516, 0},
+            trg = {128, 2, 0, 4, 0, 128, 512, 0, 4, 0} },
+        ["F4"] = { label = "Punish #2 — OD Ryuuenbu > HP > Kachousen", n = 54,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 26, 38, 39, 43, 45, 47, 49, 51, 54},
+            key = {128, 130, 0, 4, 0, 128, 384, 256, 304, 256, 0, 4, 0, 128, 640, 512, 516, 0},
+            trg = {128, 2, 0, 4, 0, 128, 256, 0, 48, 0, 0, 4, 0, 128, 512, 0, 4, 0} },
+        ["F5"] = { label = "Super — cr.MP > st.HP xx Hissatsu Shinobibachi Lv1", n = 32,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 25, 27, 29, 32},
+            key = {128, 130, 0, 4, 0, 128, 640, 512, 128, 640, 512, 544, 0},
+            trg = {128, 2, 0, 4, 0, 128, 512, 0, 128, 512, 0, 32, 0} },
+        ["ADV"] = { label = "ADV — Low > OD Ryuuenbu > HP xx Sen'en Ryuuenbu Lv2", n = 75,
+            at  = {1, 3, 5, 9, 11, 13, 18, 21, 27, 31, 33, 35, 37, 39, 42, 54, 55, 59, 60, 62, 64, 66, 68, 70, 72, 75},
+            key = {128, 136, 0, 128, 129, 0, 2, 0, 4, 0, 128, 384, 256, 304, 256, 0, 4, 0, 128, 384, 256, 128, 384, 256, 288, 0},
+            trg = {128, 8, 0, 128, 1, 0, 2, 0, 4, 0, 128, 256, 0, 48, 0, 0, 4, 0, 128, 256, 0, 128, 256, 0, 32, 0} },
+    },
+    ["Ken"] = {
+        ["F1"] = { label = "BnB #1 — cr.MK xx Hadouken", n = 16,
+            at  = {1, 3, 6, 9, 11, 13, 16},
+            key = {128, 144, 128, 640, 512, 516, 0},
+            trg = {128, 16, 0, 512, 0, 4, 0} },
+        ["F2"] = { label = "BnB #2 — cr.LP > cr.LP > cr.MK xx Jinrai Kick", n = 32,
+            at  = {1, 3, 5, 9, 11, 13, 17, 19, 22, 25, 27, 29, 32},
+            key = {128, 129, 0, 128, 129, 0, 128, 144, 128, 640, 512, 528, 0},
+            trg = {128, 1, 0, 128, 1, 0, 128, 16, 0, 512, 0, 16, 0} },
+        ["F3"] = { label = "Punish #1 — st.MP > st.HP xx HP Shoryuken", n = 25,
+            at  = {2, 5, 11, 15, 16, 18, 20, 22, 25},
+            key = {2, 0, 4, 0, 512, 128, 640, 644, 0},
+            trg = {2, 0, 4, 0, 512, 128, 512, 4, 0} },
+        ["F4"] = { label = "Punish #2 — OD Shoryuken > Tatsumaki juggle", n = 51,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 26, 42, 44, 46, 48, 51},
+            key = {128, 130, 0, 4, 0, 512, 128, 640, 645, 640, 128, 384, 256, 288, 0},
+            trg = {128, 2, 0, 4, 0, 512, 128, 512, 5, 0, 0, 256, 0, 32, 0} },
+        ["F5"] = { label = "Super — cr.MK xx Shinryuken Lv1", n = 22,
+            at  = {1, 3, 6, 9, 11, 13, 15, 17, 19, 22},
+            key = {128, 144, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {128, 16, 0, 512, 0, 128, 512, 0, 4, 0} },
+        ["ADV"] = { label = "ADV — OD DP > Jinrai chain xx Shinryuken Lv1", n = 81,
+            at  = {2, 5, 11, 15, 16, 18, 20, 22, 25, 40, 42, 44, 46, 49, 54, 57, 62, 65, 66, 68, 70, 72, 74, 76, 78, 81},
+            key = {2, 0, 4, 0, 512, 128, 640, 645, 640, 128, 640, 512, 528, 512, 528, 512, 516, 512, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {2, 0, 4, 0, 512, 128, 512, 5, 0, 0, 512, 0, 16, 0, 16, 0, 4, 0, 128, 512, 0, 128, 512, 0, 4, 0} },
+    },
+    ["Juri"] = {
+        ["F1"] = { label = "BnB #1 — cr.MK > st.HP xx Fuha LP ★stock", n = 26,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 26},
+            key = {128, 144, 0, 4, 0, 128, 640, 512, 513, 0},
+            trg = {128, 16, 0, 4, 0, 128, 512, 0, 1, 0} },
+        ["F2"] = { label = "BnB #2 — cr.LP > cr.LP > cr.MK xx Shiku-sen", n = 33,
+            at  = {1, 3, 5, 9, 11, 13, 17, 19, 22, 26, 28, 30, 33},
+            key = {128, 129, 0, 128, 129, 0, 128, 144, 128, 640, 512, 528, 0},
+            trg = {128, 1, 0, 128, 1, 0, 128, 16, 0, 512, 0, 16, 0} },
+        ["F3"] = { label = "Punish #1 — st.HP xx Fuha HP ★stock", n = 17,
+            at  = {2, 6, 8, 10, 12, 14, 17},
+            key = {4, 0, 128, 640, 512, 516, 0},
+            trg = {4, 0, 128, 512, 0, 4, 0} },
+        ["F4"] = { label = "Punish #2 — OD Shiku-sen > cr.HP > Fuha", n = 54,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 26, 38, 40, 44, 47, 49, 51, 54},
+            key = {128, 130, 0, 4, 0, 128, 640, 512, 560, 512, 128, 132, 128, 640, 512, 513, 0},
+            trg = {128, 2, 0, 4, 0, 128, 512, 0, 48, 0, 128, 4, 0, 512, 0, 1, 0} },
+        ["F5"] = { label = "Super — cr.MK > st.HP xx Feng Shui Engine Lv1", n = 32,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 25, 27, 29, 32},
+            key = {128, 144, 0, 4, 0, 128, 384, 256, 128, 384, 256, 264, 0},
+            trg = {128, 16, 0, 4, 0, 128, 256, 0, 128, 256, 0, 8, 0} },
+        ["ADV"] = { label = "ADV — Low > OD Shiku > cr.HP > Fuha xx FSE Lv3 ★stock", n = 86,
+            at  = {1, 3, 5, 9, 11, 14, 20, 24, 25, 27, 29, 31, 34, 46, 48, 52, 55, 57, 59, 62, 71, 73, 75, 77, 79, 81, 83, 86},
+            key = {128, 129, 0, 128, 144, 0, 4, 0, 128, 640, 512, 560, 512, 128, 132, 128, 640, 512, 516, 512, 128, 384, 256, 128, 384, 256, 288, 0},
+            trg = {128, 1, 0, 128, 16, 0, 4, 0, 128, 512, 0, 48, 0, 128, 4, 0, 512, 0, 4, 0, 128, 256, 0, 128, 256, 0, 32, 0} },
+    },
+    ["Cammy"] = {
+        ["F1"] = { label = "BnB #1 — cr.LK > cr.LP > cr.MK xx Spiral Arrow", n = 32,
+            at  = {1, 3, 5, 9, 11, 13, 17, 19, 22, 25, 27, 29, 32},
+            key = {128, 136, 0, 128, 129, 0, 128, 144, 128, 640, 512, 528, 0},
+            trg = {128, 8, 0, 128, 1, 0, 128, 16, 0, 512, 0, 16, 0} },
+        ["F2"] = { label = "BnB #2 — st.MP > st.MP > cr.MK xx Spiral Arrow HK", n = 33,
+            at  = {2, 5, 10, 13, 17, 19, 22, 26, 28, 30, 33},
+            key = {2, 0, 2, 0, 128, 144, 128, 640, 512, 544, 0},
+            trg = {2, 0, 2, 0, 128, 16, 0, 512, 0, 32, 0} },
+        ["F3"] = { label = "Punish #1 — st.HP xx Cannon Spike", n = 17,
+            at  = {2, 6, 8, 10, 12, 14, 17},
+            key = {4, 0, 512, 128, 640, 672, 0},
+            trg = {4, 0, 512, 128, 512, 32, 0} },
+        ["F4"] = { label = "Punish #2 — OD Spiral Arrow > Cannon Spike", n = 48,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 26, 41, 43, 45, 48},
+            key = {128, 130, 0, 4, 0, 128, 640, 512, 560, 512, 128, 640, 672, 0},
+            trg = {128, 2, 0, 4, 0, 128, 512, 0, 48, 0, 128, 512, 32, 0} },
+        ["F5"] = { label = "Super — cr.MK xx Spin Drive Smasher Lv1", n = 22,
+            at  = {1, 3, 6, 9, 11, 13, 15, 17, 19, 22},
+            key = {128, 144, 128, 640, 512, 128, 640, 512, 544, 0},
+            trg = {128, 16, 0, 512, 0, 128, 512, 0, 32, 0} },
+        ["ADV"] = { label = "ADV — Long chain > OD Spike > QSK xx Delta Red Lv2", n = 89,
+            at  = {1, 3, 5, 9, 11, 13, 18, 21, 26, 29, 34, 36, 40, 41, 43, 45, 47, 50, 63, 65, 67, 69, 72, 74, 76, 78, 80, 82, 84, 86, 89},
+            key = {128, 129, 0, 128, 129, 0, 2, 0, 2, 0, 128, 132, 128, 512, 128, 640, 680, 640, 128, 640, 512, 516, 512, 128, 640, 512, 128, 640, 512, 513, 0},
+            trg = {128, 1, 0, 128, 1, 0, 2, 0, 2, 0, 128, 4, 0, 512, 128, 512, 40, 0, 0, 512, 0, 4, 0, 128, 512, 0, 128, 512, 0, 1, 0} },
+    },
+    ["Ryu"] = {
+        ["F1"] = { label = "BnB #1 — cr.MK xx Hadouken", n = 16,
+            at  = {1, 3, 6, 9, 11, 13, 16},
+            key = {128, 144, 128, 640, 512, 516, 0},
+            trg = {128, 16, 0, 512, 0, 4, 0} },
+        ["F2"] = { label = "BnB #2 — cr.LP > cr.LP > cr.MK xx Hashogeki", n = 32,
+            at  = {1, 3, 5, 9, 11, 13, 17, 19, 22, 25, 27, 29, 32},
+            key = {128, 129, 0, 128, 129, 0, 128, 144, 128, 640, 512, 516, 0},
+            trg = {128, 1, 0, 128, 1, 0, 128, 16, 0, 512, 0, 4, 0} },
+        ["F3"] = { label = "Punish #1 — st.HP xx HP Shoryuken", n = 17,
+            at  = {2, 6, 8, 10, 12, 14, 17},
+            key = {4, 0, 512, 128, 640, 644, 0},
+            trg = {4, 0, 512, 128, 512, 4, 0} },
+        ["F4"] = { label = "Punish #2 — OD Shoryuken > Tatsumaki juggle", n = 51,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 26, 42, 44, 46, 48, 51},
+            key = {128, 130, 0, 4, 0, 512, 128, 640, 645, 640, 128, 384, 256, 288, 0},
+            trg = {128, 2, 0, 4, 0, 512, 128, 512, 5, 0, 0, 256, 0, 32, 0} },
+        ["F5"] = { label = "Super — cr.MK xx Shin Hashogeki Lv1", n = 22,
+            at  = {1, 3, 6, 9, 11, 13, 15, 17, 19, 22},
+            key = {128, 144, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {128, 16, 0, 512, 0, 128, 512, 0, 4, 0} },
+        ["ADV"] = { label = "ADV — OD DP > Tatsumaki xx Shin Shoryuken Lv3 (hold)", n = 85,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 26, 42, 44, 46, 48, 51, 53, 55, 57, 59, 61, 63, 65, 85},
+            key = {128, 130, 0, 4, 0, 512, 128, 640, 645, 640, 128, 384, 256, 288, 256, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {128, 2, 0, 4, 0, 512, 128, 512, 5, 0, 0, 256, 0, 32, 0, 128, 512, 0, 128, 512, 0, 4, 0} },
+    },
+    ["Ed"] = {
+        ["F1"] = { label = "BnB #1 — cr.LP > cr.LP > st.MP xx Psycho Blitz", n = 46,
+            at  = {1, 17, 18, 20, 23, 25, 27, 31, 34, 41, 43, 46},
+            key = {256, 384, 385, 384, 385, 384, 256, 258, 256, 512, 528, 0},
+            trg = {256, 128, 1, 0, 1, 0, 0, 2, 0, 512, 16, 0} },
+        ["F2"] = { label = "BnB #2 — cr.MK xx Flicker > Psycho Spark", n = 31,
+            at  = {1, 3, 6, 9, 11, 13, 16, 21, 26, 28, 31},
+            key = {128, 144, 128, 640, 512, 513, 512, 256, 512, 516, 0},
+            trg = {128, 16, 0, 512, 0, 1, 0, 256, 512, 4, 0} },
+        ["F3"] = { label = "Punish #1 — st.HP xx Psycho Upper", n = 19,
+            at  = {2, 6, 8, 14, 16, 19},
+            key = {4, 0, 128, 64, 68, 0},
+            trg = {4, 0, 128, 64, 4, 0} },
+        ["F4"] = { label = "Punish #2 — OD Psycho Upper > Psycho Blitz", n = 52,
+            at  = {1, 3, 6, 12, 16, 17, 23, 25, 28, 42, 47, 49, 52},
+            key = {128, 130, 0, 4, 0, 128, 64, 69, 64, 256, 512, 544, 0},
+            trg = {128, 2, 0, 4, 0, 128, 64, 5, 0, 256, 512, 32, 0} },
+        ["F5"] = { label = "Super — cr.MK xx Psycho Cannon Barrage Lv1", n = 22,
+            at  = {1, 3, 6, 9, 11, 13, 15, 17, 19, 22},
+            key = {128, 144, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {128, 16, 0, 512, 0, 128, 512, 0, 4, 0} },
+        ["ADV"] = { label = "ADV — Low > Blitz > Spark xx Cannon Barrage Lv1", n = 79,
+            at  = {1, 17, 18, 20, 23, 25, 27, 31, 34, 41, 43, 46, 50, 55, 57, 60, 64, 66, 68, 70, 72, 74, 76, 79},
+            key = {256, 384, 385, 384, 385, 384, 256, 258, 256, 512, 528, 512, 256, 512, 516, 512, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {256, 128, 1, 0, 1, 0, 0, 2, 0, 512, 16, 0, 256, 512, 4, 0, 128, 512, 0, 128, 512, 0, 4, 0} },
+    },
+    ["JP"] = {
+        ["F1"] = { label = "BnB #1 — st.MP > st.HP xx Amnesia Surge", n = 25,
+            at  = {2, 5, 10, 14, 16, 18, 20, 22, 25},
+            key = {2, 0, 4, 0, 128, 640, 512, 516, 0},
+            trg = {2, 0, 4, 0, 128, 512, 0, 4, 0} },
+        ["F2"] = { label = "BnB #2 — cr.LP > cr.MP xx Surge > Departure", n = 42,
+            at  = {1, 3, 5, 9, 11, 14, 17, 19, 21, 24, 35, 37, 39, 42},
+            key = {128, 129, 0, 128, 130, 128, 640, 512, 514, 512, 128, 640, 672, 0},
+            trg = {128, 1, 0, 128, 2, 0, 512, 0, 2, 0, 128, 512, 32, 0} },
+        ["F3"] = { label = "Punish #1 — st.HP xx Surge > Departure", n = 33,
+            at  = {2, 6, 8, 10, 12, 14, 17, 26, 28, 30, 33},
+            key = {4, 0, 128, 640, 512, 516, 512, 128, 640, 656, 0},
+            trg = {4, 0, 128, 512, 0, 4, 0, 128, 512, 16, 0} },
+        ["F4"] = { label = "Punish #2 — OD Surge > Departure juggle", n = 47,
+            at  = {2, 5, 10, 14, 16, 18, 20, 22, 25, 40, 42, 44, 47},
+            key = {2, 0, 4, 0, 128, 640, 512, 517, 512, 128, 640, 672, 0},
+            trg = {2, 0, 4, 0, 128, 512, 0, 5, 0, 128, 512, 32, 0} },
+        ["F5"] = { label = "Super — st.HP xx Interdiction Lv1", n = 23,
+            at  = {2, 6, 8, 10, 12, 14, 16, 18, 20, 23},
+            key = {4, 0, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {4, 0, 128, 512, 0, 128, 512, 0, 4, 0} },
+        ["ADV"] = { label = "ADV — OD Surge > Departure > Surge xx Interdiction", n = 84,
+            at  = {2, 5, 10, 14, 16, 18, 20, 22, 25, 40, 42, 44, 47, 57, 59, 61, 63, 66, 69, 71, 73, 75, 77, 79, 81, 84},
+            key = {2, 0, 4, 0, 128, 640, 512, 517, 512, 128, 640, 672, 640, 128, 640, 512, 516, 512, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {2, 0, 4, 0, 128, 512, 0, 5, 0, 128, 512, 32, 0, 0, 512, 0, 4, 0, 128, 512, 0, 128, 512, 0, 4, 0} },
+    },
+    ["Marisa"] = {
+        ["F1"] = { label = "BnB #1 — cr.MP > st.HP xx Gladius", n = 27,
+            at  = {1, 3, 6, 12, 16, 18, 20, 22, 24, 27},
+            key = {128, 130, 0, 4, 0, 128, 640, 512, 516, 0},
+            trg = {128, 2, 0, 4, 0, 128, 512, 0, 4, 0} },
+        ["F2"] = { label = "BnB #2 — cr.LK > cr.LP > cr.MP xx Gladius", n = 33,
+            at  = {1, 3, 5, 9, 11, 13, 18, 20, 23, 26, 28, 30, 33},
+            key = {128, 136, 0, 128, 129, 0, 128, 130, 128, 640, 512, 514, 0},
+            trg = {128, 8, 0, 128, 1, 0, 128, 2, 0, 512, 0, 2, 0} },
+        ["F3"] = { label = "Punish #1 — st.HP xx Dimachaerus", n = 18,
+            at  = {2, 7, 9, 11, 13, 15, 18},
+            key = {4, 0, 512, 128, 640, 644, 0},
+            trg = {4, 0, 512, 128, 512, 4, 0} },
+        ["F4"] = { label = "Punish #2 — OD Dimachaerus > Gladius juggle", n = 50,
+            at  = {1, 3, 6, 12, 16, 18, 20, 22, 24, 27, 41, 43, 45, 47, 50},
+            key = {128, 130, 0, 4, 0, 512, 128, 640, 645, 640, 128, 640, 512, 516, 0},
+            trg = {128, 2, 0, 4, 0, 512, 128, 512, 5, 0, 0, 512, 0, 4, 0} },
+        ["F5"] = { label = "Super — st.HP xx Aether Lv1", n = 24,
+            at  = {2, 7, 9, 11, 13, 15, 17, 19, 21, 24},
+            key = {4, 0, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {4, 0, 128, 512, 0, 128, 512, 0, 4, 0} },
+        ["ADV"] = { label = "ADV — Low > OD DP > Gladius xx Goddess Lv3 (hold)", n = 90,
+            at  = {1, 3, 5, 9, 11, 14, 20, 24, 26, 28, 30, 32, 35, 49, 51, 53, 55, 58, 60, 62, 64, 66, 68, 70, 72, 90},
+            key = {128, 129, 0, 128, 130, 0, 4, 0, 512, 128, 640, 645, 640, 128, 640, 512, 516, 512, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {128, 1, 0, 128, 2, 0, 4, 0, 512, 128, 512, 5, 0, 0, 512, 0, 4, 0, 128, 512, 0, 128, 512, 0, 4, 0} },
+    },
+    ["Luke"] = {
+        ["F1"] = { label = "BnB #1 — cr.MK xx Flash Knuckle (charge)", n = 46,
+            at  = {1, 30, 32, 35, 36, 41, 43, 46},
+            key = {256, 384, 400, 384, 256, 512, 514, 0},
+            trg = {256, 128, 16, 0, 0, 512, 2, 0} },
+        ["F2"] = { label = "BnB #2 — cr.LP > cr.LP > cr.MK xx Sand Blast", n = 32,
+            at  = {1, 3, 5, 9, 11, 13, 17, 19, 22, 25, 27, 29, 32},
+            key = {128, 129, 0, 128, 129, 0, 128, 144, 128, 640, 512, 516, 0},
+            trg = {128, 1, 0, 128, 1, 0, 128, 16, 0, 512, 0, 4, 0} },
+        ["F3"] = { label = "Punish #1 — st.HP xx Rising Uppercut", n = 17,
+            at  = {2, 6, 8, 10, 12, 14, 17},
+            key = {4, 0, 512, 128, 640, 644, 0},
+            trg = {4, 0, 512, 128, 512, 4, 0} },
+        ["F4"] = { label = "Punish #2 — OD Rising Uppercut > Flash Knuckle", n = 51,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 26, 41, 46, 48, 51},
+            key = {128, 130, 0, 4, 0, 512, 128, 640, 645, 640, 256, 512, 516, 0},
+            trg = {128, 2, 0, 4, 0, 512, 128, 512, 5, 0, 256, 512, 4, 0} },
+        ["F5"] = { label = "Super — cr.MK xx Vulcan Blast Lv1", n = 22,
+            at  = {1, 3, 6, 9, 11, 13, 15, 17, 19, 22},
+            key = {128, 144, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {128, 16, 0, 512, 0, 128, 512, 0, 4, 0} },
+        ["ADV"] = { label = "ADV — Low > OD Knuckle > Uppercut xx Vulcan Blast", n = 85,
+            at  = {1, 13, 15, 17, 21, 23, 25, 29, 31, 34, 35, 41, 43, 46, 61, 63, 65, 68, 70, 72, 74, 76, 78, 80, 82, 85},
+            key = {256, 384, 385, 256, 384, 385, 256, 384, 400, 384, 256, 512, 515, 512, 128, 640, 644, 640, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {256, 128, 1, 0, 128, 1, 0, 128, 16, 0, 0, 512, 3, 0, 128, 512, 4, 0, 0, 512, 0, 128, 512, 0, 4, 0} },
+    },
+    ["Aki"] = {
+        ["F1"] = { label = "BnB #1 — cr.LP > cr.MP xx Cruel Fate (poison)", n = 25,
+            at  = {1, 3, 5, 9, 11, 14, 18, 20, 22, 25},
+            key = {128, 129, 0, 128, 130, 128, 640, 512, 516, 0},
+            trg = {128, 1, 0, 128, 2, 0, 512, 0, 4, 0} },
+        ["F2"] = { label = "BnB #2 — st.MP > st.HP xx Sinister Slide", n = 25,
+            at  = {2, 5, 11, 15, 16, 18, 20, 22, 25},
+            key = {2, 0, 4, 0, 128, 640, 512, 528, 0},
+            trg = {2, 0, 4, 0, 128, 512, 0, 16, 0} },
+        ["F3"] = { label = "Punish #1 — cr.MP > st.HP xx Cruel Fate > Cobra", n = 43,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 26, 34, 36, 38, 40, 43},
+            key = {128, 130, 0, 4, 0, 128, 640, 512, 516, 512, 128, 384, 256, 260, 0},
+            trg = {128, 2, 0, 4, 0, 128, 512, 0, 4, 0, 128, 256, 0, 4, 0} },
+        ["F4"] = { label = "Punish #2 — OD Cruel Fate > HP > Clinging Cobra", n = 54,
+            at  = {1, 3, 6, 12, 16, 17, 19, 21, 23, 26, 39, 40, 44, 45, 47, 49, 51, 54},
+            key = {128, 130, 0, 4, 0, 128, 640, 512, 517, 512, 0, 4, 0, 128, 384, 256, 260, 0},
+            trg = {128, 2, 0, 4, 0, 128, 512, 0, 5, 0, 0, 4, 0, 128, 256, 0, 4, 0} },
+        ["F5"] = { label = "Super — st.HP xx Coronation Lv1", n = 23,
+            at  = {2, 6, 8, 10, 12, 14, 16, 18, 20, 23},
+            key = {4, 0, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {4, 0, 128, 512, 0, 128, 512, 0, 4, 0} },
+        ["ADV"] = { label = "ADV — Poison > Cobra > OD Slide > HP xx Coronation", n = 88,
+            at  = {1, 3, 5, 9, 11, 14, 18, 20, 22, 25, 31, 33, 35, 37, 40, 46, 48, 50, 52, 55, 67, 68, 72, 73, 75, 77, 79, 81, 83, 85, 88},
+            key = {128, 129, 0, 128, 130, 128, 640, 512, 516, 512, 128, 384, 256, 260, 256, 128, 640, 512, 529, 512, 0, 4, 0, 128, 640, 512, 128, 640, 512, 516, 0},
+            trg = {128, 1, 0, 128, 2, 0, 512, 0, 4, 0, 128, 256, 0, 4, 0, 128, 512, 0, 17, 0, 0, 4, 0, 128, 512, 0, 128, 512, 0, 4, 0} },
+    },
+    ["M. Bison"] = {
+        ["F1"] = { label = "BnB #1 — cr.MK xx Scissors Kick MK (charge)", n = 46,
+            at  = {1, 32, 34, 37, 41, 43, 46},
+            key = {256, 384, 400, 256, 512, 528, 0},
+            trg = {256, 128, 16, 0, 512, 16, 0} },
+        ["F2"] = { label = "BnB #2 — cr.LP > cr.MK xx Psycho Crusher HP", n = 46,
+            at  = {1, 22, 23, 25, 28, 30, 34, 37, 41, 43, 46},
+            key = {256, 384, 385, 384, 385, 384, 400, 256, 512, 516, 0},
+            trg = {256, 128, 1, 0, 1, 0, 16, 0, 512, 4, 0} },
+        ["F3"] = { label = "Punish #1 — st.HP xx Scissors HK (charge)", n = 46,
+            at  = {1, 31, 35, 41, 43, 46},
+            key = {256, 260, 256, 512, 544, 0},
+            trg = {256, 4, 0, 512, 32, 0} },
+        ["F4"] = { label = "Punish #2 — OD Scissors > Psycho Crusher", n = 69,
+            at  = {1, 19, 21, 24, 30, 34, 41, 43, 46, 59, 64, 66, 69},
+            key = {256, 384, 386, 256, 260, 256, 512, 560, 512, 256, 512, 516, 0},
+            trg = {256, 128, 2, 0, 4, 0, 512, 48, 0, 256, 512, 4, 0} },
+        ["F5"] = { label = "Super — cr.MK xx Knee Press Nightmare Lv1", n = 22,
+            at  = {1, 3, 6, 9, 11, 13, 15, 17, 19, 22},
+            key = {128, 144, 128, 640, 512, 128, 640, 512, 544, 0},
+            trg = {128, 16, 0, 512, 0, 128, 512, 0, 32, 0} },
+        ["ADV"] = { label = "ADV — Low > OD Scissors > Scissors > Crusher xx KPN", n = 108,
+            at  = {1, 26, 27, 29, 33, 36, 41, 43, 46, 59, 64, 66, 69, 79, 84, 86, 89, 93, 95, 97, 99, 101, 103, 105, 108},
+            key = {256, 384, 385, 384, 400, 256, 512, 560, 512, 256, 512, 544, 512, 256, 512, 516, 512, 128, 640, 512, 128, 640, 512, 544, 0},
+            trg = {256, 128, 1, 0, 16, 0, 512, 48, 0, 256, 512, 32, 0, 256, 512, 4, 0, 128, 512, 0, 128, 512, 0, 32, 0} },
+    },
+}
@@ -28,44 +28,253 @@ IMPROVEMENTS vs v3:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 
-import vgamepad as vg
-import keyboard
 import time
+_T0 = time.perf_counter()        # reference point for --profile-startup
 import threading
-import tkinter as tk
-from tkinter import ttk
 import sys
+import os
+import argparse
+import array
+import atexit
+import itertools
+import mmap
+import json
+import random
+import struct
+import heapq
+import bisect
+import re
+import queue
+import socket
+import socketserver
+import stat
+import tempfile
+from collections import namedtuple, deque
+
+# Heavy or side-effecting modules load on first use so the hotkeys go live
+# before any of them: vgamepad in init_gamepad(), keyboard in
+# register_hotkeys(), tkinter in make_app(), NumPy in _numpy().
+vg = keyboard = tk = ttk = np = None
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  VIRTUAL GAMEPAD
 # ══════════════════════════════════════════════════════════════════════════════
 
 gamepad = None
+_pads   = [None, None]             # live pads: [0] = P1 bot, [1] = training dummy
 _cancel_flag = threading.Event()   # set this to abort a running combo mid-way
 
+# "vigem" (vgamepad → ViGEmBus, Windows) or "uinput" (Linux kernel uinput).
+PAD_BACKEND = os.environ.get("SF6_PAD", "vigem" if sys.platform == "win32" else "uinput")
+UINPUT_PATH = os.environ.get("SF6_UINPUT", "/dev/uinput")
+
+def _new_pad(slot: int = 0):
+    if PAD_BACKEND == "uinput":
+        path = UINPUT_PATH
+        if slot and not (os.path.exists(path) and stat.S_ISCHR(os.stat(path).st_mode)):
+            path = f"{path}.{slot + 1}"        # fake device: one file per pad, or the two would interleave
+        return UInputGamepad(path)
+    return vg.VX360Gamepad()
+
 def init_gamepad():
-    global gamepad
+    global gamepad, vg
     try:
-        gamepad = vg.VX360Gamepad()
+        if PAD_BACKEND != "uinput":
+            import vgamepad as vg
+        gamepad = _pads[0] = _new_pad()
         gamepad.update()
         return True
     except Exception as e:
         print(f"[ERROR] Could not init virtual gamepad: {e}")
         return False
 
+def init_dummy_pad():
+    """Plug in the second virtual pad used by training mode (P2 dummy)."""
+    if _pads[1] is not None:
+        return True
+    try:
+        _pads[1] = _new_pad(1)
+        _pads[1].update()
+        return True
+    except Exception as e:
+        print(f"[ERROR] Could not init dummy gamepad: {e}")
+        return False
+
+# ── Linux uinput backend ──────────────────────────────────────────────────────
+# UInputGamepad has the VX360Gamepad surface the bot uses (press/release,
+# sticks, triggers, .report, update()) and shows up as an Xbox 360 pad
+# (045e:028e, xpad button/axis layout). update() diffs the report against the
+# last one sent and writes every changed key and axis plus one SYN_REPORT in a
+# single write(), so the game never sees half a frame. Each write() is timed
+# into write_times.
+#
+# A path that isn't a character device (a plain file) is a fake device: the
+# setup block and event stream are written to it exactly as to /dev/uinput,
+# minus the ioctls, and read_uinput_events() decodes it back.
+
+_INPUT_EVENT   = struct.Struct("llHHi")          # struct input_event (timeval, type, code, value)
+_UINPUT_DEV    = struct.Struct("80sHHHHI" + "i" * 256)   # legacy struct uinput_user_dev
+EV_SYN, EV_KEY, EV_ABS = 0x00, 0x01, 0x03
+UI_SET_EVBIT, UI_SET_KEYBIT, UI_SET_ABSBIT = 0x40045564, 0x40045565, 0x40045567
+UI_DEV_CREATE, UI_DEV_DESTROY = 0x5501, 0x5502
+ABS_X, ABS_Y, ABS_Z, ABS_RX, ABS_RY, ABS_RZ, ABS_HAT0X, ABS_HAT0Y = 0, 1, 2, 3, 4, 5, 0x10, 0x11
+
+# XUSB button bit → evdev key code (as the xpad driver reports them)
+_UINPUT_KEYS = {
+    0x1000: 0x130,   # A  → BTN_SOUTH
+    0x2000: 0x131,   # B  → BTN_EAST
+    0x4000: 0x133,   # X  → BTN_NORTH
+    0x8000: 0x134,   # Y  → BTN_WEST
+    0x0100: 0x136,   # LB → BTN_TL
+    0x0200: 0x137,   # RB → BTN_TR
+    0x0020: 0x13a,   # BACK  → BTN_SELECT
+    0x0010: 0x13b,   # START → BTN_START
+    0x0400: 0x13c,   # GUIDE → BTN_MODE
+    0x0040: 0x13d,   # LS → BTN_THUMBL
+    0x0080: 0x13e,   # RS → BTN_THUMBR
+}
+_UINPUT_STICK = (-32768, 32767)
+_UINPUT_AXES = {     # code: (min, max)
+    ABS_X: _UINPUT_STICK, ABS_Y: _UINPUT_STICK, ABS_RX: _UINPUT_STICK, ABS_RY: _UINPUT_STICK,
+    ABS_Z: (0, 255), ABS_RZ: (0, 255), ABS_HAT0X: (-1, 1), ABS_HAT0Y: (-1, 1),
+}
+
+# report field index → axis (flip: Y axes are inverted)
+_UINPUT_REPORT_AXES = ((1, ABS_X, False), (2, ABS_Y, True), (3, ABS_RX, False),
+                       (4, ABS_RY, True), (5, ABS_Z, False), (6, ABS_RZ, False))
+
+class _PadReport:
+    """The XUSB_REPORT fields _apply_state() writes."""
+    __slots__ = ("wButtons", "sThumbLX", "sThumbLY", "sThumbRX", "sThumbRY",
+                 "bLeftTrigger", "bRightTrigger")
+
+    def __init__(self):
+        self.wButtons = self.sThumbLX = self.sThumbLY = self.sThumbRX = self.sThumbRY = 0
+        self.bLeftTrigger = self.bRightTrigger = 0
+
+class UInputGamepad:
+    """Xbox 360-style pad on Linux uinput; one write() + SYN_REPORT per update()."""
+
+    def __init__(self, path: str = UINPUT_PATH, name: str = "SF6 Combo Bot Pad"):
+        self.report = _PadReport()
+        self.write_times = deque(maxlen=4096)
+        self._last = (0,) * 7                  # report fields as last written
+        self.fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK | os.O_CREAT, 0o644)
+        self.fake = not stat.S_ISCHR(os.fstat(self.fd).st_mode)
+        if self.fake:
+            os.ftruncate(self.fd, 0)           # a rerun must not leave the previous session's tail
+        try:
+            self._setup(name)
+        except Exception:
+            os.close(self.fd)
+            raise
+
+    def _setup(self, name: str):
+        absmax, absmin = [0] * 64, [0] * 64
+        for code, (lo, hi) in _UINPUT_AXES.items():
+            absmin[code], absmax[code] = lo, hi
+        if not self.fake:
+            import fcntl
+            fcntl.ioctl(self.fd, UI_SET_EVBIT, EV_KEY)
+            fcntl.ioctl(self.fd, UI_SET_EVBIT, EV_ABS)
+            for code in _UINPUT_KEYS.values():
+                fcntl.ioctl(self.fd, UI_SET_KEYBIT, code)
+            for code in _UINPUT_AXES:
+                fcntl.ioctl(self.fd, UI_SET_ABSBIT, code)
+        os.write(self.fd, _UINPUT_DEV.pack(name.encode()[:79], 0x03, 0x045e, 0x028e, 0x0110, 0,
+                                           *absmax, *absmin, *[0] * 64, *[0] * 64))
+        if not self.fake:
+            fcntl.ioctl(self.fd, UI_DEV_CREATE)
+
+    def press_button(self, button):
+        self.report.wButtons |= int(button)
+
+    def release_button(self, button):
+        self.report.wButtons &= ~int(button)
+
+    def left_joystick(self, x_value: int, y_value: int):
+        self.report.sThumbLX, self.report.sThumbLY = x_value, y_value
+
+    def right_joystick(self, x_value: int, y_value: int):
+        self.report.sThumbRX, self.report.sThumbRY = x_value, y_value
+
+    def left_trigger(self, value: int):
+        self.report.bLeftTrigger = value
+
+    def right_trigger(self, value: int):
+        self.report.bRightTrigger = value
+
+    def reset(self):
+        self.report = _PadReport()
+
+    def update(self):
+        r = self.report
+        state = (r.wButtons, r.sThumbLX, r.sThumbLY, r.sThumbRX, r.sThumbRY,
+                 r.bLeftTrigger, r.bRightTrigger)
+        last = self._last
+        if state == last:
+            return
+        pack, buf = _INPUT_EVENT.pack, []
+        b, changed = state[0], state[0] ^ last[0]
+        if changed:
+            for bit, code in _UINPUT_KEYS.items():
+                if changed & bit:
+                    buf.append(pack(0, 0, EV_KEY, code, 1 if b & bit else 0))
+            if changed & 0x3:
+                buf.append(pack(0, 0, EV_ABS, ABS_HAT0Y, (b >> 1 & 1) - (b & 1)))
+            if changed & 0xC:
+                buf.append(pack(0, 0, EV_ABS, ABS_HAT0X, (b >> 3 & 1) - (b >> 2 & 1)))
+        for i, code, flip in _UINPUT_REPORT_AXES:
+            if state[i] != last[i]:
+                # evdev Y grows downward, XInput Y upward
+                buf.append(pack(0, 0, EV_ABS, code, min(-state[i], 32767) if flip else state[i]))
+        buf.append(pack(0, 0, EV_SYN, 0, 0))             # SYN_REPORT
+        self._last = state
+        data = b"".join(buf)
+        t0 = time.perf_counter()
+        os.write(self.fd, data)
+        self.write_times.append(time.perf_counter() - t0)
+
+    def close(self):
+        if self.fd is None:
+            return
+        if not self.fake:
+            import fcntl
+            try:
+                fcntl.ioctl(self.fd, UI_DEV_DESTROY)
+            except OSError:
+                pass
+        os.close(self.fd)
+        self.fd = None
+
+def read_uinput_events(path: str) -> list:
+    """Decode a fake uinput device file → [[(type, code, value), ...] per SYN_REPORT]."""
+    with open(path, "rb") as fh:
+        data = fh.read()[_UINPUT_DEV.size:]
+    frames, cur = [], []
+    for _s, _us, etype, code, value in _INPUT_EVENT.iter_unpack(data):
+        if etype == EV_SYN:
+            frames.append(cur)
+            cur = []
+        else:
+            cur.append((etype, code, value))
+    return frames
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  BUTTON / AXIS CONSTANTS  (SF6 Classic, Xbox layout)
 #  LP=X  MP=Y  HP=RB  LK=A  MK=B  HK=RT  Parry=LT  DI=LB+RB
 # ══════════════════════════════════════════════════════════════════════════════
 
+# XInput wButtons bits (vg.XUSB_BUTTON values) — plain ints so the table
+# exists before vgamepad is imported.
 _BTN = {
-    "LP": vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
-    "MP": vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
-    "HP": vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
-    "LK": vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
-    "MK": vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
-    "LB": vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,
-    "RB": vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
+    "LP": 0x4000,   # XUSB_GAMEPAD_X
+    "MP": 0x8000,   # XUSB_GAMEPAD_Y
+    "HP": 0x0200,   # XUSB_GAMEPAD_RIGHT_SHOULDER
+    "LK": 0x1000,   # XUSB_GAMEPAD_A
+    "MK": 0x2000,   # XUSB_GAMEPAD_B
+    "LB": 0x0100,   # XUSB_GAMEPAD_LEFT_SHOULDER
+    "RB": 0x0200,   # XUSB_GAMEPAD_RIGHT_SHOULDER
     # HK  → right trigger (handled via _set_triggers)
     # LT  → left trigger  (handled via _set_triggers)
 }
@@ -79,23 +288,106 @@ STICK_MIN = -32768
 
 FRAME_SCALE = 1.0          # global timing multiplier — raise on slow CPUs
 FRAME_MS    = 16.667       # one frame at 60 fps
+FRAME_S     = FRAME_MS / 1000.0
+
+_recorder   = None         # set by compile_combo() — _sleep() then advances virtual time
 
 def _sleep(seconds: float):
     """High-resolution sleep that also respects the cancel flag."""
+    if _recorder is not None:
+        _recorder.t += seconds
+        return
     end = time.perf_counter() + seconds
     while time.perf_counter() < end:
         if _cancel_flag.is_set():
+            if trace_on: trace(TR_CANCEL)
             raise InterruptedError("Combo cancelled")
         time.sleep(0.001)
 
 def f(frames: float) -> float:
-    """Convert frames to seconds, applying global scale."""
-    return frames * (FRAME_MS / 1000.0) * FRAME_SCALE
+    """Convert frames to seconds, applying global scale (or the compile scale)."""
+    scale = _recorder.scale if _recorder is not None else FRAME_SCALE
+    return frames * FRAME_S * scale
 
 def wait(ms: float):
     """Wait a fixed number of milliseconds (also checks cancel flag)."""
     _sleep(ms / 1000.0)
 
+# ══════════════════════════════════════════════════════════════════════════════
+#  TRACE RECORDER  (Chrome trace / Perfetto export)
+# ══════════════════════════════════════════════════════════════════════════════
+# Fixed-size ring of (timestamp, event, arg, thread) kept in preallocated
+# arrays. Hot paths call trace() only behind `if trace_on:`, so a disabled
+# recorder costs one global lookup per site. export_trace() writes the ring as
+# Chrome trace JSON — open it in chrome://tracing or ui.perfetto.dev.
+#
+# Events (arg):  hotkey (slot index) · combo B/E (slot index) · step (frame)
+#                wait B/E (0) · flush B/E (pad index) · late counter (µs)
+#                cancel (0) · tk poll B/E (0)
+
+TRACE_CAPACITY = 1 << 16                      # events kept; oldest overwritten
+TRACE_EVENTS   = [                            # code → (name, Chrome phase)
+    ("hotkey", "i"), ("combo", "B"), ("combo", "E"), ("step", "i"),
+    ("wait", "B"), ("wait", "E"), ("flush", "B"), ("flush", "E"),
+    ("late_us", "C"), ("cancel", "i"), ("tk poll", "B"), ("tk poll", "E"),
+]
+(TR_HOTKEY, TR_COMBO_B, TR_COMBO_E, TR_STEP, TR_WAIT_B, TR_WAIT_E, TR_FLUSH_B,
+ TR_FLUSH_E, TR_LATE, TR_CANCEL, TR_TK_B, TR_TK_E) = range(len(TRACE_EVENTS))
+
+trace_on  = False
+_tr_ts    = array.array("d", bytes(8 * TRACE_CAPACITY))
+_tr_ev    = array.array("B", bytes(TRACE_CAPACITY))
+_tr_arg   = array.array("q", bytes(8 * TRACE_CAPACITY))
+_tr_tid   = array.array("Q", bytes(8 * TRACE_CAPACITY))
+_tr_seq   = itertools.count()                 # next() is atomic under the GIL
+_tr_total = 0
+
+def trace(event: int, arg: int = 0):
+    global _tr_total
+    n = next(_tr_seq)
+    i = n & (TRACE_CAPACITY - 1)
+    _tr_ts[i]  = time.perf_counter()
+    _tr_ev[i]  = event
+    _tr_arg[i] = arg
+    _tr_tid[i] = threading.get_ident()
+    _tr_total  = n + 1
+
+def start_trace():
+    """Clear the ring and start recording."""
+    global trace_on, _tr_seq, _tr_total
+    _tr_seq, _tr_total = itertools.count(), 0
+    trace_on = True
+
+def stop_trace():
+    global trace_on
+    trace_on = False
+
+def export_trace(path: str) -> int:
+    """Write the recorded ring as Chrome trace JSON. Returns the event count."""
+    total = _tr_total
+    first = max(0, total - TRACE_CAPACITY)
+    names = {t.ident: t.name for t in threading.enumerate()}
+    pid, events, tids = os.getpid(), [], set()
+    for n in range(first, total):
+        i = n & (TRACE_CAPACITY - 1)
+        name, ph = TRACE_EVENTS[_tr_ev[i]]
+        tid = _tr_tid[i]
+        tids.add(tid)
+        ev = {"name": name, "ph": ph, "ts": (_tr_ts[i] - _T0) * 1e6, "pid": pid, "tid": tid}
+        if ph == "C":
+            ev["args"] = {"value": _tr_arg[i]}
+        else:
+            ev["args"] = {"arg": _tr_arg[i]}
+            if ph == "i":
+                ev["s"] = "t"
+        events.append(ev)
+    events += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                "args": {"name": names.get(tid, f"thread {tid}")}} for tid in tids]
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fh)
+    return total - first
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  LOW-LEVEL INPUT HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -103,13 +395,13 @@ def wait(ms: float):
 def _set_stick(direction: str):
     """
     Map numpad direction string to left stick X/Y.
-    Supports compound directions like '23', '46', etc.
+    Diagonals (1/3/7/9) set both axes; compound strings like '23' combine digits.
     """
     lx = ly = 0
-    if "6" in direction: lx =  STICK_MAX
-    if "4" in direction: lx =  STICK_MIN
-    if "8" in direction: ly =  STICK_MAX
-    if "2" in direction: ly =  STICK_MIN
+    if any(d in direction for d in "369"): lx = STICK_MAX
+    if any(d in direction for d in "147"): lx = STICK_MIN
+    if any(d in direction for d in "789"): ly = STICK_MAX
+    if any(d in direction for d in "123"): ly = STICK_MIN
     gamepad.left_joystick(x_value=lx, y_value=ly)
 
 def _set_triggers(hk: bool = False, lt: bool = False):
@@ -211,6 +503,277 @@ def cancel(ms: float = 20):
     wait(ms)
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+#  COMBO COMPILER
+# ══════════════════════════════════════════════════════════════════════════════
+# Combos stay written as plain helper calls. compile_combo() runs one against a
+# recording pad on a virtual clock and keeps each report as (frame, state), so
+# playback is a flat list walk with no helper calls or sleeps in between.
+#
+#   state = (buttons, lx, ly, lt, rt)   — the same fields as an XUSB report
+#   side  = +1 for P1 (facing right), -1 mirrors stick X for the P2 side
+
+NEUTRAL_STATE = (0, 0, 0, 0, 0)
+
+_compile_lock   = threading.Lock()
+_timeline_cache = {}     # (fn, scale, side) → timeline
+
+class _RecordingPad:
+    """Drop-in for VX360Gamepad that logs every update() instead of sending it."""
+
+    def __init__(self, side: int = 1, scale: float = 1.0):
+        self.side  = side
+        self.scale = scale
+        self.t     = 0.0
+        self.timeline = []
+        self.reset()
+
+    def reset(self):
+        self.buttons = self.lx = self.ly = self.lt = self.rt = 0
+
+    def press_button(self, button):
+        self.buttons |= int(button)
+
+    def release_button(self, button):
+        self.buttons &= ~int(button)
+
+    def left_joystick(self, x_value: int, y_value: int):
+        self.lx = x_value if self.side > 0 else -max(x_value, -STICK_MAX)
+        self.ly = y_value
+
+    def right_trigger(self, value: int):
+        self.rt = value
+
+    def left_trigger(self, value: int):
+        self.lt = value
+
+    def update(self):
+        state = (self.buttons, self.lx, self.ly, self.lt, self.rt)
+        frame = round(self.t / FRAME_S)
+        tl = self.timeline
+        # Reports sent within one frame collapse into whatever the game sees last
+        if tl and tl[-1][0] == frame:
+            tl.pop()
+        if (tl[-1][1] if tl else NEUTRAL_STATE) != state:
+            tl.append((frame, state))
+
+def _record(fn, side: int = 1, scale: float | None = None) -> _RecordingPad:
+    global gamepad, _recorder
+    rec = _RecordingPad(side, FRAME_SCALE if scale is None else scale)
+    with _compile_lock:
+        live, gamepad, _recorder = gamepad, rec, rec
+        try:
+            fn()
+            rec.reset()
+            rec.update()            # always end on a full release
+        finally:
+            gamepad, _recorder = live, None
+    return rec
+
+def compile_combo(fn, side: int = 1, scale: float | None = None) -> list:
+    """Run a combo function on a virtual clock → [(frame, state), ...]."""
+    rec = _record(fn, side, scale)
+    return charge_schedule(rec.timeline, rec.scale) if CHARGE_OVERLAP else rec.timeline
+
+# ── Charge scheduling ─────────────────────────────────────────────────────────
+# Charge combos are written with the charge paid up front: hold_charge("4", 6)
+# before the first normal, motion("4", 5) again before each release.
+# charge_schedule() reworks the compiled timeline so the charge is built during
+# the normals instead. A release is the stick leaving a charge direction it held
+# for CHARGE_MIN+ frames (back or down) for the opposite one, with a press
+# within RELEASE_WINDOW frames. For each release it
+#   • holds back through everything since the previous special: neutral → 4,
+#     2 → 1 (down charge is only counted — a standing normal can't hold down);
+#   • for the first release only, resizes the up-front hold so the charge is
+#     exactly what the move needs (CHARGE_TIMES): surplus hold frames are
+#     dropped, missing ones added, all before the first press.
+# Nothing from the first press on is removed or moved relative to the rest, so
+# links, cancels and repeated presses keep the timing they were written with.
+# A later release that is still short stays as written.
+# Stick X is in the timeline's own frame of reference, so P2 mirrors for free.
+
+CHARGE_OVERLAP = True
+RELEASE_WINDOW = 4
+CHARGE_MIN     = 4         # frames a charge direction must have been held
+CHARGE_MEMORY  = 60        # …ending at most this many frames before the press
+
+# Frames of charge each special needs before its release, by input (stick path
+# + P/K). Approximate, like FRAME_DATA — tune the rows.
+CHARGE_TIMES = {
+    "[4]6P": 40,           # Psycho Crusher, Psycho Spark, Flash Knuckle
+    "[4]6K": 40,           # Spinning Bird Kick, Scissors Kick, Psycho Blitz
+    "[2]8P": 40,           # Psycho Upper
+    "[2]8K": 40,           # Hazan Shu
+}
+
+def charge_time(stick: str, buttons) -> int:
+    """Charge frames for a "[4]6" / "[2]8" stick path released into `buttons`."""
+    kick = any(b.endswith("K") for b in buttons)
+    return CHARGE_TIMES[stick + ("K" if kick else "P")]
+
+def _dense(timeline: list) -> list:
+    """[(frame, state)] → one state per frame up to the last change."""
+    dense, state = [], NEUTRAL_STATE
+    for frame, nxt in timeline:
+        dense.extend([state] * (frame - len(dense)))
+        state = nxt
+    dense.append(state)
+    return dense
+
+def _changes(dense: list) -> list:
+    tl, prev = [], NEUTRAL_STATE
+    for frame, state in enumerate(dense):
+        if state != prev:
+            tl.append((frame, state))
+            prev = state
+    return tl
+
+def _press_starts(a: tuple, b: tuple) -> bool:
+    return bool(b[0] & ~a[0]) or (b[3] and not a[3]) or (b[4] and not a[4])
+
+def _charge_releases(dense: list) -> list:
+    """
+    [(frame, axis, buttons)] for every charge release; axis 1 = back charge,
+    2 = down; buttons = the names pressed into it.
+    A normal pressed on the neighbouring direction between the charge and the
+    release (cr.MK on 2 instead of 1, losing back charge) still counts —
+    that's the charge it meant to keep.
+    """
+    found = []
+    for i in range(1, len(dense)):
+        for axis in (1, 2):
+            if not (dense[i][axis] > 0 >= dense[i - 1][axis]):
+                continue
+            end = i - 1
+            while end >= 0 and dense[end][axis] == 0:
+                end -= 1
+            if end < 0 or dense[end][axis] > 0:
+                continue
+            gap = range(end + 1, i)
+            if gap and not (len(gap) <= CHARGE_MEMORY
+                            and all(dense[j][3 - axis] < 0 for j in gap)
+                            and any(_press_starts(dense[j - 1], dense[j]) for j in gap)):
+                continue
+            start = end
+            while start > 0 and dense[start - 1][axis] < 0:
+                start -= 1
+            if end + 1 - start < CHARGE_MIN:
+                continue
+            for j in range(i, min(i + RELEASE_WINDOW, len(dense))):
+                if dense[j][axis] > 0 and _press_starts(dense[j - 1], dense[j]):
+                    found.append((i, axis, _pressed(dense[j - 1], dense[j])))
+                    break
+    return found
+
+def charge_schedule(timeline: list, scale: float = 1.0) -> list:
+    """Overlap charge time with the preceding normals (see above)."""
+    if not timeline:
+        return timeline
+    dense = _dense(timeline)
+    releases = _charge_releases(dense)
+    if not releases:
+        return timeline
+    starts = [0] + [r + 1 for r, _axis, _buttons in releases[:-1]]
+    for (r, axis, _buttons), start in zip(releases, starts):
+        # Nothing before the last forward/up input since the previous release
+        for i in range(r - 1, start - 1, -1):
+            if dense[i][1] > 0 or dense[i][2] > 0:
+                start = i + 1
+                break
+        if axis == 1:
+            for i in range(start, r):
+                b, lx, ly, lt, rt = dense[i]
+                if lx == 0 and ly <= 0:
+                    dense[i] = (b, STICK_MIN, ly, lt, rt)
+    # Size the up-front hold to the first release's requirement
+    r, axis, buttons = releases[0]
+    first = next(i for i in range(1, len(dense)) if _press_starts(dense[i - 1], dense[i]))
+    c = r                              # charge held unbroken up to the release
+    while c > 0 and dense[c - 1][axis] < 0:
+        c -= 1
+    if c <= first:
+        need = round(charge_time("[4]6" if axis == 1 else "[2]8", buttons) * scale)
+        held = r - c
+        if held > need:
+            del dense[c:c + min(held - need, first - c)]
+        elif held < need:
+            dense[c:c] = [(0, *dense[c][1:3], 0, 0)] * (need - held)
+    return _changes(dense)
+
+_schedule_cache = {}     # (fn, scale) → single-pad schedule
+
+def get_schedule(fn, scale: float | None = None) -> list:
+    """Cached single-pad schedule for a combo function — what _run_combo plays."""
+    key = (fn, FRAME_SCALE if scale is None else scale)
+    sch = _schedule_cache.get(key)
+    if sch is None:
+        sch = _schedule_cache[key] = merge_timelines((0, 0, get_timeline(fn, scale=key[1])))
+    return sch
+
+def get_timeline(fn, side: int = 1, scale: float | None = None) -> list:
+    """Cached compile_combo() — recompiles only when the scale or side changes."""
+    key = (fn, FRAME_SCALE if scale is None else scale, side)
+    tl = _timeline_cache.get(key)
+    if tl is None:
+        tl = _timeline_cache[key] = compile_combo(fn, side, key[1])
+    return tl
+
+# ── Hit-confirm graphs ────────────────────────────────────────────────────────
+# A branching combo is a tree of segments. confirm() plays `starter`, then at
+# frame `at` asks cond(state_at_start, state_now) and continues with `hit` or
+# `miss`. `at` defaults to the end of the starter, trailing cancel gap
+# included. An earlier `at` is rejected, since the starter can't be cut short.
+# compile_graph() turns every segment into its own schedule up front, so at a
+# branch point the executor only evaluates the condition and keeps going.
+
+CONFIRM_DEFAULT = True   # branch taken when no game-state feed is available
+
+def hit_confirmed(before, now) -> bool:
+    """combo_cnt rose since the starter began → the starter hit."""
+    return now.combo > before.combo
+
+def confirm(starter, hit, miss=None, cond=hit_confirmed, at: int | None = None) -> dict:
+    return {"fn": starter, "hit": hit, "miss": miss, "cond": cond, "at": at}
+
+def compile_graph(node, scale: float | None = None):
+    """
+    node → (schedule, at, cond, hit, miss). Leaves (plain functions) compile
+    to (schedule, None, None, None, None); None stays None (stop, stay neutral).
+    """
+    if node is None:
+        return None
+    if callable(node):
+        return (merge_timelines((0, 0, get_timeline(node, scale=scale))), None, None, None, None)
+    rec = _record(node["fn"], 1, scale)
+    end = round(rec.t / FRAME_S)
+    at  = end if node["at"] is None else node["at"]
+    if at < end:
+        raise ValueError(f"confirm({getattr(node['fn'], '__name__', node['fn'])}): at={at}"
+                         f" is before the starter ends (frame {end})")
+    return (merge_timelines((0, 0, rec.timeline)), at, node["cond"],
+            compile_graph(node["hit"], scale), compile_graph(node["miss"], scale))
+
+_graph_cache = {}        # (id(graph), scale) → compiled graph
+
+def get_graph(node, scale: float | None = None):
+    key = (id(node), FRAME_SCALE if scale is None else scale)
+    g = _graph_cache.get(key)
+    if g is None:
+        g = _graph_cache[key] = compile_graph(node, key[1])
+    return g
+
+def merge_timelines(*tracks) -> list:
+    """
+    Merge (pad_index, start_frame, timeline) tracks into one schedule:
+    [(frame, ((pad_index, state), ...)), ...] sorted by frame.
+    """
+    by_frame = {}
+    for pad, start, tl in tracks:
+        for frame, state in tl:
+            by_frame.setdefault(start + frame, []).append((pad, state))
+    return [(fr, tuple(by_frame[fr])) for fr in sorted(by_frame)]
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  ▓▓  AKUMA  ▓▓
 # ══════════════════════════════════════════════════════════════════════════════
@@ -257,14 +820,26 @@ def akuma_advanced():
     Full Drive punish off a low starter. Cancel window is tight.
     OD Tatsumaki (QCB+MK+HK) wallsplats in corner for a juggle HP DP.
     """
+    akuma_adv_starter()
+    akuma_adv_hit()
+
+def akuma_adv_starter():
+    """cr.LK > cr.LP > cr.MP > st.HP — confirm window before the OD Tatsumaki."""
     cr("LK", frames=2); link(35)
     cr("LP", frames=2); link(35)
     cr("MP"); link(45)
     st("HP", frames=4); cancel(30)
+
+def akuma_adv_hit():
+    """xx OD Tatsumaki > juggle HP DP — starter hit."""
     qcb(); od("MK", "HK")
     wait(260)
     dp(); press_buttons("HP"); neutral()
 
+def akuma_adv_blocked():
+    """xx Gohadouken (QCF+HP) — starter blocked, keep Drive."""
+    qcf(); press_buttons("HP"); neutral()
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  ▓▓  CHUN-LI  ▓▓
@@ -376,15 +951,27 @@ def mai_advanced():
     Full meter punish off a low starter. OD Ryuuenbu launches, juggle HP
     cancelled into Lv2 Super for screen-clearing damage.
     """
+    mai_adv_starter()
+    mai_adv_hit()
+
+def mai_adv_starter():
+    """cr.LK > cr.LP > st.MP > st.HP — confirm window before the OD Ryuuenbu."""
     cr("LK", frames=2); link(35)
     cr("LP", frames=2); link(35)
     st("MP"); link(45)
     st("HP", frames=4); cancel(28)
+
+def mai_adv_hit():
+    """xx OD Ryuuenbu > juggle HP xx Sen'en Ryuuenbu Lv2 — starter hit."""
     qcb(); od("MK", "HK")
     wait(200)
     st("HP", frames=4); cancel(25)
     qcb(); qcb(); press_buttons("HK"); neutral()
 
+def mai_adv_blocked():
+    """xx Kachousen (QCF+HP) — starter blocked, keep Drive and meter."""
+    qcf(); press_buttons("HP"); neutral()
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  ▓▓  KEN  ▓▓
@@ -432,8 +1019,16 @@ def ken_advanced():
     (236+MK → auto-follow MK → HP) cancels into Shinryuken for max damage.
     The Jinrai chain auto-follows on hit — just re-fire QCF+MK twice after landing.
     """
+    ken_adv_starter()
+    ken_adv_hit()
+
+def ken_adv_starter():
+    """st.MP > st.HP — confirm window before the OD Shoryuken."""
     st("MP"); link(45)
     st("HP", frames=4); cancel(30)
+
+def ken_adv_hit():
+    """xx OD Shoryuken > Jinrai chain xx Shinryuken Lv1 — starter hit."""
     dp(); od("LP", "HP")
     wait(250)
     # Jinrai first hit
@@ -446,6 +1041,10 @@ def ken_advanced():
     press_buttons("HP"); cancel(20)
     qcf(); qcf(); press_buttons("HP"); neutral()
 
+def ken_adv_blocked():
+    """xx Hadouken (QCF+HP) — starter blocked, keep Drive and meter."""
+    qcf(); press_buttons("HP"); neutral()
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  ▓▓  JURI  ▓▓
@@ -610,8 +1209,16 @@ def ryu_advanced():
     for a devastating wall-bounce combo. The held HP activates the powered version.
     Requires full Drive Gauge + Lv3 super meter.
     """
+    ryu_adv_starter()
+    ryu_adv_hit()
+
+def ryu_adv_starter():
+    """cr.MP > st.HP — confirm window before the OD Shoryuken."""
     cr("MP"); link(45)
     st("HP", frames=4); cancel(30)
+
+def ryu_adv_hit():
+    """xx OD Shoryuken > Tatsumaki xx Shin Shoryuken Lv3 — starter hit."""
     dp(); od("LP", "HP")
     wait(260)
     qcb(); press_buttons("HK"); cancel(30)
@@ -623,6 +1230,10 @@ def ryu_advanced():
     _release_raw("HP"); gamepad.update()
     neutral()
 
+def ryu_adv_blocked():
+    """xx Hadouken (QCF+HP) — starter blocked, keep Drive and meter."""
+    qcf(); press_buttons("HP"); neutral()
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  ▓▓  ED  ▓▓
@@ -1006,14 +1617,36 @@ def bison_advanced():
     qcf(); qcf(); press_buttons("HK"); neutral()          # Knee Press Nightmare
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+#  ▓▓  TRAINING DUMMY  ▓▓
+# ══════════════════════════════════════════════════════════════════════════════
+# Scripted opponent behaviour for the second pad. Written from the dummy's own
+# side: compiled with side=-1, so "6" still means "towards P1".
+
+def dummy_block():
+    """Crouch-block (down-back) for 3 seconds — P1's string runs into guard."""
+    motion("24", 180); neutral()
+
+def dummy_wakeup_reversal():
+    """Stay down through the knockdown, then 623+HP on the first wakeup frame."""
+    neutral(30)
+    dp(); press_buttons("HP"); neutral()
+
+def dummy_jump_in():
+    """Forward jump (9) with a late j.HK — lands inside P1's punish range."""
+    motion("68", 3); neutral(18)
+    press_buttons("HK", frames=4); neutral()
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  COMBO REGISTRY
 # ══════════════════════════════════════════════════════════════════════════════
 # Each character has 6 combos: F1=BnB1, F2=BnB2, F3=Punish1, F4=Punish2(OD),
 # F5=Super route, F6_ADV=Advanced (GUI button only, not a hotkey)
+# `graph` (optional) is the hit-confirm version the executor plays instead of fn.
 
-def _entry(fn, label, slot):
-    return {"fn": fn, "label": label, "slot": slot}
+def _entry(fn, label, slot, graph=None):
+    return {"fn": fn, "label": label, "slot": slot, "graph": graph}
 
 ALL_COMBOS = {
     "Akuma": [
@@ -1022,7 +1655,8 @@ ALL_COMBOS = {
         _entry(akuma_punish_1, "Punish #1 — st.HP xx HP Goshoryuken",                  "F3"),
         _entry(akuma_punish_2, "Punish #2 — OD Goshoryuken > juggle HP DP",            "F4"),
         _entry(akuma_super_1,  "Super — cr.MP > cr.HP xx Messatsu-Goshoryuken Lv1",    "F5"),
-        _entry(akuma_advanced, "ADV — Low starter > OD Tatsumaki > HP DP",             "ADV"),
+        _entry(akuma_advanced, "ADV — Low starter > OD Tatsumaki > HP DP",             "ADV",
+               confirm(akuma_adv_starter, akuma_adv_hit, akuma_adv_blocked)),
     ],
     "Chun-Li": [
         _entry(chunli_bnb_1,    "BnB #1 — cr.MK xx Spinning Bird Kick (charge)",       "F1"),
@@ -1038,7 +1672,8 @@ ALL_COMBOS = {
         _entry(mai_punish_1, "Punish #1 — cr.MP > st.HP xx Kachousen",                "F3"),
         _entry(mai_punish_2, "Punish #2 — OD Ryuuenbu > HP > Kachousen",              "F4"),
         _entry(mai_super_1,  "Super — cr.MP > st.HP xx Hissatsu Shinobibachi Lv1",    "F5"),
-        _entry(mai_advanced, "ADV — Low > OD Ryuuenbu > HP xx Sen'en Ryuuenbu Lv2",  "ADV"),
+        _entry(mai_advanced, "ADV — Low > OD Ryuuenbu > HP xx Sen'en Ryuuenbu Lv2",  "ADV",
+               confirm(mai_adv_starter, mai_adv_hit, mai_adv_blocked)),
     ],
     "Ken": [
         _entry(ken_bnb_1,    "BnB #1 — cr.MK xx Hadouken",                            "F1"),
@@ -1046,7 +1681,8 @@ ALL_COMBOS = {
         _entry(ken_punish_1, "Punish #1 — st.MP > st.HP xx HP Shoryuken",             "F3"),
         _entry(ken_punish_2, "Punish #2 — OD Shoryuken > Tatsumaki juggle",           "F4"),
         _entry(ken_super_1,  "Super — cr.MK xx Shinryuken Lv1",                       "F5"),
-        _entry(ken_advanced, "ADV — OD DP > Jinrai chain xx Shinryuken Lv1",          "ADV"),
+        _entry(ken_advanced, "ADV — OD DP > Jinrai chain xx Shinryuken Lv1",          "ADV",
+               confirm(ken_adv_starter, ken_adv_hit, ken_adv_blocked)),
     ],
     "Juri": [
         _entry(juri_bnb_1,    "BnB #1 — cr.MK > st.HP xx Fuha LP ★stock",            "F1"),
@@ -1070,7 +1706,8 @@ ALL_COMBOS = {
         _entry(ryu_punish_1, "Punish #1 — st.HP xx HP Shoryuken",                    "F3"),
         _entry(ryu_punish_2, "Punish #2 — OD Shoryuken > Tatsumaki juggle",          "F4"),
         _entry(ryu_super_1,  "Super — cr.MK xx Shin Hashogeki Lv1",                  "F5"),
-        _entry(ryu_advanced, "ADV — OD DP > Tatsumaki xx Shin Shoryuken Lv3 (hold)", "ADV"),
+        _entry(ryu_advanced, "ADV — OD DP > Tatsumaki xx Shin Shoryuken Lv3 (hold)", "ADV",
+               confirm(ryu_adv_starter, ryu_adv_hit, ryu_adv_blocked)),
     ],
     "Ed": [
         _entry(ed_bnb_1,    "BnB #1 — cr.LP > cr.LP > st.MP xx Psycho Blitz",        "F1"),
@@ -1124,6 +1761,9 @@ ALL_COMBOS = {
 
 CHARACTER_ORDER = list(ALL_COMBOS.keys())
 
+def _find_combo(char: str, slot: str) -> dict | None:
+    return next((c for c in ALL_COMBOS[char] if c["slot"] == slot), None)
+
 # Per-character notes shown in the GUI
 CHAR_NOTES = {
     "Akuma":    "ADV needs Drive Gauge. OD Tatsumaki corner only.",
@@ -1141,6 +1781,1196 @@ CHAR_NOTES = {
     "M. Bison": "All specials need charge. Hold back DURING normals to maintain it.",
 }
 
+# gBattle.Player[0].chara_id → character (same IDs as CHARA_ID_MAP in the Lua mod)
+CHARA_ID_MAP = {
+    0: "Ryu", 1: "Luke", 3: "Chun-Li", 6: "JP", 8: "Cammy", 9: "Ken",
+    12: "A.K.I.", 15: "Juri", 16: "Marisa", 18: "Ed", 19: "Akuma",
+    20: "M. Bison", 22: "Mai",
+}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  TELEMETRY BRIDGE  (REFramework mod → Python, shared-memory file)
+# ══════════════════════════════════════════════════════════════════════════════
+# The Lua mod writes its per-frame state snapshot every game frame into a small ring
+# file under reframework/data/. Each record carries its sequence number at both
+# ends; the header holds the newest complete sequence. Readers map the file and
+# check seq == seq_end instead of taking a lock — a torn read is just retried
+# on the next poll.
+#
+#   header  "SF6T"  u16 version  u16 record_size  u32 slots  u32 head_seq
+#   record  u32 seq  u32 frame  u8 valid  i8 super_lvl  i8 chara_id  i8 res
+#           i32 act_id  i32 act_frame  i32 hp  i32 drive  i16 hitstop
+#           i16 combo  u32 seq_end
+
+TELEMETRY_PATH = os.environ.get(
+    "SF6_TELEMETRY",
+    r"C:\Program Files (x86)\Steam\steamapps\common\Street Fighter 6"
+    r"\reframework\data\sf6_combo_bot_telemetry.bin")
+
+TELEMETRY_VERSION = 2
+
+_TELEM_HEADER = struct.Struct("<4sHHII")
+_TELEM_RECORD = struct.Struct("<IIBbbbiiiihhI")
+_TELEM_HEAD   = struct.Struct("<I")
+_TELEM_HEAD_OFFSET = 12
+
+# res = character resource counter (Juri: Fuha stock), 0 for everyone else
+GameState = namedtuple("GameState",
+    "frame valid super_lvl chara_id res act_id act_frame hp drive hitstop combo")
+
+class TelemetryReader:
+    """Lock-free view of the mod's telemetry ring. latest() never blocks."""
+
+    def __init__(self, path: str = TELEMETRY_PATH):
+        self.path  = path
+        self._mm   = None
+        self._slots = 0
+        self._seen = 0          # newest sequence number already decoded
+        self._last = None
+
+    def open(self) -> bool:
+        try:
+            with open(self.path, "rb") as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        try:
+            magic, ver, rec_size, slots, _head = _TELEM_HEADER.unpack_from(mm, 0)
+        except struct.error:
+            mm.close()              # header not written yet
+            return False
+        if (magic != b"SF6T" or ver != TELEMETRY_VERSION or rec_size != _TELEM_RECORD.size
+                or slots == 0 or len(mm) < _TELEM_HEADER.size + slots * _TELEM_RECORD.size):
+            mm.close()              # wrong format, or the mod hasn't sized the ring yet
+            return False
+        self._mm, self._slots = mm, slots
+        return True
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def _record(self, seq: int) -> GameState | None:
+        off = _TELEM_HEADER.size + (seq % self._slots) * _TELEM_RECORD.size
+        rec = _TELEM_RECORD.unpack_from(self._mm, off)
+        if rec[0] != seq or rec[-1] != seq:
+            return None             # torn or already overwritten
+        return GameState._make(rec[1:-1])
+
+    def latest(self) -> GameState | None:
+        """Newest complete frame, or the previous one if the writer is mid-update."""
+        if self._mm is None and not self.open():
+            return None
+        head = _TELEM_HEAD.unpack_from(self._mm, _TELEM_HEAD_OFFSET)[0]
+        if head < self._seen:
+            self._seen = 0          # mod was reloaded and restarted its sequence
+        if head != self._seen and head:
+            state = self._record(head)
+            if state is not None:
+                self._seen, self._last = head, state
+        return self._last
+
+    def read_new(self) -> list:
+        """Every complete frame written since the last call (at most one ring)."""
+        if self._mm is None and not self.open():
+            return []
+        head  = _TELEM_HEAD.unpack_from(self._mm, _TELEM_HEAD_OFFSET)[0]
+        if head < self._seen:
+            self._seen = 0
+        first = max(self._seen + 1, head - self._slots + 1, 1)
+        out = [st for st in map(self._record, range(first, head + 1)) if st is not None]
+        if out:
+            self._seen, self._last = head, out[-1]
+        return out
+
+def record_telemetry(reader: TelemetryReader, path: str, seconds: float):
+    """Dump the live stream to a flat file of records for ReplayFeed."""
+    end = time.perf_counter() + seconds
+    with open(path, "wb") as out:
+        seq = 0
+        while time.perf_counter() < end:
+            for st in reader.read_new():
+                seq += 1
+                out.write(_TELEM_RECORD.pack(seq, *st, seq))
+            time.sleep(0.005)
+
+class ReplayFeed:
+    """
+    Stand-in for TelemetryReader that plays back a recorded stream.
+    Runs on the wall clock at 60 fps after start(), or frame-by-frame via step().
+    """
+
+    def __init__(self, path: str | None = None, states: list | None = None, loop: bool = False):
+        if states is None:
+            with open(path, "rb") as fh:
+                data = fh.read()
+            states = [GameState._make(r[1:-1]) for r in _TELEM_RECORD.iter_unpack(data)]
+        self.states = states
+        self.loop   = loop
+        self._t0    = None
+        self._idx   = -1
+
+    def start(self):
+        self._t0 = time.perf_counter()
+
+    def step(self, frames: int = 1) -> GameState | None:
+        self._idx += frames
+        return self.latest()
+
+    def latest(self) -> GameState | None:
+        if not self.states:
+            return None
+        idx = self._idx
+        if self._t0 is not None:
+            idx = int((time.perf_counter() - self._t0) / FRAME_S)
+        if idx < 0:
+            return None
+        n = len(self.states)
+        return self.states[idx % n if self.loop else min(idx, n - 1)]
+
+    def read_new(self) -> list:
+        st = self.latest()
+        return [st] if st is not None else []
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SESSION ARCHIVE  (append-only game-state + output streams)
+# ══════════════════════════════════════════════════════════════════════════════
+# Two streams go to one file: each telemetry frame and each report a pad
+# sends. Records are stamped with the session frame (time since the session
+# started, in 1/60 s), so a state and the input that answered it line up on
+# one axis. Records are packed into chunks and a background thread appends
+# each full chunk to the file, so play_schedule() only packs 21 bytes per
+# report. close() writes a chunk index and a trailer. If the trailer is
+# missing, e.g. after a crash, ArchiveReader rebuilds the index by walking the
+# chunk headers. A new session on an existing archive drops the old index and
+# appends after the last chunk.
+#
+#   header   "SF6A"  u16 version  u16 reserved
+#   chunk    "SF6C"  u8 stream  u32 session  u32 count  u32 first_sframe  u32 last_sframe
+#            + count records of that stream
+#   index    count × (u8 stream  u32 session  u64 offset  u32 count  u32 first  u32 last)
+#   trailer  "SF6X"  u64 index_at  u32 entries
+#
+#   state    u32 sframe  f64 t  + the GameState fields (telemetry record layout)
+#   report   u32 sframe  f64 t  u8 pad  u16 buttons  i16 lx  i16 ly  u8 lt  u8 rt
+#
+# ArchiveReader maps the file. chunks() yields each chunk as a zero-copy NumPy
+# structured array, so hours of sessions are scanned one chunk at a time.
+# seek() bisects the index for a session frame.
+
+ARCHIVE_VERSION = 1
+ARCHIVE_PATH    = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sessions.sf6a")
+ARCHIVE_CHUNK   = 4096            # records per chunk
+ARCHIVE_POLL_S  = 0.005
+STREAM_STATE, STREAM_REPORT = 0, 1
+
+_ARC_HEADER  = struct.Struct("<4sHH")
+_ARC_CHUNK   = struct.Struct("<4sBIIII")
+_ARC_INDEX   = struct.Struct("<BIQIII")
+_ARC_TRAILER = struct.Struct("<4sQI")
+_ARC_STATE   = struct.Struct("<IdIBbbbiiiihh")
+_ARC_REPORT  = struct.Struct("<IdBHhhBB")
+_ARC_RECORD  = {STREAM_STATE: _ARC_STATE, STREAM_REPORT: _ARC_REPORT}
+
+ArchiveChunk = namedtuple("ArchiveChunk", "stream session offset count first last")
+
+def archive_dtypes() -> dict:
+    """{stream: NumPy structured dtype} matching the packed record layouts."""
+    np = _numpy()
+    state = [("sframe", "<u4"), ("t", "<f8"), ("frame", "<u4"), ("valid", "u1"),
+             ("super_lvl", "i1"), ("chara_id", "i1"), ("res", "i1"), ("act_id", "<i4"),
+             ("act_frame", "<i4"), ("hp", "<i4"), ("drive", "<i4"), ("hitstop", "<i2"),
+             ("combo", "<i2")]
+    report = [("sframe", "<u4"), ("t", "<f8"), ("pad", "u1"), ("buttons", "<u2"),
+              ("lx", "<i2"), ("ly", "<i2"), ("lt", "u1"), ("rt", "u1")]
+    return {STREAM_STATE: np.dtype(state), STREAM_REPORT: np.dtype(report)}
+
+def _scan_archive(mm) -> tuple:
+    """(chunks, end of the last whole chunk) from the trailer, or by walking chunks."""
+    size = len(mm)
+    if size >= _ARC_HEADER.size + _ARC_TRAILER.size:
+        magic, index_at, n = _ARC_TRAILER.unpack_from(mm, size - _ARC_TRAILER.size)
+        if magic == b"SF6X" and index_at + n * _ARC_INDEX.size + _ARC_TRAILER.size == size:
+            return ([ArchiveChunk._make(_ARC_INDEX.unpack_from(mm, index_at + i * _ARC_INDEX.size))
+                     for i in range(n)], index_at)
+    chunks, off = [], _ARC_HEADER.size
+    while off + _ARC_CHUNK.size <= size:
+        magic, stream, session, count, first, last = _ARC_CHUNK.unpack_from(mm, off)
+        end = off + _ARC_CHUNK.size + count * _ARC_RECORD.get(stream, _ARC_STATE).size
+        if magic != b"SF6C" or stream not in _ARC_RECORD or end > size:
+            break                   # index block or a chunk cut short by a crash
+        chunks.append(ArchiveChunk(stream, session, off + _ARC_CHUNK.size, count, first, last))
+        off = end
+    return chunks, off
+
+class ArchiveWriter:
+    """One archive session. state()/report() only pack; a thread does the writes."""
+
+    def __init__(self, path: str = ARCHIVE_PATH, chunk: int = ARCHIVE_CHUNK):
+        self.path  = path
+        self.chunk = chunk
+        self.chunks, end = self._open()
+        self.session = max((c.session for c in self.chunks), default=0) + 1
+        self.fh.truncate(end)
+        self.fh.seek(end)
+        self.t0 = time.perf_counter()
+        self._buf = {STREAM_STATE: [], STREAM_REPORT: []}
+        self._first = {}                       # stream → sframe of its buffered chunk
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._writer, name="archive", daemon=True)
+        self._thread.start()
+
+    def _open(self) -> tuple:
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            self.fh = open(self.path, "wb+")
+            self.fh.write(_ARC_HEADER.pack(b"SF6A", ARCHIVE_VERSION, 0))
+            return [], _ARC_HEADER.size
+        self.fh = open(self.path, "rb+")
+        with mmap.mmap(self.fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, ver, _ = _ARC_HEADER.unpack_from(mm, 0)
+            if magic != b"SF6A" or ver != ARCHIVE_VERSION:
+                self.fh.close()
+                raise ValueError(f"{self.path}: not a v{ARCHIVE_VERSION} session archive")
+            return _scan_archive(mm)
+
+    def sframe(self, t: float) -> int:
+        # Nearest frame: reports go out a flush early, just before their deadline
+        return round((t - self.t0) / FRAME_S)
+
+    def state(self, st: GameState, t: float | None = None):
+        t = time.perf_counter() if t is None else t
+        self._add(STREAM_STATE, self.sframe(t), _ARC_STATE.pack(self.sframe(t), t - self.t0, *st))
+
+    def report(self, pad: int, state: tuple, t: float | None = None):
+        t = time.perf_counter() if t is None else t
+        self._add(STREAM_REPORT, self.sframe(t), _ARC_REPORT.pack(self.sframe(t), t - self.t0, pad, *state))
+
+    def _add(self, stream: int, sframe: int, record: bytes):
+        buf = self._buf[stream]
+        if not buf:
+            self._first[stream] = sframe
+        buf.append(record)
+        if len(buf) >= self.chunk:
+            self._hand_off(stream, sframe)
+
+    def _hand_off(self, stream: int, last: int):
+        buf = self._buf[stream]
+        self._buf[stream] = []
+        self._queue.put((stream, self._first[stream], last, buf))
+
+    def _writer(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            stream, first, last, records = item
+            self.fh.write(_ARC_CHUNK.pack(b"SF6C", stream, self.session, len(records), first, last))
+            offset = self.fh.tell()
+            self.fh.write(b"".join(records))
+            self.chunks.append(ArchiveChunk(stream, self.session, offset, len(records), first, last))
+
+    def close(self):
+        """Flush partial chunks, write the index and trailer."""
+        for stream, buf in self._buf.items():
+            if buf:
+                self._hand_off(stream, _ARC_RECORD[stream].unpack(buf[-1])[0])
+        self._queue.put(None)
+        self._thread.join()
+        index_at = self.fh.tell()
+        self.fh.write(b"".join(_ARC_INDEX.pack(*c) for c in self.chunks))
+        self.fh.write(_ARC_TRAILER.pack(b"SF6X", index_at, len(self.chunks)))
+        self.fh.close()
+
+class ArchiveReader:
+    """Memory-mapped archive; every array handed out is a view into the map."""
+
+    def __init__(self, path: str = ARCHIVE_PATH):
+        self.path = path
+        with open(path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, ver, _ = _ARC_HEADER.unpack_from(self._mm, 0)
+        if magic != b"SF6A" or ver != ARCHIVE_VERSION:
+            self._mm.close()
+            raise ValueError(f"{path}: not a v{ARCHIVE_VERSION} session archive")
+        self.index, _end = _scan_archive(self._mm)
+        self.dtypes = archive_dtypes()
+
+    def close(self):
+        try:
+            self._mm.close()
+        except BufferError:
+            pass                    # arrays still viewing the map keep it alive until freed
+
+    def sessions(self) -> list:
+        return sorted({c.session for c in self.index})
+
+    def _chunks(self, stream: int, session: int | None) -> list:
+        return [c for c in self.index
+                if c.stream == stream and (session is None or c.session == session)]
+
+    def _array(self, c: ArchiveChunk):
+        return _numpy().frombuffer(self._mm, self.dtypes[c.stream], c.count, c.offset)
+
+    def chunks(self, stream: int = STREAM_STATE, session: int | None = None):
+        """Yield each chunk of `stream` as a structured array, in file order."""
+        for c in self._chunks(stream, session):
+            yield self._array(c)
+
+    def seek(self, stream: int, session: int, sframe: int) -> tuple | None:
+        """(chunk number, row) of the first `stream` record at or after `sframe`."""
+        chunks = self._chunks(stream, session)
+        k = bisect.bisect_left([c.last for c in chunks], sframe)
+        if k == len(chunks):
+            return None
+        row = int(_numpy().searchsorted(self._array(chunks[k])["sframe"], sframe))
+        return k, row
+
+    def frames(self, stream: int, session: int, lo: int = 0, hi: int | None = None):
+        """Records with lo <= sframe < hi, found by seek; one copy of just that range."""
+        np = _numpy()
+        parts = []
+        for c in self._chunks(stream, session):
+            if c.last < lo or (hi is not None and c.first >= hi):
+                continue
+            a = self._array(c)
+            parts.append(a[np.searchsorted(a["sframe"], lo):
+                           len(a) if hi is None else np.searchsorted(a["sframe"], hi)])
+        return np.concatenate(parts) if parts else np.empty(0, self.dtypes[stream])
+
+archive = None               # ArchiveWriter while a session is being recorded
+_archive_stop   = threading.Event()
+_archive_poller = None
+
+def _poll_archive(writer: ArchiveWriter):
+    # A reader of its own, so the shared feed's latest() isn't disturbed.
+    reader = TelemetryReader(state_feed.path) if isinstance(state_feed, TelemetryReader) else None
+    last = None
+    while not _archive_stop.is_set():
+        if reader is not None:
+            for st in reader.read_new():
+                writer.state(st)
+        elif state_feed is not None:
+            st = state_feed.latest()
+            if st is not None and st is not last:
+                writer.state(st)
+                last = st
+        time.sleep(ARCHIVE_POLL_S)
+    if reader is not None:
+        reader.close()
+
+def start_archive(path: str = ARCHIVE_PATH) -> ArchiveWriter:
+    """Start a session: play_schedule() logs reports, a thread logs telemetry frames."""
+    global archive, _archive_poller
+    archive = ArchiveWriter(path)
+    _archive_stop.clear()
+    _archive_poller = threading.Thread(target=_poll_archive, args=(archive,),
+                                       name="archive-poll", daemon=True)
+    _archive_poller.start()
+    return archive
+
+def stop_archive():
+    global archive
+    writer, archive = archive, None
+    if writer is not None:
+        _archive_stop.set()
+        _archive_poller.join()
+        writer.close()
+
+ArchiveSummary = namedtuple("ArchiveSummary", "session seconds states reports gaps hitstop_mean")
+
+def summarise_archive(path: str = ARCHIVE_PATH) -> list:
+    """Per session: length, record counts, telemetry gaps (skipped game frames) and
+    mean non-zero hitstop — computed a chunk at a time, never the whole file."""
+    np = _numpy()
+    reader = ArchiveReader(path)
+    out = []
+    try:
+        for session in reader.sessions():
+            states = gaps = stop_n = 0
+            stop_sum, prev, end = 0, None, 0.0
+            for a in reader.chunks(STREAM_STATE, session):
+                frames = a["frame"].astype(np.int64)
+                if prev is not None:
+                    frames = np.concatenate(([prev], frames))
+                gaps += int(np.count_nonzero(np.diff(frames) > 1))
+                prev, states = int(a["frame"][-1]), states + len(a)
+                hs = a["hitstop"][a["hitstop"] > 0]
+                stop_sum, stop_n = stop_sum + int(hs.sum()), stop_n + len(hs)
+                end = max(end, float(a["t"][-1]))
+            reports = 0
+            for a in reader.chunks(STREAM_REPORT, session):
+                reports += len(a)
+                end = max(end, float(a["t"][-1]))
+            out.append(ArchiveSummary(session, end, states, reports, gaps,
+                                      stop_sum / stop_n if stop_n else 0.0))
+    finally:
+        reader.close()
+    return out
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  TIMELINE LIBRARY  (packed binary, memory-mapped)
+# ══════════════════════════════════════════════════════════════════════════════
+# Compiled timelines stored as fixed 12-byte records so big libraries (generated
+# variants × characters) open without parsing and play straight out of the map.
+#
+#   header  "SF6L"  u16 version  u16 record_size  u32 count  u32 index_at  u32 records_at
+#   index   count × (48s name  u32 first  u32 length  f32 scale), sorted by name
+#   record  u32 frame  u16 buttons  i16 lx  i16 ly  u8 lt  u8 rt
+#
+# Names are "<char>/<slot>" for registry combos; anything else is free-form.
+
+LIBRARY_VERSION = 1
+
+_LIB_HEADER = struct.Struct("<4sHHIII")
+_LIB_INDEX  = struct.Struct("<48sIIf")
+_LIB_RECORD = struct.Struct("<IHhhBB")
+
+def write_library(path: str, entries):
+    """entries: iterable of (name, scale, timeline). Written sorted by name."""
+    entries = sorted(entries, key=lambda e: e[0].encode("utf-8"))
+    index_at   = _LIB_HEADER.size
+    records_at = index_at + len(entries) * _LIB_INDEX.size
+    with open(path, "wb") as fh:
+        fh.write(_LIB_HEADER.pack(b"SF6L", LIBRARY_VERSION, _LIB_RECORD.size,
+                                  len(entries), index_at, records_at))
+        first = 0
+        for name, scale, tl in entries:
+            fh.write(_LIB_INDEX.pack(name.encode("utf-8"), first, len(tl), scale))
+            first += len(tl)
+        for _name, _scale, tl in entries:
+            fh.write(b"".join(_LIB_RECORD.pack(fr, *st) for fr, st in tl))
+
+def build_library(path: str, chars=None):
+    """Compile the registry (at each combo's learned scale) into a library file."""
+    entries = []
+    for char in chars or CHARACTER_ORDER:
+        for combo in ALL_COMBOS[char]:
+            scale = combo_scale(char, combo["slot"])
+            entries.append((f"{char}/{combo['slot']}", scale, compile_combo(combo["fn"], scale=scale)))
+    write_library(path, entries)
+    return len(entries)
+
+class TimelineLibrary:
+    """Read-only view of a library file. Lookups binary-search the mapped index."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, ver, rec_size, self.count, self._index_at, self._records_at = \
+            _LIB_HEADER.unpack_from(self._mm, 0)
+        if magic != b"SF6L" or ver != LIBRARY_VERSION or rec_size != _LIB_RECORD.size:
+            self._mm.close()
+            raise ValueError(f"{path}: not a v{LIBRARY_VERSION} timeline library")
+        self._view = memoryview(self._mm)
+
+    def close(self):
+        self._view.release()
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _entry(self, i: int) -> tuple:
+        return _LIB_INDEX.unpack_from(self._mm, self._index_at + i * _LIB_INDEX.size)
+
+    def names(self):
+        for i in range(self.count):
+            yield self._entry(i)[0].rstrip(b"\0").decode("utf-8")
+
+    def find(self, name: str):
+        """(first, length, scale) for `name`, or None."""
+        key = name.encode("utf-8")[:48].ljust(48, b"\0")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            ent = self._entry(mid)
+            if ent[0] < key:
+                lo = mid + 1
+            elif ent[0] > key:
+                hi = mid
+            else:
+                return ent[1:]
+        return None
+
+    def get(self, name: str, scale: float | None = None) -> memoryview | None:
+        """Zero-copy view of the records for `name` (only if compiled at `scale`)."""
+        ent = self.find(name)
+        if ent is None:
+            return None
+        first, length, stored = ent
+        if scale is not None and abs(stored - scale) > 1e-4:
+            return None
+        at = self._records_at + first * _LIB_RECORD.size
+        return self._view[at:at + length * _LIB_RECORD.size]
+
+    def timeline(self, name: str) -> list | None:
+        view = self.get(name)
+        if view is None:
+            return None
+        return [(r[0], r[1:]) for r in _LIB_RECORD.iter_unpack(view)]
+
+def packed_schedule(view: memoryview, pad: int = 0):
+    """Adapt packed records to the (frame, changes) shape play_schedule walks."""
+    for fr, b, lx, ly, lt, rt in _LIB_RECORD.iter_unpack(view):
+        yield fr, ((pad, (b, lx, ly, lt, rt)),)
+
+combo_library = None     # TimelineLibrary consulted before compiling
+
+# ── Lua data module (one source of truth for both engines) ───────────────────
+# export_lua() compiles every registry combo at scale 1.0 and writes it in the
+# REFramework mod's own encoding (its BTN / DIR bits, stick X = forward/back
+# for P1), as change lists the mod expands into per-frame ok_key / ok_trg:
+#   return { _format = LUA_DATA_FORMAT,
+#            [char] = { [slot] = { label = "…", n = frames,
+#                                  at = {frame…}, key = {bits…}, trg = {bits…} } } }
+# Frames are 1-based; frame n is the final release. ok_trg holds the bits that
+# were not held on the previous frame. The mod ignores a file whose _format
+# differs from its own, so a stale export can't override its built-in combos.
+
+LUA_DATA_FORMAT = 2             # 2: diagonal stick states (down-forward etc.) exported
+LUA_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "V5 REFRAMEWORK", "sf6_combo_bot_data.lua")
+LUA_BTN   = {"LP": 0x001, "MP": 0x002, "HP": 0x004, "LK": 0x008, "MK": 0x010, "HK": 0x020,
+             "UP": 0x040, "DOWN": 0x080, "LEFT": 0x100, "RIGHT": 0x200,
+             "PARRY": 0x400, "DI": 0x800}
+LUA_NAMES = {"A.K.I.": "Aki"}            # registry name → the mod's name
+_LUA_PAD  = [(_BTN[n], LUA_BTN[n]) for n in ("LP", "MP", "HP", "LK", "MK")] + \
+            [(_BTN["LB"], LUA_BTN["DI"])]
+
+def lua_bits(state: tuple) -> int:
+    """XUSB state → the mod's ok_key bits."""
+    buttons, lx, ly, lt, rt = state
+    bits = 0
+    for pad_bit, lua_bit in _LUA_PAD:
+        if buttons & pad_bit:
+            bits |= lua_bit
+    if rt: bits |= LUA_BTN["HK"]
+    if lt: bits |= LUA_BTN["PARRY"]
+    if lx > 0: bits |= LUA_BTN["RIGHT"]
+    if lx < 0: bits |= LUA_BTN["LEFT"]
+    if ly > 0: bits |= LUA_BTN["UP"]
+    if ly < 0: bits |= LUA_BTN["DOWN"]
+    return bits
+
+def lua_table(timeline: list) -> tuple:
+    """Timeline → (n, at, key, trg) change lists, 1-based frames."""
+    at, key, trg, prev = [], [], [], 0
+    for frame, state in timeline:
+        bits = lua_bits(state)
+        if at and bits == prev:
+            continue
+        at.append(frame + 1); key.append(bits); trg.append(bits & ~prev)
+        prev = bits
+    return timeline[-1][0] + 1, at, key, trg
+
+def export_lua(path: str = LUA_DATA_PATH, chars=None) -> int:
+    """Write the registry as the mod's data module. Returns the combo count."""
+    def ints(xs):
+        return "{" + ", ".join(map(str, xs)) + "}"
+    out = ["-- Generated by combo_bot.py --export-lua from the Python combo definitions.",
+           "-- Do not edit: change the combo in combo_bot.py and regenerate.",
+           "return {",
+           f"    _format = {LUA_DATA_FORMAT},"]
+    count = 0
+    for char in chars or CHARACTER_ORDER:
+        out.append(f"    [{json.dumps(LUA_NAMES.get(char, char))}] = {{")
+        for combo in ALL_COMBOS[char]:
+            n, at, key, trg = lua_table(compile_combo(combo["fn"], scale=1.0))
+            out.append(f"        [{json.dumps(combo['slot'])}] = {{ "
+                       f"label = {json.dumps(combo['label'], ensure_ascii=False)}, n = {n},\n"
+                       f"            at  = {ints(at)},\n"
+                       f"            key = {ints(key)},\n"
+                       f"            trg = {ints(trg)} }},")
+            count += 1
+        out.append("    },")
+    out.append("}")
+    with open(path, "w", encoding="utf-8", newline="\n") as fh:
+        fh.write("\n".join(out) + "\n")
+    return count
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  ROUTE SEARCH  (frame data → generated combos)
+# ══════════════════════════════════════════════════════════════════════════════
+# Enumerates routes over a per-character frame-data table instead of writing
+# them by hand. A route is a move sequence where each step is legal from the
+# previous one:
+#   link    B.startup <= A.hit_adv                       "A > B"
+#   chain   B listed in A.chain (light chains / targets) "A > B"
+#   cancel  A cancellable normal → special/super,
+#           or super-cancellable special → super          "A xx B"
+#   juggle  special/super with B.startup <= A.launch      "A > juggle B"
+# Routes are scored with SF6 damage scaling and searched depth-first per
+# (character, slot, starter) in a process pool; a branch is cut as soon as its
+# best possible finish can't beat the current top-N. Frame data is approximate
+# — tune the rows, not the search.
+
+Move = namedtuple("Move", "name notation startup active recovery hit_adv damage "
+                          "drive sa cancel launch chain")
+
+def _mv(name, notation, startup, active, recovery, hit_adv, damage,
+        drive=0, sa=0, cancel=False, launch=0, chain=()):
+    return Move(name, notation, startup, active, recovery, hit_adv, damage,
+                drive, sa, cancel, launch, chain)
+
+# Shared normals — close enough across the cast for route shapes
+_NORMALS = [
+    #   name     notation startup act rec  adv  dmg
+    _mv("cr.LP", "cr.LP",  4, 2,  7,  4,  300, cancel=True, chain=("cr.LP", "st.LP")),
+    _mv("cr.LK", "cr.LK",  5, 2,  8,  4,  200, chain=("cr.LP",)),
+    _mv("st.LP", "st.LP",  4, 2,  7,  4,  300, cancel=True, chain=("cr.LP", "st.LP")),
+    _mv("cr.MP", "cr.MP",  6, 3, 10,  7,  600, cancel=True, chain=("st.HP",)),
+    _mv("st.MP", "st.MP",  6, 3, 12,  5,  600, cancel=True, chain=("st.HP",)),
+    _mv("cr.MK", "cr.MK",  8, 3, 17, -1,  500, cancel=True),
+    _mv("st.HP", "st.HP", 10, 3, 20,  1,  800, cancel=True),
+    _mv("cr.HP", "cr.HP",  8, 4, 22,  0,  900, cancel=True),
+]
+
+# Specials and supers from the character notes above. `cancel` on a special
+# means super-cancellable; `launch` is the juggle window it leaves. Supers that
+# need a held button (Shin Shoryuken, Final Strike…) are left out.
+FRAME_DATA = {
+    "Akuma": [
+        _mv("Gohadouken",            "236HP",      14, 2, 36,  -2,  700, cancel=True),
+        _mv("HP Goshoryuken",        "623HP",       4, 14, 30, -20, 1400, cancel=True),
+        _mv("Tatsumaki",             "214HK",       9, 10, 18,   1, 1100, cancel=True),
+        _mv("OD Goshoryuken",        "623LP+HP",    4, 14, 30, -20, 1300, drive=2, cancel=True, launch=22),
+        _mv("OD Tatsumaki",          "214LK+HK",    8, 12, 16,   2, 1200, drive=2, cancel=True, launch=20),
+        _mv("Messatsu-Goshoryuken",  "236236HP",    7, 8, 40,   0, 2400, sa=1),
+        _mv("Messatsu-Goshoryu",     "214214HP",    9, 6, 45,   0, 3300, sa=2),
+        _mv("Shin Shun Goku Satsu",  "214214LP+MP", 1, 3, 50,   0, 4500, sa=3),
+    ],
+    "Chun-Li": [
+        _mv("Kikoken",               "236HP",      13, 2, 32,  -2,  600, cancel=True),
+        _mv("Spinning Bird Kick",    "[4]6HK",     11, 20, 18, -3, 1200, cancel=True),
+        _mv("Hyakuretsukyaku",       "214HK",      10, 12, 20,  -2, 1100, cancel=True),
+        _mv("Hazan Shu",             "[2]8HK",     22, 3, 15,   2, 1000),
+        _mv("OD Spinning Bird Kick", "[4]6LK+HK",  10, 22, 16,  0, 1300, drive=2, cancel=True, launch=24),
+        _mv("Kikosho",               "236236HP",    7, 10, 40,  0, 2300, sa=1),
+        _mv("Hoyokusen",             "236236HK",    8, 5, 42,   0, 3200, sa=2),
+    ],
+    "Mai": [
+        _mv("Kachousen",             "236HP",      14, 2, 34,  -2,  700, cancel=True),
+        _mv("Ryuuenbu",              "214HK",      12, 10, 20,  -3, 1100, cancel=True),
+        _mv("OD Ryuuenbu",           "214MK+HK",   10, 12, 18,   0, 1200, drive=2, cancel=True, launch=22),
+        _mv("Hissatsu Shinobibachi", "236236HK",    8, 10, 40,   0, 2300, sa=1),
+        _mv("Sen'en Ryuuenbu",       "214214HK",   10, 8, 44,   0, 3300, sa=2),
+    ],
+    "Ken": [
+        _mv("Hadouken",              "236HP",      12, 2, 34,  -2,  600, cancel=True),
+        _mv("HP Shoryuken",          "623HP",       5, 12, 30, -20, 1400, cancel=True),
+        _mv("Tatsumaki",             "214HK",       9, 10, 18,   1, 1100, cancel=True),
+        _mv("Jinrai Kick",           "236MK",      13, 3, 18,   2,  900, cancel=True),
+        _mv("OD Shoryuken",          "623LP+HP",    5, 12, 30, -20, 1300, drive=2, cancel=True, launch=24),
+        _mv("Shinryuken",            "236236HP",    7, 8, 40,   0, 2500, sa=1),
+        _mv("Shippu Jinraikyaku",    "236236HK",    9, 6, 45,   0, 4000, sa=3),
+    ],
+    "Juri": [
+        _mv("Shiku-sen",             "236MK",      14, 4, 20,  -2,  900, cancel=True),
+        _mv("OD Shiku-sen",          "236MK+HK",   12, 4, 18,   0, 1100, drive=2, cancel=True, launch=20),
+        _mv("Feng Shui Engine",      "214214LK",    5, 2, 30,   0, 1000, sa=1),
+        _mv("Feng Shui Engine Omega","214214HK",    8, 6, 45,   0, 4000, sa=3),
+    ],
+    "Cammy": [
+        _mv("Spiral Arrow",          "236MK",      10, 14, 20,  -4,  900, cancel=True),
+        _mv("Spiral Arrow HK",       "236HK",      12, 18, 20,  -6, 1100, cancel=True),
+        _mv("Cannon Spike",          "623HK",       5, 12, 30, -20, 1300, cancel=True),
+        _mv("OD Spiral Arrow",       "236MK+HK",   10, 16, 18,   0, 1200, drive=2, cancel=True, launch=22),
+        _mv("OD Cannon Spike",       "623LK+HK",    5, 12, 30, -20, 1300, drive=2, cancel=True, launch=24),
+        _mv("Spin Drive Smasher",    "236236HK",    7, 8, 40,   0, 2500, sa=1),
+        _mv("Delta Red Assault",     "236236HP",    9, 6, 44,   0, 3300, sa=2),
+    ],
+    "Ryu": [
+        _mv("Hadouken",              "236HP",      12, 2, 34,  -2,  600, cancel=True),
+        _mv("HP Shoryuken",          "623HP",       5, 12, 30, -20, 1400, cancel=True),
+        _mv("Tatsumaki",             "214HK",       9, 10, 18,   1, 1100, cancel=True),
+        _mv("OD Shoryuken",          "623LP+HP",    5, 12, 30, -20, 1300, drive=2, cancel=True, launch=24),
+        _mv("Shin Hashogeki",        "236236HP",    8, 6, 40,   0, 2500, sa=1),
+    ],
+    "Ed": [
+        _mv("Psycho Spark",          "[4]6HP",     14, 2, 30,  -2,  700, cancel=True),
+        _mv("Psycho Blitz",          "[4]6MK",     12, 6, 20,  -2, 1000, cancel=True),
+        _mv("Psycho Upper",          "[2]8HP",      6, 10, 30, -20, 1300, cancel=True),
+        _mv("Flicker",               "236LP",       8, 3, 16,   1,  500, cancel=True),
+        _mv("OD Psycho Upper",       "[2]8LP+HP",   6, 10, 30, -20, 1200, drive=2, cancel=True, launch=22),
+        _mv("Psycho Cannon Barrage", "236236HP",    8, 10, 40,   0, 2400, sa=1),
+    ],
+    "JP": [
+        _mv("Amnesia Surge",         "236HP",      16, 4, 28,   0,  900, cancel=True),
+        _mv("Departure",             "623HK",      10, 6, 24,  -4, 1000, cancel=True),
+        _mv("OD Amnesia Surge",      "236LP+HP",   14, 4, 26,   0, 1000, drive=2, cancel=True, launch=24),
+        _mv("Interdiction",          "236236HP",   10, 6, 44,   0, 2600, sa=1),
+    ],
+    "Marisa": [
+        _mv("Gladius",               "236HP",      16, 4, 22,   2, 1300, cancel=True),
+        _mv("Dimachaerus",           "623HP",       6, 10, 32, -20, 1600, cancel=True),
+        _mv("OD Dimachaerus",        "623LP+HP",    6, 10, 30, -20, 1500, drive=2, cancel=True, launch=22),
+        _mv("Aether",                "236236HP",    9, 6, 44,   0, 2800, sa=1),
+    ],
+    "Luke": [
+        _mv("Flash Knuckle",         "[4]6MP",     14, 3, 20,   2, 1000, cancel=True),
+        _mv("Rising Uppercut",       "623HP",       5, 12, 30, -20, 1400, cancel=True),
+        _mv("Sand Blast",            "236HP",      14, 2, 34,  -2,  600, cancel=True),
+        _mv("OD Rising Uppercut",    "623LP+HP",    5, 12, 30, -20, 1300, drive=2, cancel=True, launch=24),
+        _mv("Vulcan Blast",          "236236HP",    7, 8, 40,   0, 2400, sa=1),
+    ],
+    "A.K.I.": [
+        _mv("Cruel Fate",            "236HP",      15, 4, 22,   1,  900, cancel=True),
+        _mv("Clinging Cobra",        "214HP",      18, 6, 24,  -2,  800, cancel=True),
+        _mv("Sinister Slide",        "236MK",      13, 8, 20,  -4,  800, cancel=True),
+        _mv("OD Cruel Fate",         "236LP+HP",   13, 4, 20,   0, 1000, drive=2, cancel=True, launch=24),
+        _mv("Coronation",            "236236HP",    8, 8, 42,   0, 2400, sa=1),
+        _mv("Serpent's Embrace",     "214214HP",   10, 6, 44,   0, 3200, sa=2),
+    ],
+    "M. Bison": [
+        _mv("Psycho Crusher",        "[4]6HP",     13, 20, 20, -4, 1200, cancel=True),
+        _mv("Scissors Kick",         "[4]6MK",     11, 10, 18,  -2, 1000, cancel=True),
+        _mv("OD Scissors Kick",      "[4]6MK+HK",  10, 12, 18,   0, 1200, drive=2, cancel=True, launch=24),
+        _mv("Knee Press Nightmare",  "236236HK",    8, 10, 40,   0, 2500, sa=1),
+        _mv("Psycho Punisher",       "236236HP",    9, 6, 46,   0, 4000, sa=3),
+    ],
+}
+
+# ── Scoring ───────────────────────────────────────────────────────────────────
+
+HIT_SCALING  = (100, 100, 80, 70, 60, 50, 40, 30, 20, 10)   # % by hit number
+LIGHT_PENALTY = 10                                          # light-starter extra
+SUPER_FLOOR  = {1: 30, 2: 40, 3: 50}                         # % floor per level
+OD_FLOOR     = 20                                           # % floor for OD moves
+SA_BAR       = 10000                                        # meter units per bar
+METER_GAIN   = {"normal": 300, "special": 600, "od": 300, "super": 0}
+
+def is_light(move: Move) -> bool:
+    return move.notation[:3] in ("cr.", "st.") and move.notation[-2:] in ("LP", "LK")
+
+def move_kind(move: Move) -> str:
+    if move.sa:
+        return "super"
+    if move.drive:
+        return "od"
+    return "normal" if move.notation[:3] in ("cr.", "st.") else "special"
+
+def move_floor(move: Move) -> int:
+    return SUPER_FLOOR.get(move.sa, OD_FLOOR if move.drive else 0)
+
+def _hit_scale(i: int, light: bool, floor: int = 0) -> int:
+    pct = HIT_SCALING[min(i, len(HIT_SCALING) - 1)]
+    if light and i:
+        pct = max(pct - LIGHT_PENALTY, HIT_SCALING[-1])
+    return max(pct, floor)
+
+def scaled_damage(moves) -> int:
+    """Total damage for a move sequence (one hit per move) after SF6 scaling."""
+    light = bool(moves) and is_light(moves[0])
+    return sum(m.damage * _hit_scale(i, light, move_floor(m)) // 100
+               for i, m in enumerate(moves))
+
+# ── Inputs ────────────────────────────────────────────────────────────────────
+# Notation → helper calls, plus how many frames the stick part takes so link and
+# cancel gaps can be placed from frame data.
+
+_MOTIONS = {
+    "":       ((), 0),
+    "236":    ((qcf,), 6),      "214":    ((qcb,), 6),
+    "623":    ((dp,), 6),       "421":    ((rdp,), 6),
+    "41236":  ((hcf,), 10),     "63214":  ((hcb,), 10),
+    "236236": ((qcf, qcf), 12), "214214": ((qcb, qcb), 12),
+}
+_NOTATION = re.compile(r"(\[\d\]\d|\d*)([LMH][PK](?:\+[LMH][PK])*)$")
+
+def _split_notation(notation: str) -> tuple:
+    """'623LP+HP' → ('623', ('LP', 'HP'))"""
+    m = _NOTATION.match(notation)
+    if m is None:
+        raise ValueError(f"bad notation {notation!r}")
+    return m.group(1), tuple(m.group(2).split("+"))
+
+def _input_frames(move: Move) -> tuple:
+    """(stick frames before the button, button frames)"""
+    if move.notation[:3] in ("cr.", "st."):
+        return (2 if move.notation[0] == "c" else 1), (2 if is_light(move) else 3)
+    stick, _ = _split_notation(move.notation)
+    if stick.startswith("["):
+        return 2, 3                 # charge is already held; just the release
+    return _MOTIONS[stick][1], 3
+
+def perform(move: Move, charge: str | None = None):
+    """
+    Input one move with the usual helpers. `charge` ("4" or "2") keeps that
+    direction held through a normal — cr. on 1 for a back charge. A charge
+    special only inputs its release: route_fn() holds the charge beforehand.
+    """
+    _, hold = _input_frames(move)
+    if move.notation[:3] in ("cr.", "st."):
+        crouch = move.notation[0] == "c"
+        if charge is None:
+            (cr if crouch else st)(move.notation[3:], frames=hold)
+        else:
+            motion(("1" if charge == "4" else "2") if crouch else charge, 2 if crouch else 1)
+            press_buttons(move.notation[3:], frames=hold)
+        return
+    stick, buttons = _split_notation(move.notation)
+    if stick.startswith("["):
+        motion(stick[3], 2)
+    else:
+        for fn in _MOTIONS[stick][0]:
+            fn()
+    press_buttons(*buttons, frames=hold)
+
+# ── Transition graph ──────────────────────────────────────────────────────────
+
+_JOINERS = {"link": " > ", "chain": " > ", "cancel": " xx ", "juggle": " > juggle "}
+_route_graphs = {}
+
+def _step_gap(a: Move, b: Move, kind: str) -> int:
+    """Frames to wait after a's button so b's button lands where `kind` needs it."""
+    if kind in ("link", "juggle"):
+        target = a.startup + a.active + a.recovery - 1   # a's first free frame
+    else:
+        target = a.startup + 2                           # inside a's hitstop
+    stick, hold = _input_frames(b)[0], _input_frames(a)[1]
+    return max(0, target - hold - stick)
+
+def _chargeable(moves: list, path: tuple, b: Move) -> bool:
+    """
+    Can `b`'s charge be held from before the starter through every step of
+    `path`? Only normals can hold it (a special's motion breaks it), and only
+    crouching ones hold down. So one charge special per route, after normals.
+    """
+    down = b.notation[1] == "2"
+    return all(moves[i].notation[:3] == "cr." or (moves[i].notation[:3] == "st." and not down)
+               for i in path)
+
+def _transition(a: Move, b: Move) -> str | None:
+    a_normal = a.notation[:3] in ("cr.", "st.")
+    b_normal = b.notation[:3] in ("cr.", "st.")
+    if a.sa:
+        return None                                   # supers end the route
+    if a_normal and b_normal:
+        if b.name in a.chain:
+            return "chain"
+        return "link" if b.startup <= a.hit_adv else None
+    if a_normal:
+        return "cancel" if a.cancel else None
+    if b.sa and a.cancel:
+        return "cancel"
+    if not b_normal and a.launch and b.startup <= a.launch:
+        return "juggle"
+    return None
+
+def route_graph(char: str) -> tuple:
+    """(moves, edges) for `char`; edges[i] maps j → (kind, gap_frames)."""
+    graph = _route_graphs.get(char)
+    if graph is None:
+        moves = _NORMALS + FRAME_DATA[char]
+        edges = []
+        for a in moves:
+            out = {}
+            for j, b in enumerate(moves):
+                kind = _transition(a, b)
+                if kind:
+                    out[j] = (kind, _step_gap(a, b, kind))
+            edges.append(out)
+        graph = _route_graphs[char] = (moves, edges)
+    return graph
+
+# ── Search ────────────────────────────────────────────────────────────────────
+
+Route = namedtuple("Route", "char slot damage drive sa path")
+
+ROUTE_SLOTS   = ["F1", "F2", "F3", "F4", "F5", "ADV"]
+SLOT_STARTERS = {"F2": True, "F3": False}        # light-only / no lights
+ROUTE_MAX_LEN = 6
+MAX_REPEAT    = 2                                # same normal at most twice
+
+def _starters(char: str, slot: str) -> list:
+    moves, _ = route_graph(char)
+    want = SLOT_STARTERS.get(slot)
+    return [i for i, m in enumerate(moves)
+            if m.notation[:3] in ("cr.", "st.") and (want is None or is_light(m) == want)]
+
+def _search_task(task: tuple) -> tuple:
+    """One process-pool unit: best routes for (char, slot) from one starter."""
+    char, slot, start, top_n, max_len = task
+    moves, edges = route_graph(char)
+    max_drive, max_sa, _res = route_cost(char, slot)
+    light = is_light(moves[start])
+    top_dmg = max(m.damage for m in moves)
+    best = []                                     # min-heap of (damage, path)
+
+    def bound(n: int) -> int:
+        return sum(top_dmg * _hit_scale(i, light, SUPER_FLOOR[3]) // 100
+                   for i in range(n, max_len))
+
+    def visit(path, dmg, drive, sa, juggled):
+        if len(path) >= 2 and (drive or not max_drive) and (sa or not max_sa):
+            item = (dmg, path)
+            if len(best) < top_n:
+                heapq.heappush(best, item)
+            elif item > best[0]:
+                heapq.heapreplace(best, item)
+        if len(path) == max_len:
+            return
+        if len(best) == top_n and dmg + bound(len(path)) <= best[0][0]:
+            return                                # can't reach the top-N
+        for j, (kind, _gap) in edges[path[-1]].items():
+            m = moves[j]
+            if drive + m.drive > max_drive or (m.sa and (sa or m.sa > max_sa)):
+                continue
+            if kind == "juggle" and juggled:
+                continue
+            if m.notation[0] == "[" and not _chargeable(moves, path, m):
+                continue
+            limit = MAX_REPEAT if m.notation[:3] in ("cr.", "st.") else 1
+            if path.count(j) >= limit:
+                continue
+            hit = m.damage * _hit_scale(len(path), light, move_floor(m)) // 100
+            visit(path + (j,), dmg + hit, drive + m.drive, sa or m.sa,
+                  juggled or kind == "juggle")
+
+    visit((start,), moves[start].damage, 0, 0, False)
+    found = []
+    for dmg, path in best:
+        found.append(Route(char, slot, dmg, sum(moves[i].drive for i in path),
+                           max(moves[i].sa for i in path), path))
+    return char, slot, found
+
+def search_routes(chars=None, slots=None, top_n: int = 3,
+                  max_len: int = ROUTE_MAX_LEN, workers: int | None = None) -> dict:
+    """
+    Best `top_n` routes per (char, slot), highest damage first. Starters are
+    searched in parallel; workers=0 runs everything in this process.
+    """
+    tasks = [(char, slot, start, top_n, max_len)
+             for char in chars or CHARACTER_ORDER
+             for slot in slots or ROUTE_SLOTS
+             for start in _starters(char, slot)]
+    if workers == 0:
+        results = map(_search_task, tasks)
+    else:
+        from concurrent.futures import ProcessPoolExecutor   # only the search pays for it
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(_search_task, tasks, chunksize=max(1, len(tasks) // 64))
+    merged = {}
+    try:
+        for char, slot, found in results:
+            merged.setdefault((char, slot), []).extend(found)
+    finally:
+        if workers != 0:
+            pool.shutdown()
+    return {key: sorted(routes, key=lambda r: (-r.damage, r.path))[:top_n]
+            for key, routes in merged.items()}
+
+# ── Output ────────────────────────────────────────────────────────────────────
+
+def route_label(route: Route) -> str:
+    moves, edges = route_graph(route.char)
+    text = moves[route.path[0]].name
+    for a, b in zip(route.path, route.path[1:]):
+        text += _JOINERS[edges[a][b][0]] + moves[b].name
+    return text
+
+def route_fn(route: Route):
+    """Helper-call combo for a route — compiles like any hand-written one."""
+    moves, edges = route_graph(route.char)
+    steps = [(moves[route.path[0]], 0)]
+    steps += [(moves[b], edges[a][b][1]) for a, b in zip(route.path, route.path[1:])]
+    held = next((i for i, (m, _gap) in enumerate(steps) if m.notation[0] == "["), None)
+    charge = None if held is None else steps[held][0].notation[1]
+
+    def run():
+        if held is not None:        # the whole charge up front; charge_schedule() trims it
+            stick, buttons = _split_notation(steps[held][0].notation)
+            hold_charge(charge, charge_time(stick, buttons))
+        for i, (move, gap) in enumerate(steps):
+            if gap:
+                _sleep(f(gap))
+            perform(move, charge if held is not None and i < held else None)
+        neutral()
+    run.__name__ = f"route_{route.slot}_{'_'.join(map(str, route.path))}"
+    run.__doc__ = f"{route_label(route)} — searched, {route.damage} dmg."
+    return run
+
+def route_entries(found: dict) -> dict:
+    """Registry entries per character; slots are "<slot>#<rank>"."""
+    entries = {}
+    for (char, slot), routes in found.items():
+        for rank, route in enumerate(routes, 1):
+            entries.setdefault(char, []).append(
+                _entry(route_fn(route), f"Route — {route_label(route)} ({route.damage})",
+                       f"{slot}#{rank}"))
+    return entries
+
+def register_routes(found: dict) -> int:
+    """Append searched routes to ALL_COMBOS. Returns how many were added."""
+    added = 0
+    for char, entries in route_entries(found).items():
+        ALL_COMBOS[char].extend(entries)
+        added += len(entries)
+    return added
+
+def compile_routes(found: dict) -> list:
+    """[(name, scale, timeline)] for write_library(); names are "<char>/<slot>#<rank>"."""
+    out = []
+    for char, entries in route_entries(found).items():
+        for e in entries:
+            scale = combo_scale(char, e["slot"].split("#")[0])
+            out.append((f"{char}/{e['slot']}", scale, compile_combo(e["fn"], scale=scale)))
+    return out
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  COMBO RATINGS  (damage / Drive / meter for the whole library, NumPy)
+# ══════════════════════════════════════════════════════════════════════════════
+# Hand-written combos only exist as helper calls, so their hits are read back
+# from the compiled timeline: every new button press is matched against the
+# character's FRAME_DATA by the stick path since the previous press (motion
+# suffix, charge held beforehand, or crouch/stand for normals). All recognised
+# sequences are then padded into one (combos × hits) index matrix and scaled,
+# summed and costed in a single vectorised pass with the same rules as
+# scaled_damage().
+
+Rating = namedtuple("Rating", "damage drive meter hits")
+
+_CHARGE_PATHS = [("[4]6", (1, 4, 7), 6), ("[2]8", (1, 2, 3), 8)]
+
+def _digit(lx: int, ly: int) -> int:
+    return 5 + (lx > 0) - (lx < 0) + 3 * ((ly > 0) - (ly < 0))
+
+def _stick_path(timeline) -> tuple:
+    """Collapsed non-neutral stick directions, e.g. qcf() → (2, 6)."""
+    path = []
+    for _frame, state in timeline:
+        d = _digit(state[1], state[2])
+        if d != 5 and (not path or path[-1] != d):
+            path.append(d)
+    return tuple(path)
+
+_motion_paths = None
+
+def motion_paths() -> list:
+    """(notation prefix, stick path) per motion, exactly as the helpers emit it."""
+    global _motion_paths
+    if _motion_paths is None:
+        paths = [(pre, _stick_path(compile_combo(lambda fns=fns: [fn() for fn in fns])))
+                 for pre, (fns, _frames) in _MOTIONS.items() if fns]
+        _motion_paths = sorted(paths, key=lambda p: -len(p[1]))
+    return _motion_paths
+
+def _pressed(prev: tuple, state: tuple) -> tuple:
+    names = [n for n in ("LP", "MP", "HP", "LK", "MK")
+             if state[0] & int(_BTN[n]) and not prev[0] & int(_BTN[n])]
+    if state[4] and not prev[4]:
+        names.append("HK")
+    return tuple(names)
+
+def _charged(segments: list, dirs: tuple, frame: int) -> bool:
+    return any(d in dirs and end - start >= CHARGE_MIN and frame - end <= CHARGE_MEMORY
+               for start, end, d in segments)
+
+def recognise_moves(char: str, timeline: list) -> list:
+    """Indices into route_graph(char)[0] for each press in a compiled timeline."""
+    moves, _ = route_graph(char)
+    by_notation = {m.notation: i for i, m in enumerate(moves)}
+    found, path, segments = [], [], []     # segments: (start, end, digit)
+    prev = NEUTRAL_STATE
+    for frame, state in timeline:
+        d = _digit(state[1], state[2])
+        if not segments or segments[-1][2] != d:
+            if segments:
+                segments[-1] = segments[-1][:1] + (frame,) + segments[-1][2:]
+            segments.append((frame, frame, d))
+            if d != 5 and (not path or path[-1] != d):
+                path.append(d)
+        buttons = _pressed(prev, state)
+        prev = state
+        if not buttons:
+            continue
+        segments[-1] = (segments[-1][0], frame, d)
+        key = "+".join(buttons)
+        tail = tuple(path)
+        candidates = [pre for pre, p in motion_paths() if tail[-len(p):] == p]
+        candidates += [pre for pre, dirs, to in _CHARGE_PATHS
+                       if d == to and _charged(segments[:-1], dirs, frame)]
+        candidates.append(("cr." if d in (1, 2, 3) else "st."))
+        for pre in candidates:
+            i = by_notation.get(pre + key)
+            if i is not None:
+                found.append(i)
+                break
+        path = [d] if d != 5 else []
+    return found
+
+_rating_table = None
+
+def _numpy():
+    """NumPy, imported on first use — None when it isn't installed."""
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+    return np
+
+def rating_table():
+    """(structured array of every character's moves, {char: first row})"""
+    global _rating_table
+    if _rating_table is None:
+        if _numpy() is None:
+            raise RuntimeError("combo ratings need NumPy (pip install numpy)")
+        rows, offsets = [], {}
+        for char in FRAME_DATA:
+            offsets[char] = len(rows)
+            rows += [(m.damage, m.drive, METER_GAIN[move_kind(m)], move_floor(m), is_light(m))
+                     for m in route_graph(char)[0]]
+        dtype = [("damage", "i4"), ("drive", "i4"), ("meter", "i4"),
+                 ("floor", "i4"), ("light", "?")]
+        _rating_table = (np.array(rows, dtype=dtype), offsets)
+    return _rating_table
+
+def rate_timelines(items) -> list:
+    """items: [(char, timeline)] → [Rating], scored in one vectorised pass."""
+    table, offsets = rating_table()
+    seqs = [[offsets[char] + i for i in recognise_moves(char, tl)] for char, tl in items]
+    width = max(map(len, seqs), default=0) or 1
+    idx = np.full((len(seqs), width), -1, dtype=np.int32)
+    for row, seq in enumerate(seqs):
+        idx[row, :len(seq)] = seq
+    valid = idx >= 0
+    rows = table[np.where(valid, idx, 0)]
+
+    hit = np.arange(width)
+    pct = np.asarray(HIT_SCALING)[np.minimum(hit, len(HIT_SCALING) - 1)]
+    pct = np.broadcast_to(pct, idx.shape)
+    light = (rows["light"][:, 0] & valid[:, 0])[:, None] & (hit > 0)
+    pct = np.where(light, np.maximum(pct - LIGHT_PENALTY, HIT_SCALING[-1]), pct)
+    pct = np.maximum(pct, rows["floor"])
+
+    damage = np.where(valid, rows["damage"] * pct // 100, 0).sum(axis=1)
+    drive  = np.where(valid, rows["drive"], 0).sum(axis=1)
+    meter  = np.where(valid, rows["meter"], 0).sum(axis=1)
+    return [Rating(*map(int, r)) for r in zip(damage, drive, meter, valid.sum(axis=1))]
+
+def combo_ratings(chars=None) -> dict:
+    """{(char, slot): Rating} for the registry (library timelines when loaded)."""
+    if _numpy() is None:
+        return {}
+    keys, items = [], []
+    for char in chars or CHARACTER_ORDER:
+        if char not in FRAME_DATA:
+            continue
+        for combo in ALL_COMBOS[char]:
+            tl = combo_library.timeline(f"{char}/{combo['slot']}") if combo_library else None
+            keys.append((char, combo["slot"]))
+            items.append((char, tl or get_timeline(combo["fn"], scale=1.0)))
+    return dict(zip(keys, rate_timelines(items))) if items else {}
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  EXECUTION ENGINE
@@ -1152,64 +2982,340 @@ _executing  = False
 log_cb      = None
 char_cb     = None
 progress_cb = None   # called with (slot_index) when a combo starts
+state_feed  = None   # TelemetryReader / ReplayFeed — anything with latest()
 
 def get_current_char() -> str:
     return CHARACTER_ORDER[current_char_index]
 
-def _run_combo(combo_info: dict):
+def _wait_until(deadline: float):
+    """Sleep until a perf_counter deadline, checking the cancel flag."""
+    if trace_on: trace(TR_WAIT_B)
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            if trace_on: trace(TR_WAIT_E)
+            return
+        if _cancel_flag.is_set():
+            if trace_on: trace(TR_WAIT_E); trace(TR_CANCEL)
+            raise InterruptedError("Combo cancelled")
+        if remaining > 0.002:
+            time.sleep(0.001)
+
+def _apply_state(pad, state: tuple):
+    r = pad.report
+    r.wButtons, r.sThumbLX, r.sThumbLY, r.bLeftTrigger, r.bRightTrigger = state
+
+def _release_pads(pads):
+    """Send a neutral report on every live pad (used after cancel)."""
+    for idx, pad in enumerate(pads):
+        if pad is None:
+            continue
+        try:
+            _apply_state(pad, NEUTRAL_STATE)
+            pad.update()
+            if archive is not None:
+                archive.report(idx, NEUTRAL_STATE)
+        except Exception:
+            pass
+
+# ── Output latency lead ───────────────────────────────────────────────────────
+# Every pad.update() is timed and folded into a rolling average. Each frame's
+# reports are then sent that much early (× the number of pads flushed), so they
+# finish arriving at the compiled deadline instead of one flush after it.
+
+LEAD_ALPHA   = 0.1       # EWMA weight of the newest flush sample
+flush_cost   = 0.0       # rolling estimate of one pad.update(), seconds
+lead_enabled = True
+
+def _flush(pad, idx: int = 0):
+    global flush_cost
+    if trace_on: trace(TR_FLUSH_B, idx)
+    t0 = time.perf_counter()
+    pad.update()
+    flush_cost += LEAD_ALPHA * ((time.perf_counter() - t0) - flush_cost)
+    if trace_on: trace(TR_FLUSH_E, idx)
+
+def current_lead() -> float:
+    """Lead applied to a single-pad frame right now (seconds)."""
+    return flush_cost if lead_enabled else 0.0
+
+FlushStats = namedtuple("FlushStats", "what n mean_us p99_us max_us")
+
+def _flush_stats(what: str, samples) -> FlushStats:
+    us = sorted(t * 1e6 for t in samples)
+    return FlushStats(what, len(us), sum(us) / len(us), us[min(len(us) - 1, int(len(us) * 0.99))],
+                      us[-1])
+
+def bench_flush(frames: int = 600) -> list:
+    """
+    Flush `frames` alternating reports (a button, the stick and a trigger
+    changing every frame) through _flush() on the live pad, one per frame.
+    Returns FlushStats for the whole update() and, on uinput, for the
+    write() syscall alone — the same numbers on ViGEm and uinput rigs.
+    """
+    a = (_BTN["LP"], STICK_MAX, STICK_MIN, 0, 255)
+    times = []
+    if isinstance(gamepad, UInputGamepad):
+        gamepad.write_times.clear()
+    start = time.perf_counter()
+    for k in range(frames):
+        _wait_until(start + k * FRAME_S)
+        _apply_state(gamepad, a if k % 2 == 0 else NEUTRAL_STATE)
+        t0 = time.perf_counter()
+        _flush(gamepad)
+        times.append(time.perf_counter() - t0)
+    _release_pads([gamepad])
+    out = [_flush_stats(f"{PAD_BACKEND} update()", times)]
+    if isinstance(gamepad, UInputGamepad) and gamepad.write_times:
+        out.append(_flush_stats("uinput write()", list(gamepad.write_times)[-frames:]))
+    return out
+
+def play_schedule(schedule: list, pads, start: float | None = None, base: int = 0,
+                  lates: list | None = None) -> float:
+    """
+    Play a merged schedule against absolute per-frame deadlines, frame 0
+    being `base` frames after `start`. Returns the worst lateness in seconds,
+    measured when the frame's last report has been handed to the driver;
+    every frame's lateness is appended to `lates` when given.
+    """
+    if getattr(_tuned, "gen", -1) != _tune_gen:
+        tune_thread()
+    worst = 0.0
+    if start is None:
+        start = time.perf_counter()
+    for frame, changes in schedule:
+        deadline = start + (base + frame) * FRAME_S
+        if trace_on: trace(TR_STEP, base + frame)
+        _wait_until(deadline - current_lead() * len(changes))
+        for idx, state in changes:
+            pad = pads[idx]
+            _apply_state(pad, state)
+            _flush(pad, idx)
+            if archive is not None:
+                archive.report(idx, state)
+        late = time.perf_counter() - deadline
+        if trace_on: trace(TR_LATE, int(late * 1e6))
+        if lates is not None:
+            lates.append(late)
+        if late > worst:
+            worst = late
+    return worst
+
+def _feed_state():
+    st = state_feed.latest() if state_feed else None
+    return st if st is not None and st.valid else None
+
+def play_graph(graph, pads, taken: list | None = None, lates: list | None = None) -> float:
+    """
+    Play a compiled hit-confirm graph on one clock. At each branch frame the
+    only work is reading the feed and picking the next precompiled schedule,
+    whose first report goes out on that same frame. Branches taken are
+    appended to `taken` as "hit" / "miss"; per-frame lateness to `lates`.
+    """
+    start  = time.perf_counter()
+    before = _feed_state()
+    base   = 0
+    worst  = 0.0
+    node   = graph
+    while node is not None:
+        schedule, at, cond, hit, miss = node
+        worst = max(worst, play_schedule(schedule, pads, start, base, lates))
+        if cond is None:
+            break
+        base += at
+        _wait_until(start + base * FRAME_S)
+        now = _feed_state()
+        ok  = cond(before, now) if before and now else CONFIRM_DEFAULT
+        if taken is not None: taken.append("hit" if ok else "miss")
+        node = hit if ok else miss
+    return worst
+
+# ── Meter / stock aware route selection ───────────────────────────────────────
+# Each slot has a fallback chain ending in a free route. For every character
+# and slot, a table indexed by (drive bars, super level, stock) holds the
+# first affordable entry of the chain, so a key press is a single lookup.
+
+DRIVE_BAR = 10000                 # drive_val units per bar (6 bars = 60000)
+SLOT_KEYS = ["F1", "F2", "F3", "F4", "F5"]
+
+FALLBACK_CHAINS = {
+    "F1":  ("F1", "F2"),
+    "F2":  ("F2",),
+    "F3":  ("F3", "F2"),
+    "F4":  ("F4", "F3", "F2"),
+    "F5":  ("F5", "F1", "F2"),
+    "ADV": ("ADV", "F4", "F3", "F2"),
+}
+
+# (drive bars, super level, stock) — OD specials cost 2 bars
+_SLOT_COSTS = {"F4": (2, 0, 0), "F5": (0, 1, 0)}
+_ADV_COSTS  = {
+    "Akuma": (2, 0, 0), "Chun-Li": (2, 2, 0), "Mai": (2, 2, 0), "Ken": (2, 1, 0),
+    "Juri": (2, 3, 1), "Cammy": (2, 2, 0), "Ryu": (2, 3, 0), "Ed": (0, 1, 0),
+    "JP": (2, 1, 0), "Marisa": (2, 3, 0), "Luke": (2, 1, 0), "A.K.I.": (2, 1, 0),
+    "M. Bison": (2, 1, 0),
+}
+_COST_OVERRIDES = {"Juri": {"F1": (0, 0, 1), "F3": (0, 0, 1), "F4": (2, 0, 1)}}   # Fuha release
+
+def route_cost(char: str, slot: str) -> tuple:
+    over = _COST_OVERRIDES.get(char, {})
+    if slot in over:
+        return over[slot]
+    if slot == "ADV":
+        return _ADV_COSTS.get(char, (0, 0, 0))
+    return _SLOT_COSTS.get(slot, (0, 0, 0))
+
+def _route_index(bars: int, sa: int, res: int) -> int:
+    return (min(max(bars, 0), 6) * 4 + min(max(sa, 0), 3)) * 2 + min(max(res, 0), 1)
+
+def _build_route_table(char: str, slot: str) -> list:
+    table = [None] * _route_index(6, 3, 1) + [None]
+    for bars in range(7):
+        for sa in range(4):
+            for res in range(2):
+                for s in FALLBACK_CHAINS[slot]:
+                    d, lv, k = route_cost(char, s)
+                    combo = _find_combo(char, s)
+                    if combo and bars >= d and sa >= lv and res >= k:
+                        table[_route_index(bars, sa, res)] = combo
+                        break
+    return table
+
+_route_tables = {}     # char → {slot: table}, built by prewarm() or on first use
+
+def route_tables(char: str) -> dict:
+    tables = _route_tables.get(char)
+    if tables is None:
+        tables = _route_tables[char] = {slot: _build_route_table(char, slot)
+                                        for slot in FALLBACK_CHAINS}
+    return tables
+
+def select_route(char: str, slot: str, state) -> dict | None:
+    """Best affordable route for `slot` right now; without a feed, the slot itself."""
+    if state is None:
+        return _find_combo(char, slot)
+    return route_tables(char)[slot][_route_index(state.drive // DRIVE_BAR,
+                                                 state.super_lvl, state.res)]
+
+def _run_combo(combo_info: dict, char: str | None = None) -> float | None:
+    """Play one registry entry. Returns the worst lateness, or None if it didn't finish."""
     global _executing
     _cancel_flag.clear()
+    late = None
     with combo_lock:
         _executing = True
-        char  = get_current_char()
+        char  = char or get_current_char()
         label = combo_info["label"]
         slot  = combo_info["slot"]
         if log_cb: log_cb(f"▶ [{char}] {label}")
         if progress_cb: progress_cb(slot)
+        if trace_on: trace(TR_COMBO_B, _slot_index(slot))
+        taken, lates, status = [], [], "error"
+        scale = combo_scale(char, slot)
         try:
-            combo_info["fn"]()
-            if log_cb: log_cb("✓ Complete")
+            view  = (combo_library.get(f"{char}/{slot}", scale)
+                     if combo_library and not combo_info.get("recorded") else None)
+            if combo_info["graph"] is not None:
+                late = play_graph(get_graph(combo_info["graph"], scale), _pads, taken, lates)
+            elif view is not None:
+                late = play_schedule(packed_schedule(view), _pads, lates=lates)
+            else:
+                late = play_schedule(get_schedule(combo_info["fn"], scale), _pads, lates=lates)
+            status = "ok"
+            path = f"  [{' > '.join(taken)}]" if taken else ""
+            if log_cb: log_cb(f"✓ Complete{path}  (worst lateness {late*1000:.1f} ms)")
         except InterruptedError:
+            status = "cancelled"
             if log_cb: log_cb("⊘ Cancelled")
-            # Release all inputs cleanly
-            try:
-                _release_raw("LP","MP","HP","LK","MK","HK","LT","LB","RB")
-                neutral(2)
-            except Exception:
-                pass
+            _release_pads(_pads)    # release all inputs cleanly
         except Exception as e:
             if log_cb: log_cb(f"✗ Error: {e}")
         finally:
+            if trace_on: trace(TR_COMBO_E, _slot_index(slot))
+            if run_stats:
+                run_stats.record(char, slot, scale, status, lates, _feed_state() is not None)
             _executing = False
             if progress_cb: progress_cb(None)
+    return late
 
-def fire_slot(slot_index: int):
+def _slot_index(slot: str) -> int:
+    """F1-F5 → 0-4, ADV → 5, anything else (searched routes…) → -1."""
+    keys = SLOT_KEYS + ["ADV"]
+    return keys.index(slot) if slot in keys else -1
+
+def _fire(slot: str):
+    if trace_on: trace(TR_HOTKEY, _slot_index(slot))
     if _executing:
         return
-    char   = get_current_char()
-    combos = [c for c in ALL_COMBOS[char] if c["slot"] != "ADV"]
-    if slot_index < len(combos):
-        threading.Thread(target=_run_combo, args=(combos[slot_index],), daemon=True).start()
+    char  = get_current_char()
+    combo = select_route(char, slot, _feed_state())
+    if combo is None:
+        if log_cb: log_cb(f"✗ [{char}] {slot}: no affordable route")
+        return
+    if combo["slot"] != slot and log_cb:
+        log_cb(f"↪ {slot} not affordable → {combo['slot']}")
+    threading.Thread(target=_run_combo, args=(combo,), daemon=True).start()
+
+def fire_slot(slot_index: int):
+    if slot_index < len(SLOT_KEYS):
+        _fire(SLOT_KEYS[slot_index])
 
 def fire_advanced():
-    if _executing:
-        return
-    char   = get_current_char()
-    combos = [c for c in ALL_COMBOS[char] if c["slot"] == "ADV"]
-    if combos:
-        threading.Thread(target=_run_combo, args=(combos[0],), daemon=True).start()
+    _fire("ADV")
 
 def cancel_combo():
     _cancel_flag.set()
 
-def cycle_character(direction: int = 1):
+def prewarm(char: str):
+    """Compile every schedule and graph for `char` so its first combo pays nothing."""
+    route_tables(char)
+    for combo in ALL_COMBOS[char]:
+        scale = combo_scale(char, combo["slot"])
+        get_schedule(combo["fn"], scale)
+        if combo["graph"] is not None:
+            get_graph(combo["graph"], scale)
+
+def prewarm_async(char: str):
+    def run():
+        start = time.perf_counter()
+        prewarm(char)
+        mark_phase(f"bg: prewarm {char}", since=start)
+    threading.Thread(target=run, daemon=True).start()
+
+def set_character(char: str, prefix: str = "◈ →"):
     global current_char_index
-    current_char_index = (current_char_index + direction) % len(CHARACTER_ORDER)
-    char = get_current_char()
-    if log_cb:  log_cb(f"◈ → {char}")
+    current_char_index = CHARACTER_ORDER.index(char)
+    prewarm_async(char)
+    if log_cb:  log_cb(f"{prefix} {char}")
     if char_cb: char_cb(char)
 
+def cycle_character(direction: int = 1):
+    set_character(CHARACTER_ORDER[(current_char_index + direction) % len(CHARACTER_ORDER)])
+
+# ── Character auto-detect ─────────────────────────────────────────────────────
+# Follows chara_id from the state feed. A switch happens on the character
+# select → loading transition, so prewarm() finishes well before round start.
+
+auto_detect = True
+
+def _watch_character(poll: float = 0.05):
+    last = None
+    while True:
+        st  = _feed_state() if auto_detect else None
+        cid = st.chara_id if st else None
+        if cid != last:
+            last = cid
+            char = CHARA_ID_MAP.get(cid)
+            if char and char != get_current_char():
+                set_character(char, "◈ Auto-detected →")
+        time.sleep(poll)
+
+def start_auto_detect():
+    threading.Thread(target=_watch_character, daemon=True).start()
+
 def register_hotkeys():
+    global keyboard
+    import keyboard
     for i, key in enumerate(["F1","F2","F3","F4","F5"]):
         keyboard.add_hotkey(key, lambda idx=i: fire_slot(idx))
     keyboard.add_hotkey("F6",      lambda: cycle_character(+1))
@@ -1218,6 +3324,1203 @@ def register_hotkeys():
     keyboard.add_hotkey("escape",  lambda: cancel_combo())
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+#  EXECUTOR TUNING  (priority, CPU affinity, timer resolution / slack)
+# ══════════════════════════════════════════════════════════════════════════════
+# Playback is only as accurate as the OS is at waking the playback thread.
+# tune_thread() applies the thread-level settings; play_schedule() calls it the
+# first time a thread plays after the settings change, so combo, playlist,
+# training and daemon threads are all covered. tune_process() does the
+# process-wide part once and moves the calling (main) thread off the playback
+# core — the GUI, and on Linux the keyboard hook threads it starts, follow it.
+#
+#   cpu       core for playback threads (None = left to the OS)
+#   priority  "normal" | "high" | "realtime"  (SCHED_FIFO / TIME_CRITICAL need
+#             privileges; a refusal is reported, never fatal)
+#   timer_ms  Windows timer resolution, timeBeginPeriod (None = system default)
+#   slack_us  Linux timer slack of playback threads, prctl (None = default 50 µs)
+#
+# measure_jitter() times _wait_until() against per-frame deadlines on a fresh
+# thread under one configuration; jitter_report() measures the baseline, each
+# setting on its own and all of them together.
+
+ExecSettings = namedtuple("ExecSettings", "cpu priority timer_ms slack_us",
+                          defaults=(None, "normal", None, None))
+Jitter       = namedtuple("Jitter", "label mean_us p99_us max_us notes")
+
+JITTER_FRAMES = 300
+RT_PRIORITY   = 50                       # SCHED_FIFO priority for "realtime"
+_WIN_THREAD_PRIORITY = {"high": 2, "realtime": 15}            # HIGHEST, TIME_CRITICAL
+_WIN_PROCESS_CLASS   = {"high": 0x80, "realtime": 0x100}
+
+exec_settings = ExecSettings()
+_tune_gen     = 0
+_tuned        = threading.local()        # .gen = _tune_gen the thread was tuned for
+_timer_period = None                     # active timeBeginPeriod value
+
+def _kernel32():
+    import ctypes
+    return ctypes.windll.kernel32
+
+def _win_check(ok):
+    if not ok:
+        import ctypes
+        raise ctypes.WinError()
+
+def _pin_thread(cpus: set):
+    """Restrict the calling thread to `cpus`."""
+    if sys.platform == "win32":
+        k = _kernel32()
+        _win_check(k.SetThreadAffinityMask(k.GetCurrentThread(), sum(1 << c for c in cpus)))
+    else:
+        os.sched_setaffinity(0, cpus)
+
+def _raise_thread_priority(level: str):
+    if sys.platform == "win32":
+        k = _kernel32()
+        _win_check(k.SetThreadPriority(k.GetCurrentThread(), _WIN_THREAD_PRIORITY[level]))
+    elif level == "realtime":
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(RT_PRIORITY))
+    else:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), -10)
+
+def _set_timer_slack(us: int):
+    if not sys.platform.startswith("linux"):
+        raise OSError("Linux only")
+    import ctypes
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.prctl(29, int(us * 1000), 0, 0, 0):             # PR_SET_TIMERSLACK
+        raise OSError(ctypes.get_errno(), "prctl(PR_SET_TIMERSLACK) failed")
+
+def _set_timer_resolution(ms: int | None):
+    """timeBeginPeriod(ms), replacing the previous request; None ends it."""
+    global _timer_period
+    if ms is not None and sys.platform != "win32":
+        raise OSError("Windows only")
+    if _timer_period is not None:
+        import ctypes
+        ctypes.windll.winmm.timeEndPeriod(_timer_period)
+        _timer_period = None
+    if ms is not None:
+        import ctypes
+        if ctypes.windll.winmm.timeBeginPeriod(int(ms)):
+            raise OSError(f"timeBeginPeriod({ms}) refused")
+        _timer_period = int(ms)
+
+def _attempt(notes: list, what: str, fn, *args):
+    try:
+        fn(*args)
+        notes.append(what)
+    except Exception as e:
+        notes.append(f"{what} refused ({e})")
+
+def tune_thread(settings: ExecSettings | None = None) -> list:
+    """Apply the thread-level settings to the calling thread; returns what happened."""
+    s = settings or exec_settings
+    notes = []
+    if s.cpu is not None:
+        _attempt(notes, f"cpu {s.cpu}", _pin_thread, {s.cpu})
+    if s.priority != "normal":
+        _attempt(notes, f"priority {s.priority}", _raise_thread_priority, s.priority)
+    if s.slack_us is not None:
+        _attempt(notes, f"slack {s.slack_us} µs", _set_timer_slack, s.slack_us)
+    if settings is None:
+        _tuned.gen = _tune_gen
+    return notes
+
+def tune_process(settings: ExecSettings) -> list:
+    """Make `settings` current: process-wide part now, playback threads on next play."""
+    global exec_settings, _tune_gen
+    exec_settings = settings
+    _tune_gen += 1
+    notes = []
+    if settings.timer_ms is not None:
+        _attempt(notes, f"timer {settings.timer_ms} ms", _set_timer_resolution, settings.timer_ms)
+        atexit.register(_set_timer_resolution, None)
+    if settings.priority != "normal" and sys.platform == "win32":
+        k = _kernel32()
+        _attempt(notes, f"process class {settings.priority}",
+                 lambda: _win_check(k.SetPriorityClass(k.GetCurrentProcess(),
+                                                       _WIN_PROCESS_CLASS[settings.priority])))
+    if settings.cpu is not None:
+        usable = (os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity")
+                  else set(range(os.cpu_count() or 1)))
+        if settings.cpu not in usable:
+            notes.append(f"cpu {settings.cpu} refused (usable: {sorted(usable)})")
+        elif len(usable) > 1:
+            _attempt(notes, f"main thread off cpu {settings.cpu}",
+                     _pin_thread, usable - {settings.cpu})
+    return notes
+
+def measure_jitter(settings: ExecSettings | None = None, frames: int = JITTER_FRAMES,
+                   label: str = "baseline") -> Jitter:
+    """Wake on `frames` consecutive frame deadlines under `settings`; lateness in µs."""
+    s = settings or ExecSettings()
+    out = {}
+    def run():
+        out["notes"] = tune_thread(s)
+        lates = []
+        start = time.perf_counter() + FRAME_S
+        for k in range(frames):
+            deadline = start + k * FRAME_S
+            _wait_until(deadline)
+            lates.append(time.perf_counter() - deadline)
+        out["lates"] = lates
+    notes = []
+    if s.timer_ms is not None:
+        _attempt(notes, f"timer {s.timer_ms} ms", _set_timer_resolution, s.timer_ms)
+    _cancel_flag.clear()
+    try:
+        t = threading.Thread(target=run, daemon=True)
+        t.start()
+        t.join()
+    finally:
+        if s.timer_ms is not None:
+            _attempt([], "restore timer", _set_timer_resolution, exec_settings.timer_ms)
+    lates = sorted(out["lates"])
+    return Jitter(label, sum(lates) / len(lates) * 1e6,
+                  lates[min(len(lates) - 1, int(len(lates) * 0.99))] * 1e6,
+                  lates[-1] * 1e6, notes + out["notes"])
+
+def jitter_report(settings: ExecSettings, frames: int = JITTER_FRAMES) -> list:
+    """Baseline, then each non-default setting alone, then all of them together."""
+    base = ExecSettings()
+    results = [measure_jitter(base, frames)]
+    changed = [f for f in ExecSettings._fields if getattr(settings, f) != getattr(base, f)]
+    for field in changed:
+        results.append(measure_jitter(base._replace(**{field: getattr(settings, field)}),
+                                      frames, f"{field}={getattr(settings, field)}"))
+    if len(changed) > 1:
+        results.append(measure_jitter(settings, frames, "all"))
+    return results
+
+def format_jitter(j: Jitter) -> str:
+    refused = [n for n in j.notes if "refused" in n]
+    return (f"{j.label:<20} mean {j.mean_us:8.1f} µs   p99 {j.p99_us:8.1f} µs"
+            f"   max {j.max_us:8.1f} µs" + (f"   [{'; '.join(refused)}]" if refused else ""))
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  RUN STATS  (every execution in a local SQLite database)
+# ══════════════════════════════════════════════════════════════════════════════
+# _run_combo() hands each finished run to RunStats.record(). That call only
+# puts a tuple on a queue. A writer thread owns the connection. It fills in
+# the hit count from the state feed and commits in batches, so the executor
+# never touches the disk. Queries open their own connection; WAL mode lets
+# them read while the writer appends.
+#
+#   runs(ts, char, slot, scale, status, frames, worst_ms, p99_ms, hits, lates)
+#     status  "ok" | "cancelled" | "error"
+#     hits    peak combo counter from the feed, or NULL without telemetry
+#     lates   per-frame lateness in ms, packed float32
+#
+# A run counts as a success when its hits match the most that combo has ever
+# landed (no feed = unknown). Percentiles are nearest-rank over per-run worst
+# lateness, computed in SQL with CUME_DIST().
+
+STATS_PATH     = os.path.join(os.path.dirname(os.path.abspath(__file__)), "run_stats.db")
+STATS_BATCH    = 64          # rows per transaction at most
+STATS_FLUSH_S  = 1.0         # ...and at least this often while rows are waiting
+HITS_SETTLE_S  = 0.5         # watch the combo counter this long after the last input
+HITS_POLL_S    = 0.01
+
+ComboStats = namedtuple("ComboStats", "char slot runs completed cancelled success_rate p99_ms worst_ms")
+TrendPoint = namedtuple("TrendPoint", "start runs success_rate p99_ms")
+
+_STATS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id       INTEGER PRIMARY KEY,
+    ts       REAL    NOT NULL,
+    char     TEXT    NOT NULL,
+    slot     TEXT    NOT NULL,
+    scale    REAL    NOT NULL,
+    status   TEXT    NOT NULL,
+    frames   INTEGER NOT NULL,
+    worst_ms REAL,
+    p99_ms   REAL,
+    hits     INTEGER,
+    lates    BLOB
+);
+CREATE INDEX IF NOT EXISTS runs_combo ON runs (char, slot, ts);
+CREATE INDEX IF NOT EXISTS runs_ts    ON runs (ts);
+"""
+
+# Per-run rows joined to that combo's best hit count, filtered by time.
+_STATS_RUNS = """
+WITH best AS (SELECT char, slot, MAX(hits) AS top FROM runs GROUP BY char, slot),
+r AS (
+    SELECT runs.*, CASE WHEN hits IS NULL OR top IS NULL THEN NULL
+                        ELSE hits >= top END AS success
+    FROM runs JOIN best USING (char, slot)
+    WHERE ts >= :since AND (:char IS NULL OR char = :char) AND (:slot IS NULL OR slot = :slot)
+)
+"""
+
+def _stats_connect(path: str):
+    import sqlite3
+    con = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.executescript(_STATS_SCHEMA)
+    return con
+
+class RunStats:
+    """Background-batched run log; record() never blocks the caller."""
+
+    def __init__(self, path: str = STATS_PATH):
+        self.path = path
+        self.queue = queue.SimpleQueue()
+        self.written = 0
+        self.error = None
+        self._thread = threading.Thread(target=self._writer, name="run-stats", daemon=True)
+        self._thread.start()
+
+    def record(self, char: str, slot: str, scale: float, status: str,
+               lates: list, feed: bool):
+        """Queue one run; lates in seconds. `feed`: watch the combo counter for its hits."""
+        self.queue.put((time.time(), char, slot, scale, status, lates,
+                        time.perf_counter() if feed else None))
+
+    def flush(self, timeout: float = 5.0):
+        """Block until everything queued so far is committed."""
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait(timeout)
+
+    def _writer(self):
+        try:
+            con = _stats_connect(self.path)
+        except Exception as e:
+            self.error = e
+            if log_cb: log_cb(f"✗ Run stats disabled: {e}")
+            return
+        batch, watching, waiters, due = [], [], [], None
+        while True:
+            now = time.perf_counter()
+            waits = ([due - now] if due is not None else []) + ([HITS_POLL_S] if watching else [])
+            try:
+                item = self.queue.get(timeout=max(0.0, min(waits)) if waits else None)
+            except queue.Empty:
+                item = None
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            elif item is not None:
+                row = self._row(*item)
+                if item[-1] is None:
+                    batch.append(row)
+                else:
+                    watching.append([item[-1] + HITS_SETTLE_S, row, None])
+            if watching:
+                # The counter stays up for as long as the combo does, so its
+                # peak until the last hit has settled is the run's hit count.
+                st, now = _feed_state(), time.perf_counter()
+                for w in watching:
+                    if st is not None:
+                        w[2] = max(w[2] or 0, st.combo)
+                    if now >= w[0]:
+                        batch.append(w[1][:8] + (w[2],) + w[1][9:])
+                watching = [w for w in watching if now < w[0]]
+            if batch and due is None:
+                due = time.perf_counter() + STATS_FLUSH_S
+            if batch and (time.perf_counter() >= due or len(batch) >= STATS_BATCH
+                          or (waiters and not watching)):
+                try:
+                    with con:
+                        con.executemany("INSERT INTO runs (ts, char, slot, scale, status, frames,"
+                                        " worst_ms, p99_ms, hits, lates)"
+                                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+                    self.written += len(batch)
+                except Exception as e:
+                    self.error = e
+                    if log_cb: log_cb(f"✗ Run stats write failed: {e}")
+                batch, due = [], None
+            if not batch and not watching:
+                for done in waiters:
+                    done.set()
+                waiters = []
+
+    @staticmethod
+    def _row(ts, char, slot, scale, status, lates, _watch_from):
+        ms = sorted(l * 1000 for l in lates)
+        return (ts, char, slot, scale, status, len(lates),
+                ms[-1] if ms else None,
+                ms[min(len(ms) - 1, int(len(ms) * 0.99))] if ms else None,
+                None, array.array("f", (l * 1000 for l in lates)).tobytes())
+
+run_stats = None             # RunStats, opened by main() unless --no-stats
+
+def combo_stats(path: str = STATS_PATH, char: str | None = None, slot: str | None = None,
+                since: float = 0.0) -> list:
+    """Per-combo aggregates over runs since `since` (epoch seconds) → [ComboStats]."""
+    con = _stats_connect(path)
+    try:
+        rows = con.execute(_STATS_RUNS + """
+            , ranked AS (SELECT *, CUME_DIST() OVER (PARTITION BY char, slot
+                                                     ORDER BY worst_ms) AS cd
+                         FROM r WHERE worst_ms IS NOT NULL)
+            SELECT r.char, r.slot, COUNT(*), SUM(status = 'ok'), SUM(status = 'cancelled'),
+                   AVG(success), p.p99, MAX(worst_ms)
+            FROM r LEFT JOIN (SELECT char, slot, MIN(worst_ms) AS p99 FROM ranked
+                              WHERE cd >= 0.99 GROUP BY char, slot) p USING (char, slot)
+            GROUP BY r.char, r.slot ORDER BY r.char, r.slot""",
+            {"since": since, "char": char, "slot": slot}).fetchall()
+    finally:
+        con.close()
+    return [ComboStats(*row) for row in rows]
+
+def lateness_trend(path: str = STATS_PATH, char: str | None = None, slot: str | None = None,
+                   bucket_s: float = 3600, since: float = 0.0) -> list:
+    """Runs, success rate and p99 worst lateness per time bucket → [TrendPoint]."""
+    con = _stats_connect(path)
+    try:
+        rows = con.execute(_STATS_RUNS + """
+            , b AS (SELECT CAST(ts / :bucket AS INTEGER) * :bucket AS start, success, worst_ms
+                    FROM r),
+            ranked AS (SELECT start, worst_ms, CUME_DIST() OVER (PARTITION BY start
+                                                                 ORDER BY worst_ms) AS cd
+                       FROM b WHERE worst_ms IS NOT NULL)
+            SELECT b.start, COUNT(*), AVG(success), p.p99
+            FROM b LEFT JOIN (SELECT start, MIN(worst_ms) AS p99 FROM ranked
+                              WHERE cd >= 0.99 GROUP BY start) p USING (start)
+            GROUP BY b.start ORDER BY b.start""",
+            {"since": since, "char": char, "slot": slot, "bucket": bucket_s}).fetchall()
+    finally:
+        con.close()
+    return [TrendPoint(*row) for row in rows]
+
+def format_stats(s: ComboStats) -> str:
+    rate = "   —" if s.success_rate is None else f"{s.success_rate * 100:3.0f}%"
+    p99  = "     —" if s.p99_ms is None else f"{s.p99_ms:6.2f}"
+    return (f"{s.char:9} {s.slot:8} {s.runs:5} runs  {s.completed:5} ok  {s.cancelled:4} cancelled"
+            f"  success {rate}  p99 {p99} ms  worst {s.worst_ms or 0:6.2f} ms")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  TRAINING MODE  (two pads: P1 combo vs scripted dummy on pad 2)
+# ══════════════════════════════════════════════════════════════════════════════
+# Both timelines are merged into one per-frame schedule, so the punish always
+# lands exactly `p1_frame` frames after the dummy's script starts. With
+# "guard", P1 holds down-back until the combo begins.
+
+TRAINING_SCENARIOS = {
+    "Block string (F1 vs guard)":  {"dummy": dummy_block,           "slot": "F1", "p1_frame": 0,  "guard": False},
+    "Wakeup reversal → Punish #1": {"dummy": dummy_wakeup_reversal, "slot": "F3", "p1_frame": 80, "guard": True},
+    "Jump-in → Punish #1":         {"dummy": dummy_jump_in,         "slot": "F3", "p1_frame": 44, "guard": True},
+}
+
+GUARD_STATE = (0, STICK_MIN, STICK_MIN, 0, 0)   # P1 down-back
+ARCHIVE_TRAINING = True   # record each training run as a session in ARCHIVE_PATH
+
+def build_training_schedule(name: str, char: str | None = None) -> list:
+    """Merge the current character's combo and the dummy script into one schedule."""
+    sc    = TRAINING_SCENARIOS[name]
+    combo = _find_combo(char or get_current_char(), sc["slot"])
+    p1    = [(sc["p1_frame"] + fr, st) for fr, st in get_timeline(combo["fn"])]
+    if sc["guard"]:
+        p1.insert(0, (0, GUARD_STATE))
+    dummy = get_timeline(sc["dummy"], side=-1, scale=1.0)
+    return merge_timelines((0, 0, p1), (1, 0, dummy))
+
+def _run_training(name: str, repeat: int):
+    global _executing
+    _cancel_flag.clear()
+    with combo_lock:
+        _executing = True
+        char = get_current_char()
+        if log_cb: log_cb(f"▶ [{char}] Training: {name} ×{repeat}")
+        own_archive = False
+        try:
+            schedule = build_training_schedule(name, char)
+            if ARCHIVE_TRAINING and archive is None:
+                start_archive(ARCHIVE_PATH)
+                own_archive = True
+            for i in range(repeat):
+                late = play_schedule(schedule, _pads)
+                if log_cb: log_cb(f"  run {i+1}/{repeat}  worst lateness {late*1000:.1f} ms")
+                _wait_until(time.perf_counter() + 1.0)   # let both sides reset
+            if log_cb: log_cb("✓ Training complete")
+        except InterruptedError:
+            if log_cb: log_cb("⊘ Cancelled")
+            _release_pads(_pads)
+        except Exception as e:
+            if log_cb: log_cb(f"✗ Error: {e}")
+        finally:
+            if own_archive:
+                session = archive.session
+                stop_archive()
+                if log_cb: log_cb(f"  session {session} → {ARCHIVE_PATH}")
+            _executing = False
+
+def run_training(name: str, repeat: int = 1):
+    if _executing:
+        return
+    if not init_dummy_pad():
+        if log_cb: log_cb("✗ Dummy pad unavailable — training needs a second ViGEm pad")
+        return
+    threading.Thread(target=_run_training, args=(name, repeat), daemon=True).start()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  PLAYLISTS  (several combos as one pre-scheduled timeline)
+# ══════════════════════════════════════════════════════════════════════════════
+# Entries are written "Char/slot@delay", comma separated — delay is in frames
+# before that entry starts (after the previous one's final neutral report):
+#   "Ken/F1@0, Ken/F4@40, Ryu/F5@60"
+# Every timeline is offset into one schedule, and each loop continues on the
+# same absolute clock, so gaps are exact to the frame instead of human-paced.
+
+PlaylistEntry = namedtuple("PlaylistEntry", "char slot delay")
+LoopStats     = namedtuple("LoopStats", "loop worst_ms mean_ms p99_ms drift_ms")
+
+def parse_playlist(text: str) -> list:
+    entries = []
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        spec, _, delay = part.partition("@")
+        char, _, slot = spec.rpartition("/")
+        entries.append(PlaylistEntry(char.strip() or get_current_char(), slot.strip(),
+                                     int(delay or 0)))
+    return entries
+
+def build_playlist(entries) -> tuple:
+    """(schedule, length in frames) for a list of PlaylistEntry."""
+    tracks, at = [], 0
+    for e in entries:
+        combo = _find_combo(e.char, e.slot) if e.char in ALL_COMBOS else None
+        if combo is None:
+            raise ValueError(f"no combo {e.char}/{e.slot}")
+        tl = get_timeline(combo["fn"], scale=combo_scale(e.char, e.slot))
+        at += e.delay
+        tracks.append((0, at, tl))
+        at += tl[-1][0] + 1
+    return merge_timelines(*tracks), at
+
+def play_playlist(entries, loops: int = 1, on_loop=None) -> list:
+    """Play `loops` back-to-back passes; returns a LoopStats per pass."""
+    schedule, length = build_playlist(entries)
+    start = time.perf_counter()
+    stats = []
+    for n in range(loops):
+        lates = []
+        play_schedule(schedule, _pads, start, n * length, lates)
+        drift = time.perf_counter() - (start + ((n + 1) * length - 1) * FRAME_S)
+        lates.sort()
+        s = LoopStats(n + 1, lates[-1] * 1000, sum(lates) / len(lates) * 1000,
+                      lates[min(len(lates) - 1, int(len(lates) * 0.99))] * 1000,
+                      drift * 1000)
+        stats.append(s)
+        if on_loop: on_loop(s)
+    return stats
+
+def _log_loop(s: LoopStats):
+    if log_cb:
+        log_cb(f"  loop {s.loop}: worst {s.worst_ms:.2f} ms  mean {s.mean_ms:.2f} ms"
+               f"  p99 {s.p99_ms:.2f} ms  drift {s.drift_ms:+.2f} ms")
+
+def _run_playlist(entries, loops: int):
+    global _executing
+    _cancel_flag.clear()
+    with combo_lock:
+        _executing = True
+        if log_cb: log_cb(f"▶ Playlist: {len(entries)} combos ×{loops}")
+        try:
+            stats = play_playlist(entries, loops, _log_loop)
+            worst = max(s.worst_ms for s in stats)
+            if log_cb: log_cb(f"✓ Playlist complete  (worst lateness {worst:.2f} ms)")
+        except InterruptedError:
+            if log_cb: log_cb("⊘ Cancelled")
+            _release_pads(_pads)
+        except Exception as e:
+            if log_cb: log_cb(f"✗ Error: {e}")
+        finally:
+            _executing = False
+
+def run_playlist(text: str, loops: int = 1):
+    if _executing:
+        return
+    try:
+        entries = parse_playlist(text)
+        build_playlist(entries)                  # compile (and validate) up front
+    except ValueError as e:
+        if log_cb: log_cb(f"✗ Playlist: {e}")
+        return
+    threading.Thread(target=_run_playlist, args=(entries, loops), daemon=True).start()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SESSION CAPTURE  (a real pad recorded straight into a timeline)
+# ══════════════════════════════════════════════════════════════════════════════
+# Capture polls an input source on its own thread at CAPTURE_HZ and keeps only
+# the polls where the (normalised) state changed, each stamped with
+# perf_counter, in arrays sized up front — nothing grows while it runs, so the
+# loop holds 1000 Hz. quantise() turns those changes into a timeline, which is
+# registered under a slot and saved to recordings.json:
+#   {char: {slot: {"label": str, "timeline": [[frame, buttons, lx, ly, lt, rt], ...]}}}
+#
+# A source only needs read() → raw (buttons, lx, ly, lt, rt), `done` and close():
+#   XInputSource    physical pad through xinput1_4.dll (Windows)
+#   KeyboardSource  keys mapped onto the pad through the keyboard module
+#   FileSource      replays a "t buttons lx ly lt rt" text file on the wall clock
+
+CAPTURE_HZ       = 1000
+CAPTURE_CAPACITY = 1 << 16        # state changes kept per capture
+AXIS_DEADZONE    = 16384          # stick past half-way counts as that direction
+TRIGGER_PRESS    = 64             # trigger travel that counts as HK / Parry held
+RECORDINGS_PATH  = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recordings.json")
+
+_CAPTURE_BITS = sorted(set(_BTN.values()))                 # buttons the bot can send
+_CAPTURE_MASK = sum(_CAPTURE_BITS)
+_DPAD         = ((0x0001, 0, 1), (0x0002, 0, -1), (0x0004, -1, 0), (0x0008, 1, 0))
+_AXIS         = (0, STICK_MAX, STICK_MIN)                  # indexed by -1 / 0 / +1
+_XINPUT_STATE = struct.Struct("<IHBBhhhh")                 # XINPUT_STATE
+
+recordings = {}
+
+def normalise_state(buttons: int, lx: int, ly: int, lt: int, rt: int) -> tuple:
+    """Raw report → the digital state the bot sends; the d-pad folds into the stick."""
+    dx = (lx > AXIS_DEADZONE) - (lx < -AXIS_DEADZONE)
+    dy = (ly > AXIS_DEADZONE) - (ly < -AXIS_DEADZONE)
+    for bit, x, y in _DPAD:
+        if buttons & bit:
+            dx, dy = dx or x, dy or y
+    return (buttons & _CAPTURE_MASK, _AXIS[dx], _AXIS[dy],
+            255 if lt >= TRIGGER_PRESS else 0, 255 if rt >= TRIGGER_PRESS else 0)
+
+class XInputSource:
+    """
+    Physical pad in XInput slot `index`. The bot's own ViGEm pad takes a slot
+    as well, so pick the controller's slot rather than assuming 0.
+    """
+
+    done = False
+
+    def __init__(self, index: int = 0):
+        import ctypes
+        self.index  = index
+        self._get   = ctypes.windll.xinput1_4.XInputGetState
+        self._buf   = ctypes.create_string_buffer(_XINPUT_STATE.size)
+        self._packet = None
+        self._last   = NEUTRAL_STATE
+
+    def read(self) -> tuple:
+        if self._get(self.index, self._buf):
+            raise OSError(f"no XInput controller in slot {self.index}")
+        packet, buttons, lt, rt, lx, ly, _rx, _ry = _XINPUT_STATE.unpack(self._buf.raw)
+        if packet != self._packet:              # unchanged packet → unchanged state
+            self._packet, self._last = packet, (buttons, lx, ly, lt, rt)
+        return self._last
+
+    def close(self):
+        pass
+
+KEYBOARD_MAP = {"w": "8", "s": "2", "a": "4", "d": "6",
+                "u": "LP", "i": "MP", "o": "HP", "j": "LK", "k": "MK", "l": "HK",
+                "space": "LT"}
+_KEY_AXES = {"4": (STICK_MIN, 0), "6": (STICK_MAX, 0), "8": (0, STICK_MAX), "2": (0, STICK_MIN)}
+
+class KeyboardSource:
+    """Keys read as a pad. Opposite directions cancel out (SOCD neutral)."""
+
+    done = False
+
+    def __init__(self, keymap: dict | None = None):
+        global keyboard
+        import keyboard
+        self.keys = list((keymap or KEYBOARD_MAP).items())
+
+    def read(self) -> tuple:
+        buttons = lx = ly = lt = rt = 0
+        for key, name in self.keys:
+            if not keyboard.is_pressed(key):
+                continue
+            if name == "HK":   rt = 255
+            elif name == "LT": lt = 255
+            elif name in _BTN: buttons |= _BTN[name]
+            else:
+                x, y = _KEY_AXES[name]
+                lx += x; ly += y
+        return (buttons, lx, ly, lt, rt)
+
+    def close(self):
+        pass
+
+class FileSource:
+    """
+    Stand-in for a pad: replays a capture file on the wall clock from the
+    first read(), then reports `done`. Lines are "t buttons lx ly lt rt",
+    t in seconds; Capture.save() writes the same format.
+    """
+
+    def __init__(self, path: str):
+        self.times, self.states = [], []
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip() and not line.startswith("#"):
+                    t, *state = line.split()
+                    self.times.append(float(t))
+                    self.states.append(tuple(int(v) for v in state))
+        self.done = not self.times
+        self._t0  = None
+        self._i   = -1
+
+    def read(self) -> tuple:
+        now = time.perf_counter()
+        if self._t0 is None:
+            self._t0 = now - self.times[0]
+        elapsed, times, i = now - self._t0, self.times, self._i
+        while i + 1 < len(times) and times[i + 1] <= elapsed:
+            i += 1
+        self._i = i
+        if i == len(times) - 1:
+            self.done = True
+        return self.states[i] if i >= 0 else NEUTRAL_STATE
+
+    def close(self):
+        pass
+
+def open_source(spec: str):
+    """"xinput[:N]", "keyboard" or "file:PATH" (a bare path also means a file)."""
+    kind, _, arg = spec.partition(":")
+    if kind == "xinput":
+        return XInputSource(int(arg or 0))
+    if kind == "keyboard":
+        return KeyboardSource()
+    return FileSource(arg if kind == "file" else spec)
+
+class Capture:
+    """Polls a source on its own thread; stop() returns the [(t, state)] changes."""
+
+    def __init__(self, source, hz: int = CAPTURE_HZ, capacity: int = CAPTURE_CAPACITY):
+        self.source   = source
+        self.period   = 1.0 / hz
+        self._t       = array.array("d", bytes(8 * capacity))
+        self._s       = array.array("i", bytes(4 * 5 * capacity))
+        self.count    = 0                 # changes kept
+        self.polls    = 0
+        self.overruns = 0                 # polls that started a full period late
+        self.dropped  = 0                 # changes past `capacity`
+        self.max_gap  = 0.0               # longest time between two polls
+        self.elapsed  = 0.0
+        self.error    = None
+        self._stop    = threading.Event()
+        self._thread  = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> list:
+        self._stop.set()
+        self._thread.join()
+        self.source.close()
+        return self.events()
+
+    def wait(self, seconds: float | None = None) -> bool:
+        """Block until the source runs out (or `seconds` pass); True if it did."""
+        self._thread.join(seconds)
+        return not self._thread.is_alive()
+
+    def _loop(self):
+        read, clock, sleep = self.source.read, time.perf_counter, time.sleep
+        ts, ss, cap, period = self._t, self._s, len(self._t), self.period
+        prev, n = None, 0
+        first = last = deadline = clock()
+        try:
+            while not self._stop.is_set() and not self.source.done:
+                state = normalise_state(*read())
+                now = clock()
+                if state != prev:
+                    if n < cap:
+                        ts[n] = now
+                        i = 5 * n
+                        ss[i], ss[i + 1], ss[i + 2], ss[i + 3], ss[i + 4] = state
+                        n += 1
+                        self.count = n
+                    else:
+                        self.dropped += 1
+                    prev = state
+                self.polls += 1
+                if now - last > self.max_gap:
+                    self.max_gap = now - last
+                last = now
+                deadline += period
+                if now > deadline:              # fell a whole period behind: resync
+                    self.overruns += 1
+                    deadline = now
+                    continue
+                rest = deadline - clock()
+                if rest > 0.0015:
+                    sleep(rest - 0.001)
+                while clock() < deadline:
+                    pass
+        except Exception as e:
+            self.error = e
+        self.elapsed = last - first
+
+    def events(self) -> list:
+        ss = self._s
+        return [(self._t[k], tuple(ss[5 * k:5 * k + 5])) for k in range(self.count)]
+
+    def rate(self) -> float:
+        """Achieved polls per second (valid once the loop has ended)."""
+        return self.polls / self.elapsed if self.elapsed else 0.0
+
+    def save(self, path: str):
+        """Write the raw changes in the format FileSource replays."""
+        events = self.events()
+        t0 = events[0][0] if events else 0.0
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write("# t buttons lx ly lt rt\n")
+            for t, state in events:
+                fh.write(f"{t - t0:.6f} {' '.join(map(str, state))}\n")
+
+def quantise(events) -> list:
+    """
+    [(t, state)] → [(frame, state)] from the first non-neutral state, ending
+    neutral. A change that lands in the frame of the previous one moves to the
+    next frame instead of replacing it, so a tap shorter than a frame still
+    reaches the game; later changes snap back to their own time.
+    """
+    tl, t0 = [], None
+    for t, state in events:
+        if t0 is None:
+            if state == NEUTRAL_STATE:
+                continue
+            t0 = t
+        if tl and state == tl[-1][1]:
+            continue
+        frame = round((t - t0) / FRAME_S)
+        if tl and frame <= tl[-1][0]:
+            frame = tl[-1][0] + 1
+        tl.append((frame, state))
+    if tl and tl[-1][1] != NEUTRAL_STATE:
+        tl.append((tl[-1][0] + 1, NEUTRAL_STATE))
+    return tl
+
+def timeline_fn(timeline: list):
+    """A combo function that reproduces `timeline` — compiles like any helper combo."""
+    def replay():
+        last = 0
+        for frame, (buttons, lx, ly, lt, rt) in timeline:
+            _sleep(f(frame - last))
+            last = frame
+            gamepad.reset()
+            for bit in _CAPTURE_BITS:
+                if buttons & bit:
+                    gamepad.press_button(button=bit)
+            gamepad.left_joystick(x_value=lx, y_value=ly)
+            gamepad.left_trigger(value=lt)
+            gamepad.right_trigger(value=rt)
+            gamepad.update()
+    return replay
+
+def register_recording(char: str, slot: str, timeline: list, label: str | None = None) -> dict:
+    """Put a recorded timeline in the registry under `slot`, replacing what was there."""
+    label = label or f"Recorded — {len(timeline)} inputs, {timeline[-1][0]} frames"
+    combo = _entry(timeline_fn(timeline), label, slot)
+    combo["recorded"] = True            # the packed library never overrides it
+    combos = ALL_COMBOS[char]
+    old = _find_combo(char, slot)
+    if old is None:
+        combos.append(combo)
+    else:
+        combos[combos.index(old)] = combo
+    _route_tables.pop(char, None)
+    recordings.setdefault(char, {})[slot] = {
+        "label": label, "timeline": [[frame, *state] for frame, state in timeline]}
+    return combo
+
+def load_recordings(path: str = RECORDINGS_PATH) -> int:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            saved = json.load(fh)
+    except (OSError, ValueError):
+        return 0
+    n = 0
+    for char, slots in saved.items():
+        if char not in ALL_COMBOS:
+            continue
+        for slot, rec in slots.items():
+            tl = [(r[0], tuple(r[1:])) for r in rec["timeline"]]
+            register_recording(char, slot, tl, rec["label"])
+            n += 1
+    return n
+
+def save_recordings(path: str = RECORDINGS_PATH):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(recordings, fh, indent=1, sort_keys=True)
+
+CAPTURE_SOURCE = os.environ.get("SF6_CAPTURE", "xinput:0")
+
+def finish_capture(cap: Capture, char: str, slot: str) -> list | None:
+    """Stop `cap`, register and save what it caught; logs a summary either way."""
+    events = cap.stop()
+    tl = quantise(events)
+    say = log_cb or print
+    if cap.error is not None:
+        say(f"✗ Capture: {cap.error}")
+    if not tl:
+        say("✗ Capture: no input recorded")
+        return None
+    register_recording(char, slot, tl)
+    save_recordings()
+    prewarm_async(char)
+    say(f"● [{char}] {slot} ← {len(tl)} inputs over {tl[-1][0]} frames"
+        f"  ({cap.polls} polls, {cap.rate():.0f} Hz, worst gap {cap.max_gap * 1000:.2f} ms,"
+        f" {cap.overruns} overruns, {cap.dropped} dropped)")
+    return tl
+
+def capture_session(char: str, slot: str, spec: str = CAPTURE_SOURCE,
+                    seconds: float | None = None, raw_path: str | None = None) -> list | None:
+    """Blocking capture for the CLI: until the source ends, `seconds` pass or Ctrl-C."""
+    cap = Capture(open_source(spec)).start()
+    print(f"● Capturing {char}/{slot} from {spec} — Ctrl-C to stop")
+    end = None if seconds is None else time.perf_counter() + seconds
+    try:
+        while not cap.wait(0.2) and (end is None or time.perf_counter() < end):
+            pass
+    except KeyboardInterrupt:
+        pass
+    tl = finish_capture(cap, char, slot)
+    if raw_path:
+        cap.save(raw_path)
+    return tl
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SCALE CALIBRATION  (learned FRAME_SCALE per combo and per character)
+# ══════════════════════════════════════════════════════════════════════════════
+# calibrate() binary-searches the smallest scale at which a trial passes
+# `trials` times in a row. The live trial fires the combo in training mode and
+# reads the combo counter from the state feed; SimulatedTrial stands in for
+# the game offline. Results go to learned_scales.json as
+#   {char: {slot: scale, "*": scale}}   — "*" = the character's slowest combo,
+# used for combos that were never calibrated. FRAME_SCALE remains the default.
+
+SCALES_PATH    = os.path.join(os.path.dirname(os.path.abspath(__file__)), "learned_scales.json")
+learned_scales = {}
+
+def load_scales(path: str = SCALES_PATH):
+    global learned_scales
+    try:
+        with open(path, encoding="utf-8") as fh:
+            learned_scales = json.load(fh)
+    except (OSError, ValueError):
+        learned_scales = {}
+
+def save_scales(path: str = SCALES_PATH):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(learned_scales, fh, indent=2, sort_keys=True)
+
+def combo_scale(char: str, slot: str) -> float:
+    learned = learned_scales.get(char)
+    if not learned:
+        return FRAME_SCALE
+    return learned.get(slot, learned.get("*", FRAME_SCALE))
+
+def store_scale(char: str, slot: str, scale: float):
+    learned = learned_scales.setdefault(char, {})
+    learned[slot] = scale
+    learned["*"]  = max(v for k, v in learned.items() if k != "*")
+
+def calibrate(trial, lo: float = 0.5, hi: float = 1.5, trials: int = 3,
+              step: float = 0.02, margin: float = 0.05) -> float | None:
+    """Smallest scale in [lo, hi] where `trial(scale)` passes `trials` times running."""
+    top = hi
+    def reliable(sc):
+        return all(trial(sc) for _ in range(trials))
+    if not reliable(hi):
+        return None
+    while hi - lo > step:
+        mid = round((lo + hi) / 2, 3)
+        if reliable(mid):
+            hi = mid
+        else:
+            lo = mid
+    return round(min(hi + margin, top), 2)
+
+class SimulatedTrial:
+    """Offline success signal: the combo drops below `threshold` (± timing noise)."""
+
+    def __init__(self, threshold: float, noise: float = 0.02, seed: int | None = None):
+        self.threshold = threshold
+        self.noise     = noise
+        self.rng       = random.Random(seed)
+        self.calls     = 0
+
+    def __call__(self, scale: float) -> bool:
+        self.calls += 1
+        return scale + self.rng.gauss(0.0, self.noise) >= self.threshold
+
+def _measure_hits(combo: dict, scale: float, settle: float = 0.6) -> int:
+    """Fire `combo` at `scale` and return the peak combo counter seen meanwhile."""
+    peak = 0
+    done = threading.Event()
+    def watch():
+        nonlocal peak
+        while not done.is_set():
+            st = _feed_state()
+            if st is not None and st.combo > peak:
+                peak = st.combo
+            time.sleep(0.002)
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+    try:
+        play_schedule(get_schedule(combo["fn"], scale), _pads)
+        _wait_until(time.perf_counter() + settle)
+    finally:
+        done.set()
+        watcher.join()
+    return peak
+
+def _run_calibration(char: str, slot: str, reset: float):
+    global _executing
+    _cancel_flag.clear()
+    with combo_lock:
+        _executing = True
+        combo = _find_combo(char, slot)
+        if log_cb: log_cb(f"⚙ [{char}] Calibrating {slot}…")
+        try:
+            target = _measure_hits(combo, 1.5)      # reference hit count at a safe scale
+            if target <= 0:
+                raise RuntimeError("no hits registered at 1.5x — is the dummy in range?")
+            def trial(scale):
+                _wait_until(time.perf_counter() + reset)
+                hits = _measure_hits(combo, scale)
+                if log_cb: log_cb(f"  {scale:.2f}x → {hits}/{target} hits")
+                return hits >= target
+            scale = calibrate(trial)
+            if scale is None:
+                raise RuntimeError("combo is unreliable even at 1.5x")
+            store_scale(char, slot, scale)
+            save_scales()
+            prewarm(char)
+            if log_cb: log_cb(f"✓ [{char}] {slot} learned scale {scale:.2f}x")
+        except InterruptedError:
+            if log_cb: log_cb("⊘ Calibration cancelled")
+            _release_pads(_pads)
+        except Exception as e:
+            if log_cb: log_cb(f"✗ Calibration failed: {e}")
+        finally:
+            _executing = False
+
+def run_calibration(slot: str, reset: float = 1.5):
+    """Calibrate `slot` of the current character against the live combo counter."""
+    if _executing:
+        return
+    if _feed_state() is None:
+        if log_cb: log_cb("✗ Calibration needs the telemetry bridge (start a battle first)")
+        return
+    threading.Thread(target=_run_calibration, args=(get_current_char(), slot, reset),
+                     daemon=True).start()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CONTROL SERVER  (headless mode — JSON lines over a local socket)
+# ══════════════════════════════════════════════════════════════════════════════
+# `--headless` skips the GUI (tkinter is never imported) and serves one JSON
+# object per line on a Unix socket, or on localhost TCP where AF_UNIX is
+# missing (Windows Python). Every request gets one JSON line back.
+#
+#   {"cmd": "fire", "char": "Ken", "slot": "F4"}            queue one combo
+#   {"cmd": "playlist", "items": [{"char": "Ken", "slot": "F1", "gap": 300},
+#                                 {"slot": "F4"}], "repeat": 2}
+#   {"cmd": "sequence", "items": [{"char": "Ken", "slot": "F1", "delay": 0},
+#                                 {"slot": "F4", "delay": 40}], "loops": 5}
+#                                            one compiled timeline (PLAYLISTS)
+#   {"cmd": "char", "char": "Ryu"}                           default character
+#   {"cmd": "cancel"}                                        stop + drop queue
+#   {"cmd": "stats"}
+#   {"cmd": "trace", "on": true} / {"cmd": "trace", "export": "run.json"}
+#
+# fire/playlist take "wait": true to reply only once the batch has played.
+# A single executor thread drains the queue, so queued batches run back to
+# back with no hotkey re-fire guard in between. "gap" is ms before an item.
+
+CONTROL_PATH = os.environ.get("SF6_CONTROL",
+                              os.path.join(tempfile.gettempdir(), "sf6_combo_bot.sock"))
+CONTROL_PORT = 47615
+
+class ComboDaemon:
+    """Queue + executor + stats behind the control socket."""
+
+    def __init__(self):
+        self.jobs    = queue.Queue()
+        self.history = deque(maxlen=64)        # recent {"char", "slot", "late_ms"}
+        self.stats   = {"fired": 0, "completed": 0, "cancelled": 0, "worst_late_ms": 0.0}
+        self._gen    = 0                       # bumped by cancel; older jobs are dropped
+        threading.Thread(target=self._execute, daemon=True).start()
+
+    def _items(self, req: dict) -> list:
+        items = req["items"] if req["cmd"] == "playlist" else [req]
+        out = []
+        for it in items:
+            char = it.get("char") or get_current_char()
+            if char not in ALL_COMBOS:
+                raise ValueError(f"unknown character {char!r}")
+            combo = _find_combo(char, it.get("slot", ""))
+            if combo is None:
+                raise ValueError(f"{char} has no slot {it.get('slot')!r}")
+            out.append((char, combo, float(it.get("gap", 0)) / 1000.0))
+        return out * max(1, int(req.get("repeat", 1)))
+
+    def submit(self, req: dict) -> dict:
+        job = {"items": self._items(req), "gen": self._gen,
+               "done": threading.Event(), "results": []}
+        self.jobs.put(job)
+        if not req.get("wait"):
+            return {"ok": True, "queued": len(job["items"]), "pending": self.jobs.qsize()}
+        job["done"].wait()
+        return {"ok": True, "results": job["results"]}
+
+    def submit_sequence(self, req: dict) -> dict:
+        """One compiled playlist ("items" with "delay" in frames), looped."""
+        entries = [PlaylistEntry(it.get("char") or get_current_char(), it["slot"],
+                                 int(it.get("delay", 0))) for it in req["items"]]
+        build_playlist(entries)                  # validate before queueing
+        job = {"sequence": (entries, max(1, int(req.get("loops", 1)))), "gen": self._gen,
+               "done": threading.Event(), "results": []}
+        self.jobs.put(job)
+        if not req.get("wait"):
+            return {"ok": True, "queued": len(entries), "pending": self.jobs.qsize()}
+        job["done"].wait()
+        return {"ok": True, "results": job["results"]}
+
+    def cancel(self) -> dict:
+        self._gen += 1
+        dropped = 0
+        while True:
+            try:
+                job = self.jobs.get_nowait()
+            except queue.Empty:
+                break
+            dropped += len(job["sequence"][0]) if "sequence" in job else len(job["items"])
+            job["done"].set()
+        cancel_combo()
+        return {"ok": True, "dropped": dropped}
+
+    def _execute(self):
+        while True:
+            job = self.jobs.get()
+            try:
+                if "sequence" in job:
+                    self._play_sequence(job)
+                else:
+                    self._play_items(job)
+            except Exception as e:              # one bad job must not stop the executor
+                if log_cb: log_cb(f"✗ Error: {e}")
+            finally:
+                job["done"].set()
+
+    def _play_items(self, job: dict):
+        for char, combo, gap in job["items"]:
+            if gap:
+                _cancel_flag.clear()           # clear before the gen check so a cancel can't slip between
+                if job["gen"] == self._gen:
+                    _cancel_flag.wait(gap)     # cancel() sets the flag and cuts the gap short
+            if job["gen"] != self._gen:
+                break
+            self.stats["fired"] += 1
+            late = _run_combo(combo, char)
+            rec = {"char": char, "slot": combo["slot"],
+                   "late_ms": None if late is None else round(late * 1000, 3)}
+            if late is None:
+                self.stats["cancelled"] += 1
+            else:
+                self.stats["completed"] += 1
+                self.stats["worst_late_ms"] = max(self.stats["worst_late_ms"], rec["late_ms"])
+            self.history.append(rec)
+            job["results"].append(rec)
+
+    def _play_sequence(self, job: dict):
+        global _executing
+        entries, loops = job["sequence"]
+        _cancel_flag.clear()
+        with combo_lock:
+            _executing = True
+            try:
+                if job["gen"] == self._gen:
+                    stats = play_playlist(entries, loops, _log_loop)
+                    job["results"] += [s._asdict() for s in stats]
+                    self.stats["completed"] += 1
+            except InterruptedError:
+                self.stats["cancelled"] += 1
+                _release_pads(_pads)
+            except Exception as e:
+                if log_cb: log_cb(f"✗ Error: {e}")
+                _release_pads(_pads)
+            finally:
+                _executing = False
+
+    def handle(self, req: dict) -> dict:
+        cmd = req.get("cmd")
+        if cmd in ("fire", "playlist"):
+            return self.submit(req)
+        if cmd == "sequence":
+            return self.submit_sequence(req)
+        if cmd == "cancel":
+            return self.cancel()
+        if cmd == "char":
+            set_character(req["char"], "◈ (control) →")
+            return {"ok": True, "char": req["char"]}
+        if cmd == "trace":
+            if "export" in req:
+                return {"ok": True, "events": export_trace(req["export"])}
+            (start_trace if req.get("on", True) else stop_trace)()
+            return {"ok": True, "tracing": trace_on}
+        if cmd == "stats":
+            return {"ok": True, "char": get_current_char(), "executing": _executing,
+                    "pending": self.jobs.qsize(), **self.stats,
+                    "recent": list(self.history)}
+        return {"ok": False, "error": f"unknown cmd {cmd!r}"}
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                reply = self.server.daemon_.handle(json.loads(line))
+            except Exception as e:          # bad JSON, missing keys, unknown slot…
+                reply = {"ok": False, "error": str(e)}
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+def control_server(daemon: ComboDaemon, path: str = CONTROL_PATH):
+    """Bind the control socket (Unix path, or 127.0.0.1:CONTROL_PORT without AF_UNIX)."""
+    if hasattr(socket, "AF_UNIX"):
+        if os.path.exists(path):
+            os.unlink(path)                 # stale socket from a previous run
+        server = socketserver.ThreadingUnixStreamServer(path, _ControlHandler)
+    else:
+        server = socketserver.ThreadingTCPServer(("127.0.0.1", CONTROL_PORT), _ControlHandler)
+    server.daemon_threads = True
+    server.daemon_ = daemon
+    return server
+
+def run_headless(path: str = CONTROL_PATH):
+    global log_cb
+    log_cb = print
+    if not init_gamepad():
+        print("✗ Gamepad init failed. Install ViGEmBus.")
+        return 1
+    mark_phase("gamepad (vgamepad)")
+    prewarm_async(get_current_char())
+    start_auto_detect()
+    server = control_server(ComboDaemon(), path)
+    mark_phase("control socket")
+    print(f"✓ Headless — control socket {server.server_address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if hasattr(socket, "AF_UNIX") and os.path.exists(path):
+            os.unlink(path)
+    return 0
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  GUI
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1239,16 +4542,93 @@ CHAR_COLORS = {
 }
 
 TYPE_LABELS = ["BnB", "BnB", "Punish", "Punish (OD)", "Super", "Advanced"]
+TABLE_ROWS  = 6                          # Treeview items; the rest of the list is virtual
+_INDEX_TOKEN = re.compile(r"[\w.+]+")
+
+def index_tokens(text: str) -> list:
+    """'cr.MK xx Hadouken' → cr.mk, cr, mk, xx, hadouken (notation whole and split)."""
+    out = []
+    for tok in _INDEX_TOKEN.findall(text.lower()):
+        out.append(tok)
+        parts = [p for p in re.split(r"[.+]", tok) if p]
+        if len(parts) > 1:
+            out.extend(parts)
+    return out
+
+class ComboIndex:
+    """
+    Token index over a table's rows: every token of a row's text (label,
+    notation, type and cost tags) maps to the rows containing it, and the
+    sorted token list turns a query word into a prefix range by bisection.
+    A query matches the rows that contain a prefix match for every word.
+    """
+
+    def __init__(self, docs: list):
+        postings = {}
+        for row, doc in enumerate(docs):
+            for tok in index_tokens(doc):
+                postings.setdefault(tok, set()).add(row)
+        self.size = len(docs)
+        self.postings = postings
+        self.keys = sorted(postings)
+
+    def prefix(self, word: str) -> set:
+        rows = set()
+        for i in range(bisect.bisect_left(self.keys, word), len(self.keys)):
+            key = self.keys[i]
+            if not key.startswith(word):
+                break
+            rows |= self.postings[key]
+        return rows
+
+    def search(self, query: str) -> list:
+        """Row numbers matching every word of `query`, in row order; all rows if empty."""
+        words = _INDEX_TOKEN.findall(query.lower())
+        if not words:
+            return list(range(self.size))
+        rows = None
+        for word in sorted(words, key=len, reverse=True):        # narrowest first
+            rows = self.prefix(word) if rows is None else rows & self.prefix(word)
+            if not rows:
+                break
+        return sorted(rows)
+
+class ComboApp:
+    """Window logic; make_app() mixes it onto tk.Tk once tkinter is imported."""
 
-class ComboApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("SF6 World Tour Combo Bot")
         self.configure(bg="#09090f")
         self.resizable(False, False)
-        self._active_row = None
+        self._active_row = None           # slot being played
+        self._sort = None                 # (column, descending) of the combo table
+        self._tables = {}                 # char → (row values, ComboIndex), built on first view
+        self._rows = []                   # current character's row values
+        self._index = ComboIndex([])
+        self._view = []                   # rows passing the filter, in display order
+        self._view_pos = {}               # slot → position in _view
+        self._top = 0                     # first _view position shown
+        self._shown = [None] * TABLE_ROWS # (values, tag) each Treeview item holds
+        self._selected = None             # selected slot, kept while it scrolls away
+        self._capture = None              # (Capture, char, slot) while recording
+        self.ratings = {}                 # filled in by _load_ratings()
         self._build_ui()
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+        threading.Thread(target=self._load_ratings, daemon=True).start()
+
+    def _load_ratings(self):
+        """Compile + rate the whole registry off the Tk thread, then redraw."""
+        start = time.perf_counter()
+        ratings = combo_ratings()
+        mark_phase("bg: combo ratings", since=start)
+        if ratings:
+            self.after(0, lambda: self._show_ratings(ratings))
+
+    def _show_ratings(self, ratings: dict):
+        self.ratings = ratings
+        self._tables.clear()
+        self._select_char(get_current_char())
 
     # ── Build UI ──────────────────────────────────────────────────────────────
 
@@ -1269,6 +4649,12 @@ class ComboApp(tk.Tk):
                  anchor="w", padx=10, pady=5)
         self._status_lbl.pack(fill="x", padx=20, pady=(10,0))
 
+        # Live game state from the REFramework telemetry bridge
+        self.state_var = tk.StringVar(value="")
+        tk.Label(self, textvariable=self.state_var,
+                 font=("Consolas",9), bg="#111118", fg="#4fc3f7",
+                 anchor="w", padx=10, pady=2).pack(fill="x", padx=20)
+
         # Divider
         tk.Frame(self, bg="#e8251a", height=2).pack(fill="x", padx=20, pady=8)
 
@@ -1286,7 +4672,7 @@ class ComboApp(tk.Tk):
                               bg="#1a1a28", fg="#888",
                               activebackground=col, activeforeground="#000",
                               relief="flat", padx=10, pady=4, cursor="hand2",
-                              command=lambda c=char: self._select_char(c))
+                              command=lambda c=char: set_character(c))
                 b.pack(side="left", padx=2)
                 self.char_buttons[char] = b
 
@@ -1304,6 +4690,16 @@ class ComboApp(tk.Tk):
                                  relief="flat", padx=12, pady=3, cursor="hand2",
                                  command=lambda: fire_advanced())
         self.adv_btn.pack(side="right", padx=(0,4))
+        self.match_var = tk.StringVar(value="")
+        tk.Label(char_row, textvariable=self.match_var, font=("Consolas",9),
+                 bg=BG, fg="#555").pack(side="right", padx=(0,12))
+        self.filter_var = tk.StringVar(value="")
+        tk.Entry(char_row, textvariable=self.filter_var, width=22,
+                 font=("Consolas",10), bg="#1a1a2e", fg="#f0f0f0",
+                 insertbackground="#f0f0f0", relief="flat").pack(side="right", padx=(0,6))
+        tk.Label(char_row, text="Filter:", font=("Consolas",10),
+                 bg=BG, fg="#666").pack(side="right", padx=(0,4))
+        self.filter_var.trace_add("write", lambda *_: self._apply_filter())
 
         # Combo table
         tf = tk.Frame(self, bg=BG); tf.pack(fill="both", padx=20, pady=(4,0))
@@ -1316,15 +4712,35 @@ class ComboApp(tk.Tk):
             font=("Consolas",10,"bold"), relief="flat")
         style.map("SF6.Treeview", background=[("selected","#2a1a2e")])
 
-        self.tree = ttk.Treeview(tf, columns=("slot","type","combo"),
-                                  show="headings", style="SF6.Treeview", height=5)
+        self.tree = ttk.Treeview(tf, columns=("slot","type","combo","dmg","drive","meter"),
+                                  show="headings", style="SF6.Treeview", height=TABLE_ROWS,
+                                  selectmode="browse")
         self.tree.heading("slot",  text="KEY")
         self.tree.heading("type",  text="TYPE")
         self.tree.heading("combo", text="COMBO ROUTE")
+        for col, text in (("dmg", "DMG"), ("drive", "DRIVE"), ("meter", "SA")):
+            self.tree.heading(col, text=text, command=lambda c=col: self._sort_rows(c))
         self.tree.column("slot",  width=55,  anchor="center")
         self.tree.column("type",  width=105, anchor="center")
         self.tree.column("combo", width=460, anchor="w")
-        self.tree.pack(fill="both")
+        self.tree.column("dmg",   width=55,  anchor="e")
+        self.tree.column("drive", width=50,  anchor="e")
+        self.tree.column("meter", width=50,  anchor="e")
+        for j in range(TABLE_ROWS):
+            self.tree.insert("", "end", iid=f"vis_{j}", values=("",) * 6, tags=("blank",))
+        self.tree.tag_configure("odd",    background="#0e0e1c", foreground="#c0c0c0")
+        self.tree.tag_configure("even",   background="#111118", foreground="#c0c0c0")
+        self.tree.tag_configure("active", background="#1a2a1a", foreground="#00ff88")
+        self.tree.tag_configure("blank",  background="#111118")
+        self.scrollbar = ttk.Scrollbar(tf, orient="vertical", command=self._scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", lambda e: self._scroll("scroll", -e.delta // 120, "units"))
+        self.tree.bind("<Button-4>",   lambda e: self._scroll("scroll", -1, "units"))
+        self.tree.bind("<Button-5>",   lambda e: self._scroll("scroll",  1, "units"))
+        self.tree.bind("<Up>",   lambda e: self._step_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._step_selection(1))
 
         # Notes panel
         note_frame = tk.Frame(self, bg="#0d0d1a"); note_frame.pack(fill="x", padx=20, pady=(4,0))
@@ -1346,6 +4762,66 @@ class ComboApp(tk.Tk):
                    command=self._update_scale).pack(side="left", padx=(6,16))
         tk.Label(sf, text="Raise if inputs drop. Lower for faster timing.",
                  font=("Consolas",9), bg=BG, fg="#333").pack(side="left")
+        self.auto_var = tk.BooleanVar(value=auto_detect)
+        tk.Checkbutton(sf, text="Auto-detect character", variable=self.auto_var,
+                       font=("Consolas",9), bg=BG, fg="#666", selectcolor="#1a1a2e",
+                       activebackground=BG, command=self._update_auto
+                       ).pack(side="right")
+
+        # Output latency (rolling flush cost and the lead applied to each report)
+        of = tk.Frame(self, bg=BG); of.pack(fill="x", padx=20, pady=(0,8))
+        tk.Label(of, text="Output:", font=("Consolas",10), bg=BG, fg="#666").pack(side="left")
+        self.lead_var = tk.StringVar(value="")
+        tk.Label(of, textvariable=self.lead_var, font=("Consolas",9),
+                 bg=BG, fg="#4fc3f7").pack(side="left", padx=(6,16))
+        self.lead_on_var = tk.BooleanVar(value=lead_enabled)
+        tk.Checkbutton(of, text="Send early by flush cost", variable=self.lead_on_var,
+                       font=("Consolas",9), bg=BG, fg="#666", selectcolor="#1a1a2e",
+                       activebackground=BG, command=self._update_lead
+                       ).pack(side="left")
+
+        # Training mode (second pad plays the dummy)
+        trf = tk.Frame(self, bg=BG); trf.pack(fill="x", padx=20, pady=(0,8))
+        tk.Label(trf, text="Training:", font=("Consolas",10), bg=BG, fg="#666").pack(side="left")
+        self.train_var = tk.StringVar(value=next(iter(TRAINING_SCENARIOS)))
+        ttk.Combobox(trf, textvariable=self.train_var, values=list(TRAINING_SCENARIOS),
+                     state="readonly", width=30, font=("Consolas",10)
+                     ).pack(side="left", padx=(6,8))
+        tk.Button(trf, text="▶ RUN vs DUMMY", font=("Consolas",9,"bold"),
+                  bg="#1a1a28", fg="#00e5a0",
+                  activebackground="#00e5a0", activeforeground="#000",
+                  relief="flat", padx=10, pady=2, cursor="hand2",
+                  command=lambda: run_training(self.train_var.get())).pack(side="left")
+        tk.Button(trf, text="⚙ CALIBRATE ROW", font=("Consolas",9,"bold"),
+                  bg="#1a1a28", fg="#ffcc02",
+                  activebackground="#ffcc02", activeforeground="#000",
+                  relief="flat", padx=10, pady=2, cursor="hand2",
+                  command=self._calibrate_selected).pack(side="left", padx=(8,0))
+        self.rec_btn = tk.Button(trf, text="● REC ROW", font=("Consolas",9,"bold"),
+                                 bg="#1a1a28", fg="#e8251a",
+                                 activebackground="#e8251a", activeforeground="#000",
+                                 relief="flat", padx=10, pady=2, cursor="hand2",
+                                 command=self._record_selected)
+        self.rec_btn.pack(side="left", padx=(8,0))
+
+        # Playlist (several combos, exact frame gaps, looped)
+        plf = tk.Frame(self, bg=BG); plf.pack(fill="x", padx=20, pady=(0,8))
+        tk.Label(plf, text="Playlist:", font=("Consolas",10), bg=BG, fg="#666").pack(side="left")
+        self.playlist_var = tk.StringVar(value="F1@0, F2@30, F4@30")
+        tk.Entry(plf, textvariable=self.playlist_var, width=34,
+                 font=("Consolas",10), bg="#1a1a2e", fg="#f0f0f0",
+                 insertbackground="#f0f0f0", relief="flat").pack(side="left", padx=(6,8))
+        tk.Label(plf, text="×", font=("Consolas",10), bg=BG, fg="#666").pack(side="left")
+        self.loops_var = tk.IntVar(value=1)
+        tk.Spinbox(plf, from_=1, to=999, textvariable=self.loops_var, width=4,
+                   font=("Consolas",10), bg="#1a1a2e", fg="#f0f0f0",
+                   buttonbackground="#333", relief="flat").pack(side="left", padx=(4,8))
+        tk.Button(plf, text="▶ PLAY LIST", font=("Consolas",9,"bold"),
+                  bg="#1a1a28", fg="#00e5a0",
+                  activebackground="#00e5a0", activeforeground="#000",
+                  relief="flat", padx=10, pady=2, cursor="hand2",
+                  command=lambda: run_playlist(self.playlist_var.get(), self.loops_var.get())
+                  ).pack(side="left")
 
         # Log
         lf = tk.Frame(self, bg=BG); lf.pack(fill="x", padx=20, pady=(0,16))
@@ -1357,6 +4833,7 @@ class ComboApp(tk.Tk):
 
         self._select_char(CHARACTER_ORDER[0])
         self._log("v4 ready. F1-F5: combos | F6/F7: character | F8: advanced | ESC: cancel")
+        self._poll_state()
 
     # ── Character selection ────────────────────────────────────────────────────
 
@@ -1373,34 +4850,128 @@ class ComboApp(tk.Tk):
         self.adv_btn.configure(bg="#2a1a3a", fg=col)
         self.notes_var.set(f"ℹ  {CHAR_NOTES.get(char, '')}")
 
-        for row in self.tree.get_children():
-            self.tree.delete(row)
+        if char not in self._tables:
+            self._tables[char] = self._build_table(char)
+        self._rows, self._index = self._tables[char]
+        self._active_row = None
+        self._selected = None
+        self._apply_filter()
 
+    def _build_table(self, char: str) -> tuple:
+        """Row values of `char`'s combo table plus the search index over them."""
+        rows, docs = [], []
         non_adv = [c for c in ALL_COMBOS[char] if c["slot"] != "ADV"]
         for i, combo in enumerate(non_adv):
-            tag = "odd" if i % 2 else "even"
-            self.tree.insert("", "end", iid=f"row_{i}",
-                             values=(combo["slot"], TYPE_LABELS[i], combo["label"]),
-                             tags=(tag,))
-
-        self.tree.tag_configure("odd",  background="#0e0e1c")
-        self.tree.tag_configure("even", background="#111118")
-        self._active_row = None
+            kind = ("Route" if "#" in combo["slot"] else
+                    "Recorded" if combo.get("recorded") else TYPE_LABELS[i])
+            r = self.ratings.get((char, combo["slot"]))
+            cols = (r.damage, r.drive, f"{100 * r.meter // SA_BAR}%") if r else ("—",) * 3
+            rows.append((combo["slot"], kind, combo["label"], *cols))
+            tags = [kind, combo["slot"]]
+            if r and r.drive:
+                tags.append("drive")
+            if r and r.meter:
+                tags.append("meter")
+            docs.append(" ".join(tags) + " " + combo["label"])
+        return rows, ComboIndex(docs)
+
+    # ── Virtual table ─────────────────────────────────────────────────────────
+    # The Treeview holds TABLE_ROWS fixed items; filtering, sorting and
+    # scrolling only move _view/_top and repaint the items whose contents
+    # changed, so the table costs the same for 6 rows or 600.
+
+    def _apply_filter(self):
+        self._view = self._index.search(self.filter_var.get())
+        self.match_var.set(f"{len(self._view)}/{len(self._rows)}")
+        if self._sort:
+            self._sort_rows(self._sort[0], toggle=False)
+        else:
+            self._reindex_view()
+
+    def _reindex_view(self):
+        self._view_pos = {self._rows[row][0]: pos for pos, row in enumerate(self._view)}
+        self._top = 0
+        if self._selected in self._view_pos:
+            self._top = max(0, self._view_pos[self._selected] - TABLE_ROWS + 1)
+        self._render()
+
+    def _sort_rows(self, col: str, toggle: bool = True):
+        """Order the combo table by a rating column; clicking again flips it."""
+        desc = self._sort != (col, True) if toggle else self._sort[1]
+        self._sort = (col, desc)
+        i = ("dmg", "drive", "meter").index(col) + 3
+        def key(row):
+            value = str(self._rows[row][i]).rstrip("%")
+            return int(value) if value.lstrip("-").isdigit() else -1
+        self._view.sort(key=key, reverse=desc)
+        self._reindex_view()
+
+    def _paint(self, j: int):
+        """Bring Treeview item j up to date with view position _top + j."""
+        pos = self._top + j
+        if pos < len(self._view):
+            values = self._rows[self._view[pos]]
+            tag = ("active" if values[0] == self._active_row else
+                   "odd" if pos % 2 else "even")
+        else:
+            values, tag = ("",) * 6, "blank"
+        if self._shown[j] != (values, tag):
+            self._shown[j] = (values, tag)
+            self.tree.item(f"vis_{j}", values=values, tags=(tag,))
+
+    def _render(self):
+        self._top = max(0, min(self._top, len(self._view) - TABLE_ROWS))
+        for j in range(TABLE_ROWS):
+            self._paint(j)
+        pos = self._view_pos.get(self._selected)
+        visible = pos is not None and self._top <= pos < self._top + TABLE_ROWS
+        want = (f"vis_{pos - self._top}",) if visible else ()
+        if self.tree.selection() != want:
+            self.tree.selection_set(want)
+        n = max(len(self._view), 1)
+        self.scrollbar.set(self._top / n, min(1.0, (self._top + TABLE_ROWS) / n))
+
+    def _scroll(self, action: str, amount, unit: str | None = None):
+        """Scrollbar command protocol: ("moveto", fraction) or ("scroll", n, units|pages)."""
+        if action == "moveto":
+            self._top = round(float(amount) * len(self._view))
+        else:
+            self._top += int(amount) * (TABLE_ROWS if unit == "pages" else 1)
+        self._render()
+
+    def _on_select(self, _event=None):
+        sel = self.tree.selection()
+        if sel:
+            pos = self._top + int(sel[0].split("_")[1])
+            if pos < len(self._view):
+                self._selected = self._rows[self._view[pos]][0]
+            else:
+                self._render()                    # a blank filler row: keep the old selection
+
+    def _step_selection(self, step: int):
+        """Arrow keys move the selection through the whole list, scrolling as needed."""
+        if not self._view:
+            return "break"
+        pos = self._view_pos.get(self._selected, -1 if step > 0 else len(self._view))
+        pos = max(0, min(pos + step, len(self._view) - 1))
+        self._selected = self._rows[self._view[pos]][0]
+        if pos < self._top:
+            self._top = pos
+        elif pos >= self._top + TABLE_ROWS:
+            self._top = pos - TABLE_ROWS + 1
+        self._render()
+        return "break"
+
+    def selected_slot(self) -> str:
+        return self._selected or "F1"
 
     def highlight_row(self, slot: str | None):
-        """Highlight the active combo row while executing."""
-        self._active_row = slot
-        non_adv = [c for c in ALL_COMBOS[get_current_char()] if c["slot"] != "ADV"]
-        for i, combo in enumerate(non_adv):
-            iid = f"row_{i}"
-            if combo["slot"] == slot:
-                self.tree.item(iid, tags=("active",))
-                self.tree.tag_configure("active", background="#1a2a1a", foreground="#00ff88")
-            else:
-                tag = "odd" if i % 2 else "even"
-                self.tree.item(iid, tags=(tag,))
-        self.tree.tag_configure("odd",  background="#0e0e1c", foreground="#c0c0c0")
-        self.tree.tag_configure("even", background="#111118", foreground="#c0c0c0")
+        """Highlight the active combo row while executing; repaints only the rows that changed."""
+        previous, self._active_row = self._active_row, slot
+        for s in {previous, slot} - {None}:
+            pos = self._view_pos.get(s)
+            if pos is not None and self._top <= pos < self._top + TABLE_ROWS:
+                self._paint(pos - self._top)
 
     # ── Settings & log ────────────────────────────────────────────────────────
 
@@ -1408,6 +4979,38 @@ class ComboApp(tk.Tk):
         global FRAME_SCALE
         FRAME_SCALE = self.scale_var.get()
         self._log(f"Frame scale → {FRAME_SCALE:.1f}x")
+        prewarm_async(get_current_char())
+
+    def _calibrate_selected(self):
+        run_calibration(self.selected_slot())
+
+    def _record_selected(self):
+        """First click starts capturing into the selected row's slot, second click saves."""
+        if self._capture is not None:
+            cap, char, slot = self._capture
+            self._capture = None
+            self.rec_btn.configure(text="● REC ROW")
+            if finish_capture(cap, char, slot):
+                self._tables.pop(char, None)
+                self._select_char(char)
+            return
+        slot = self.selected_slot()
+        try:
+            cap = Capture(open_source(CAPTURE_SOURCE)).start()
+        except Exception as e:
+            self._log(f"✗ Capture source {CAPTURE_SOURCE}: {e}")
+            return
+        self._capture = (cap, get_current_char(), slot)
+        self.rec_btn.configure(text="■ STOP REC")
+        self._log(f"● Recording {get_current_char()}/{slot} from {CAPTURE_SOURCE} — click again to save")
+
+    def _update_lead(self):
+        global lead_enabled
+        lead_enabled = self.lead_on_var.get()
+
+    def _update_auto(self):
+        global auto_detect
+        auto_detect = self.auto_var.get()
 
     def _log(self, msg: str):
         def _do():
@@ -1417,41 +5020,260 @@ class ComboApp(tk.Tk):
             self.log_text.config(state="disabled")
         self.after(0, _do)
 
+    def _poll_state(self):
+        if trace_on: trace(TR_TK_B)
+        st = state_feed.latest() if state_feed else None
+        if st is None:
+            text = "Telemetry: —  (start SF6 with the REFramework mod)"
+        elif not st.valid:
+            text = "Telemetry: not in a battle scene"
+        else:
+            text = (f"HP {st.hp}  Drive {st.drive}  SA Lv{st.super_lvl}  Combo x{st.combo}"
+                    f"  Hitstop {st.hitstop}  Act {st.act_id}:{st.act_frame}")
+        self.state_var.set(text)
+        self.lead_var.set(f"flush {flush_cost*1000:.3f} ms  ·  lead {current_lead()*1000:.3f} ms")
+        self.after(100, self._poll_state)
+        if trace_on: trace(TR_TK_E)
+
     def set_status(self, msg: str):
         self.after(0, lambda: self.status_var.set(f"● {msg}"))
 
     def _on_close(self):
         cancel_combo()
-        keyboard.unhook_all()
+        if keyboard:
+            keyboard.unhook_all()
         self.destroy()
         sys.exit(0)
 
+def make_app() -> ComboApp:
+    """Import tkinter and build the window."""
+    global tk, ttk
+    import tkinter as tk
+    from tkinter import ttk
+    mark_phase("import tkinter")
+    app = type("ComboApp", (ComboApp, tk.Tk), {})()
+    mark_phase("build GUI")
+    return app
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  ENTRY POINT
 # ══════════════════════════════════════════════════════════════════════════════
 
+# ── Startup profile ───────────────────────────────────────────────────────────
+# mark_phase() closes a phase; times are from _T0 (top of this module), so the
+# interpreter's own start-up isn't included. Background phases pass `since`.
+
+STARTUP_TARGET_MS = 200
+profile_startup   = False
+_phases = []            # (name, ms, end)
+
+def mark_phase(name: str, since: float | None = None):
+    now = time.perf_counter()
+    if since is None:
+        since = max((end for _n, _ms, end in _phases if not _n.startswith("bg:")), default=_T0)
+    _phases.append((name, (now - since) * 1000, now))
+    if profile_startup:
+        print(f"[startup] {name:<30} {(now - since) * 1000:7.1f} ms"
+              f"   t={(now - _T0) * 1000:7.1f} ms")
+
+def startup_report() -> list:
+    return [f"⏱ {name:<30} {ms:7.1f} ms  (t={(end - _T0) * 1000:.0f} ms)"
+            for name, ms, end in _phases]
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="SF6 World Tour Combo Bot")
+    ap.add_argument("--library", metavar="PATH",
+                    help="play combos from a packed timeline library when it matches")
+    ap.add_argument("--build-library", metavar="PATH",
+                    help="compile every combo into a timeline library and exit")
+    ap.add_argument("--export-lua", metavar="PATH", nargs="?", const=LUA_DATA_PATH,
+                    help="compile every combo into the REFramework mod's data module "
+                         "and exit (default: V5 REFRAMEWORK/sf6_combo_bot_data.lua)")
+    ap.add_argument("--profile-startup", action="store_true",
+                    help="print time spent in each startup phase")
+    ap.add_argument("--trace", metavar="PATH",
+                    help="record a Chrome trace of every combo, written to PATH on exit")
+    ap.add_argument("--playlist", metavar="LIST",
+                    help='play "Char/slot@delay_frames, ..." as one timeline and exit')
+    ap.add_argument("--loops", type=int, default=1, metavar="N",
+                    help="passes for --playlist (default 1)")
+    ap.add_argument("--headless", action="store_true",
+                    help="no GUI; take commands on the local control socket")
+    ap.add_argument("--socket", metavar="PATH", default=CONTROL_PATH,
+                    help=f"control socket for --headless (default {CONTROL_PATH})")
+    ap.add_argument("--search-routes", metavar="PATH",
+                    help="search frame data for the best routes per slot, write them "
+                         "as a timeline library and exit")
+    ap.add_argument("--top", type=int, default=3, metavar="N",
+                    help="routes kept per slot by --search-routes (default 3)")
+    ap.add_argument("--workers", type=int, default=None, metavar="N",
+                    help="search processes (default: one per core, 0 = in-process)")
+    ap.add_argument("--capture", metavar="CHAR/SLOT",
+                    help="record a pad session into a slot (saved to recordings.json) and exit")
+    ap.add_argument("--source", default=CAPTURE_SOURCE, metavar="SPEC",
+                    help=f'capture input: xinput[:N], keyboard or file:PATH (default {CAPTURE_SOURCE})')
+    ap.add_argument("--seconds", type=float, default=None, metavar="S",
+                    help="stop --capture after S seconds (default: Ctrl-C or end of file)")
+    ap.add_argument("--save-raw", metavar="PATH",
+                    help="also write the raw capture, replayable with --source file:PATH")
+    ap.add_argument("--cpu", type=int, default=None, metavar="N",
+                    help="pin playback threads to core N (the rest of the bot moves off it)")
+    ap.add_argument("--priority", choices=("normal", "high", "realtime"), default="normal",
+                    help="playback thread priority (realtime needs admin / CAP_SYS_NICE)")
+    ap.add_argument("--timer-res", type=int, default=None, metavar="MS",
+                    help="Windows timer resolution while running, e.g. 1")
+    ap.add_argument("--timer-slack", type=int, default=None, metavar="US",
+                    help="Linux timer slack for playback threads, e.g. 1")
+    ap.add_argument("--stats", metavar="CHAR[/SLOT]", nargs="?", const="",
+                    help="print success rate and lateness per combo from the run database"
+                         " (with CHAR/SLOT: hourly trend for that combo) and exit")
+    ap.add_argument("--stats-db", metavar="PATH", default=STATS_PATH,
+                    help="run database (default run_stats.db next to the script)")
+    ap.add_argument("--no-stats", action="store_true",
+                    help="don't record runs to the database")
+    ap.add_argument("--pad", choices=("vigem", "uinput"), default=PAD_BACKEND,
+                    help=f"virtual pad backend (default {PAD_BACKEND})")
+    ap.add_argument("--uinput", metavar="PATH", default=UINPUT_PATH,
+                    help="uinput device; a plain file records the event stream instead")
+    ap.add_argument("--bench-flush", type=int, nargs="?", const=600, metavar="FRAMES",
+                    help="time one pad flush per frame and print mean/p99/max, then exit")
+    ap.add_argument("--archive", metavar="PATH", default=None,
+                    help="record telemetry and every pad report for the whole run"
+                         " as one session in PATH (training runs are always archived)")
+    ap.add_argument("--no-archive", action="store_true",
+                    help="don't archive training runs")
+    ap.add_argument("--archive-info", metavar="PATH", nargs="?", const=ARCHIVE_PATH,
+                    help="print per-session length, record counts, telemetry gaps and"
+                         " mean hitstop for an archive and exit (needs NumPy)")
+    ap.add_argument("--measure-jitter", type=int, nargs="?", const=JITTER_FRAMES, metavar="FRAMES",
+                    help="print frame-wakeup jitter before/after each setting above and exit")
+    return ap.parse_args(argv)
+
 def main():
-    app = ComboApp()
+    global log_cb, char_cb, progress_cb, state_feed, combo_library, profile_startup, CAPTURE_SOURCE
+    global run_stats, PAD_BACKEND, UINPUT_PATH, ARCHIVE_PATH, ARCHIVE_TRAINING
+    args = parse_args()
+    PAD_BACKEND, UINPUT_PATH = args.pad, args.uinput
+    profile_startup = args.profile_startup
+    if args.trace:
+        start_trace()
+        atexit.register(lambda: print(f"Trace: {export_trace(args.trace)} events → {args.trace}"))
+    mark_phase("imports + registry")
+    if args.export_lua:                  # the combo definitions only, no recordings
+        n = export_lua(args.export_lua)
+        print(f"Wrote {n} combos → {args.export_lua}")
+        return
+    settings = ExecSettings(args.cpu, args.priority, args.timer_res, args.timer_slack)
+    if args.measure_jitter:
+        for result in jitter_report(settings, args.measure_jitter):
+            print(format_jitter(result))
+        return
+    if args.bench_flush:
+        if not init_gamepad():
+            sys.exit(1)
+        for fs in bench_flush(args.bench_flush):
+            print(f"{fs.what:<18} {fs.n:5} flushes   mean {fs.mean_us:7.1f} µs"
+                  f"   p99 {fs.p99_us:7.1f} µs   max {fs.max_us:7.1f} µs")
+        return
+    if args.archive_info:
+        if _numpy() is None:
+            sys.exit("--archive-info needs NumPy")
+        for a in summarise_archive(args.archive_info):
+            print(f"session {a.session:4}  {a.seconds:8.1f} s  {a.states:8} states"
+                  f"  {a.reports:8} reports  {a.gaps:5} gaps  hitstop {a.hitstop_mean:5.2f}")
+        return
+    if args.stats is not None:
+        char, _, slot = args.stats.partition("/")
+        if slot:
+            for p in lateness_trend(args.stats_db, char, slot):
+                rate = "—" if p.success_rate is None else f"{p.success_rate * 100:.0f}%"
+                print(f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(p.start))}"
+                      f"  {p.runs:5} runs  success {rate:>4}  p99 {p.p99_ms or 0:6.2f} ms")
+        else:
+            for row in combo_stats(args.stats_db, char or None):
+                print(format_stats(row))
+        return
+    load_scales()
+    load_recordings()
+    CAPTURE_SOURCE = args.source
+    if args.build_library:
+        n = build_library(args.build_library)
+        print(f"Wrote {n} timelines → {args.build_library}")
+        return
+    if args.search_routes:
+        found = search_routes(top_n=args.top, workers=args.workers)
+        for (char, slot), routes in found.items():
+            for rank, route in enumerate(routes, 1):
+                print(f"{char:9} {slot}#{rank}  {route.damage:5}  {route_label(route)}")
+        entries = compile_routes(found)
+        write_library(args.search_routes, entries)
+        print(f"Wrote {len(entries)} routes → {args.search_routes}")
+        return
+    if args.capture:
+        char, _, slot = args.capture.rpartition("/")
+        char = char or get_current_char()
+        if char not in ALL_COMBOS:
+            sys.exit(f"unknown character {char!r}")
+        sys.exit(0 if capture_session(char, slot, args.source, args.seconds, args.save_raw) else 1)
+    if args.library:
+        combo_library = TimelineLibrary(args.library)
+    state_feed = TelemetryReader()
+    mark_phase("scales + library + telemetry")
+    ARCHIVE_TRAINING = not args.no_archive
+    if args.archive:
+        ARCHIVE_PATH = args.archive
+        start_archive(args.archive)
+        atexit.register(stop_archive)
+    if not args.no_stats:
+        run_stats = RunStats(args.stats_db)
+        atexit.register(run_stats.flush)
+    if settings != ExecSettings():
+        notes = tune_process(settings)
+        if notes:
+            print("Executor: " + "; ".join(notes))
+    if args.headless:
+        sys.exit(run_headless(args.socket))
+    if args.playlist:
+        log_cb = print
+        if not init_gamepad():
+            sys.exit(1)
+        _run_playlist(parse_playlist(args.playlist), args.loops)
+        return
 
-    global log_cb, char_cb, progress_cb
+    # Hotkeys first: the window and every compile come after they're live.
+    pad_ok = init_gamepad()
+    mark_phase("gamepad (vgamepad)")
+    if pad_ok:
+        register_hotkeys()
+        mark_phase("hotkeys (keyboard)")
+        if profile_startup:
+            print(f"[startup] first hotkey live at {(time.perf_counter() - _T0) * 1000:.1f} ms"
+                  f" (target {STARTUP_TARGET_MS} ms)")
+        prewarm_async(get_current_char())
+        start_auto_detect()
+
+    app = make_app()
     log_cb      = app._log
     char_cb     = lambda char: app.after(0, lambda: app._select_char(char))
     progress_cb = lambda slot: app.after(0, lambda: app.highlight_row(slot))
 
-    if init_gamepad():
+    if pad_ok:
         n = len(CHARACTER_ORDER)
         app.set_status(f"Gamepad OK — {n} characters loaded — F1-F5: combo | F6/F7: char | F8: advanced | ESC: cancel")
         app._log(f"✓ Virtual Xbox 360 gamepad ready. {n} characters, {n*6} combos loaded.")
         app._log("✓ Hotkeys: F1-F5 combos, F6 next, F7 prev, F8 advanced, ESC cancel.")
-        register_hotkeys()
+        if combo_library:
+            app._log(f"✓ Timeline library: {len(combo_library)} entries ({combo_library.path})")
     else:
         app.set_status("ERROR: ViGEmBus not found — install driver first")
         app._log("✗ Gamepad init failed. Install ViGEmBus:")
         app._log("  https://github.com/ViGEm/ViGEmBus/releases")
+    if profile_startup:
+        for line in startup_report():
+            app._log(line)
 
     app.mainloop()
 
-
 if __name__ == "__main__":
     main()